@@ -0,0 +1,74 @@
+"""
+Allocation profile of merge.
+
+    python -m benchmarks.allocations
+
+Reports, via tracemalloc:
+  * the memory retained by a warm token cache for the modifier-heavy corpus, and
+  * the peak bytes allocated during one merge call once caches are warm, and how
+    much of that is still alive afterwards (the result string). The result cache is
+    disabled so every call runs the resolver.
+"""
+import gc
+import sys
+import tracemalloc
+from typing import List, Optional, Tuple
+
+from tailwind_merge import TailwindMerge
+
+from . import corpora
+
+
+def token_cache_footprint() -> int:
+    """Bytes retained after classifying every distinct token of the modifier-heavy corpus."""
+    calls = corpora.modifier_heavy()
+    gc.collect()
+    tracemalloc.start()
+    twm = TailwindMerge(cache_size=None, token_cache_size=1 << 20)
+    for args in calls:
+        twm.merge(*args)
+    del args
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained
+
+
+def per_call_allocations(calls) -> Tuple[float, float]:
+    """
+    Average transient peak (bytes above the starting point) and retained bytes of one
+    merge call with warm caches.
+    """
+    twm = TailwindMerge(cache_size=None, token_cache_size=1 << 20)
+    for args in calls:
+        twm.merge(*args)
+    gc.collect()
+    peak_total = 0
+    retained_total = 0
+    tracemalloc.start()
+    for args in calls:
+        tracemalloc.clear_traces()
+        result = twm.merge(*args)
+        current, peak = tracemalloc.get_traced_memory()
+        peak_total += peak
+        retained_total += current
+        del result
+    tracemalloc.stop()
+    return peak_total / len(calls), retained_total / len(calls)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    print(f"token cache footprint (modifier_heavy): {token_cache_footprint() / 1024:,.1f} KiB")
+    print(f"{'corpus':<20}{'peak bytes/call':>16}{'retained/call':>15}")
+    for name, calls in (
+        ('short_components', corpora.short_components()),
+        ('modifier_heavy', corpora.modifier_heavy()),
+        ('long_generated', corpora.long_generated()),
+    ):
+        peak, retained = per_call_allocations(calls)
+        print(f"{name:<20}{peak:>16,.1f}{retained:>15,.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
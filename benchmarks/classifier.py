@@ -0,0 +1,89 @@
+"""
+Class lookup: the generated classifier modules against the interpreted lookup.
+
+    python -m benchmarks.classifier [--min-time 0.5]
+
+For every distinct (already parsed) token of a corpus, reports tokens/sec for the
+group lookup of the default rules and of the full Tailwind v3 ruleset, once with the
+interpreted `_get_group` and once with a classifier generated by `tailwind_merge.codegen`
+(the built-in one for the default rules, and one compiled into a temporary module for
+v3). The last columns are full classification (`_classify`, every cache off) with each.
+Neither ruleset uses a generated classifier unless `use_classifier` is called.
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+from typing import List, Optional
+
+from tailwind_merge import TailwindMerge, _classifier, codegen
+from tailwind_merge.tokenizer import parse_class
+
+from . import corpora
+from .tokenizer import tokens_per_second
+
+
+def _import_generated(merger: TailwindMerge, directory: str, name: str):
+    path = os.path.join(directory, f'{name}.py')
+    codegen.write(merger, path)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.classifier')
+    parser.add_argument('--min-time', type=float, default=0.5, help='seconds to run each measurement')
+    args = parser.parse_args(argv)
+
+    default = TailwindMerge(cache_size=None, token_cache_size=None)
+    v3 = TailwindMerge(cache_size=None, token_cache_size=None, version=3)
+    with tempfile.TemporaryDirectory() as directory:
+        v3_classifier = _import_generated(v3, directory, 'twm_v3_classifier').get_group
+
+    print(
+        f"{'corpus':<18}{'tokens':>7}{'rules':>8}{'lookup/s':>12}{'generated/s':>13}"
+        f"{'speedup':>9}{'classify/s':>12}{'generated/s':>13}{'speedup':>9}"
+    )
+    for name, calls in (
+        ('short_components', corpora.short_components()),
+        ('modifier_heavy', corpora.modifier_heavy()),
+        ('arbitrary_heavy', corpora.arbitrary_heavy()),
+    ):
+        tokens = list(dict.fromkeys(token for call in calls for token in ' '.join(call).split()))
+        parsed = {token: parse_class(token) for token in tokens}
+        for rules_name, merger, classifier in (
+            ('default', default, _classifier.get_group),
+            ('v3', v3, v3_classifier),
+        ):
+            rules = merger._rules
+            if rules.data is not None:
+                codegen._mappings(merger)  # load every section up front, as the classifier has
+
+            def lookup(token: str) -> object:
+                parsed_class = parsed[token]
+                return merger._get_group(token[len(parsed_class.modifiers):], rules, parsed_class)
+
+            def generated_lookup(token: str) -> object:
+                parsed_class = parsed[token]
+                return classifier(parsed_class.base, parsed_class.postfix, parsed_class.arbitrary)
+
+            classify = lambda token: merger._classify(token, rules)  # noqa: E731
+            interpreted = tokens_per_second(lookup, tokens, args.min_time)
+            generated = tokens_per_second(generated_lookup, tokens, args.min_time)
+            rules.classifier = None
+            classified = tokens_per_second(classify, tokens, args.min_time)
+            rules.classifier = classifier
+            generated_classified = tokens_per_second(classify, tokens, args.min_time)
+            print(
+                f"{name:<18}{len(tokens):>7}{rules_name:>8}{interpreted:>12,.0f}{generated:>13,.0f}"
+                f"{generated / interpreted:>8.2f}x{classified:>12,.0f}{generated_classified:>13,.0f}"
+                f"{generated_classified / classified:>8.2f}x"
+            )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
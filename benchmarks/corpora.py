@@ -0,0 +1,204 @@
+"""
+Deterministic corpora for the benchmark suite.
+
+Each corpus is a list of `merge` argument tuples generated from a fixed seed, so
+runs on the same interpreter are comparable with the stored baseline.
+"""
+import random
+from typing import Any, Dict, List, Tuple
+
+SEED = 20240501
+
+COLORS = ['red', 'blue', 'green', 'gray', 'slate', 'indigo', 'amber', 'emerald']
+SHADES = ['50', '100', '200', '300', '400', '500', '600', '700', '800', '900']
+SPACING = ['0', '0.5', '1', '2', '3', '4', '6', '8', '10', '12', '16', 'px', 'auto']
+MODIFIERS = [
+    'hover', 'focus', 'active', 'disabled', 'dark', 'sm', 'md', 'lg', 'xl',
+    'group-hover', 'focus-visible', 'first', 'last', 'odd',
+]
+
+STATIC_UTILITIES = [
+    'flex', 'inline-flex', 'block', 'hidden', 'grid', 'items-center', 'items-start',
+    'justify-between', 'justify-center', 'relative', 'absolute', 'rounded', 'rounded-md',
+    'rounded-lg', 'border', 'border-2', 'shadow', 'shadow-lg', 'font-medium', 'font-bold',
+    'text-sm', 'text-lg', 'text-left', 'text-center', 'truncate', 'uppercase', 'italic',
+    'overflow-hidden', 'cursor-pointer', 'select-none', 'transition', 'duration-150',
+    'ease-in-out', 'whitespace-nowrap', 'underline', 'grow', 'shrink-0', 'flex-col',
+]
+
+SPACING_PREFIXES = ['p', 'px', 'py', 'pt', 'pb', 'pl', 'pr', 'm', 'mx', 'my', 'mt', 'mb',
+                    'gap', 'gap-x', 'w', 'h', 'min-w', 'max-w', 'top', 'left', 'inset']
+COLOR_PREFIXES = ['bg', 'text', 'border', 'placeholder']
+
+ARBITRARY_VALUES = {
+    'p': ['3px', '0.35rem', 'calc(1rem+2px)'],
+    'w': ['calc(100%-2rem)', '37px', '42ch', 'var(--sidebar)'],
+    'h': ['100dvh', '3.25rem'],
+    'bg': ['#0f172a', '#fff', 'rgb(1,2,3)', "url('/img/hero.png')"],
+    'text': ['#ff0000', '14px', '1.1rem'],
+    'top': ['var(--header)', '117px'],
+    'grid-cols': ['1fr_auto', 'repeat(3,minmax(0,1fr))'],
+    'rounded': ['10px', '0.4rem'],
+}
+
+
+def _utility(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.4:
+        return rng.choice(STATIC_UTILITIES)
+    if roll < 0.75:
+        return f"{rng.choice(SPACING_PREFIXES)}-{rng.choice(SPACING)}"
+    return f"{rng.choice(COLOR_PREFIXES)}-{rng.choice(COLORS)}-{rng.choice(SHADES)}"
+
+
+def _modified(rng: random.Random, utility: str, depth: int) -> str:
+    return ''.join(f"{m}:" for m in rng.sample(MODIFIERS, depth)) + utility
+
+
+def _arbitrary(rng: random.Random) -> str:
+    prefix = rng.choice(sorted(ARBITRARY_VALUES))
+    return f"{prefix}-[{rng.choice(ARBITRARY_VALUES[prefix])}]"
+
+
+def short_components(count: int = 2000) -> List[Tuple[str, ...]]:
+    """Typical component calls: a short base string plus one or two overrides."""
+    rng = random.Random(SEED)
+    calls = []
+    for _ in range(count):
+        base = ' '.join(_utility(rng) for _ in range(rng.randint(4, 10)))
+        overrides = tuple(
+            ' '.join(_utility(rng) for _ in range(rng.randint(1, 3)))
+            for _ in range(rng.randint(1, 2))
+        )
+        calls.append((base,) + overrides)
+    return calls
+
+
+def repeated(calls: List[Tuple[str, ...]], times: int) -> List[Tuple[str, ...]]:
+    """`calls` repeated `times` times in shuffled order, as a hot server would see them."""
+    rng = random.Random(SEED + 6)
+    result = calls * times
+    rng.shuffle(result)
+    return result
+
+
+def long_generated(count: int = 100, length: int = 400) -> List[Tuple[str, ...]]:
+    """Generated component-library output: a few hundred tokens per call."""
+    rng = random.Random(SEED + 1)
+    calls = []
+    for _ in range(count):
+        tokens = []
+        for _ in range(length):
+            utility = _utility(rng)
+            tokens.append(_modified(rng, utility, 1) if rng.random() < 0.2 else utility)
+        calls.append((' '.join(tokens[:length // 2]), ' '.join(tokens[length // 2:])))
+    return calls
+
+
+def modifier_heavy(count: int = 2000) -> List[Tuple[str, ...]]:
+    """Responsive/state variants stacked one to three deep on most tokens."""
+    rng = random.Random(SEED + 2)
+    calls = []
+    for _ in range(count):
+        tokens = [
+            _modified(rng, _utility(rng), rng.randint(0, 3))
+            for _ in range(rng.randint(6, 16))
+        ]
+        calls.append((' '.join(tokens[:4]), ' '.join(tokens[4:])))
+    return calls
+
+
+def arbitrary_heavy(count: int = 2000) -> List[Tuple[str, ...]]:
+    """Mostly arbitrary values such as `w-[calc(100%-2rem)]` and `bg-[#0f172a]`."""
+    rng = random.Random(SEED + 3)
+    calls = []
+    for _ in range(count):
+        tokens = [
+            _arbitrary(rng) if rng.random() < 0.7 else _utility(rng)
+            for _ in range(rng.randint(4, 12))
+        ]
+        calls.append((' '.join(tokens),))
+    return calls
+
+
+def custom_rules(rule_count: int = 150) -> List[Tuple[str, List[str]]]:
+    """`add_rule` arguments for a design system with many project-specific utilities."""
+    rng = random.Random(SEED + 4)
+    rules = []
+    for i in range(rule_count):
+        if rng.random() < 0.5:
+            rules.append((f"ds_{i}", [f"ds{i}-"]))
+        else:
+            rules.append((f"ds_{i}", [f"ds{i}-{size}" for size in ('sm', 'md', 'lg', 'xl')]))
+    return rules
+
+
+def custom_rule_heavy(count: int = 2000, rule_count: int = 150) -> List[Tuple[str, ...]]:
+    """Calls mixing the classes from `custom_rules` with regular utilities."""
+    rng = random.Random(SEED + 5)
+    calls = []
+    for _ in range(count):
+        tokens = []
+        for _ in range(rng.randint(4, 12)):
+            if rng.random() < 0.6:
+                tokens.append(f"ds{rng.randrange(rule_count)}-{rng.choice(('sm', 'md', 'lg', 'xl'))}")
+            else:
+                tokens.append(_utility(rng))
+        calls.append((' '.join(tokens),))
+    return calls
+
+
+def conditional_components(count: int = 200, times: int = 10) -> List[Tuple[Any, ...]]:
+    """
+    clsx-style `cn` calls from `count` component call sites, each rendered `times` times
+    with random conditions: a base string, a {class: condition} mapping and an optional
+    nested list of extras.
+    """
+    rng = random.Random(SEED + 7)
+    sites = []
+    for _ in range(count):
+        base = ' '.join(_utility(rng) for _ in range(rng.randint(4, 8)))
+        conditional = [_utility(rng) for _ in range(rng.randint(2, 4))]
+        extras = [_utility(rng) for _ in range(rng.randint(0, 2))]
+        sites.append((base, conditional, extras))
+    calls = []
+    for _ in range(times):
+        for base, conditional, extras in sites:
+            calls.append((
+                base,
+                {class_name: rng.random() < 0.5 for class_name in conditional},
+                [extra if rng.random() < 0.5 else None for extra in extras],
+            ))
+    rng.shuffle(calls)
+    return calls
+
+
+def variant_axes() -> Dict[str, Dict[str, str]]:
+    """A button's variant axes (size x intent x state) for `TailwindMerge.variants`."""
+    return {
+        'size': {
+            'xs': 'px-2 py-1 text-xs', 'sm': 'px-3 py-1.5 text-sm', 'md': 'px-4 py-2',
+            'lg': 'px-6 py-3 text-lg', 'xl': 'px-8 py-4 text-xl',
+        },
+        'intent': {
+            'primary': 'bg-blue-500 text-white hover:bg-blue-600',
+            'secondary': 'bg-gray-100 text-gray-900 hover:bg-gray-200',
+            'danger': 'bg-red-500 text-white hover:bg-red-600',
+            'ghost': 'bg-transparent hover:bg-gray-100',
+        },
+        'state': {
+            'disabled': 'opacity-50 cursor-not-allowed hover:bg-gray-100',
+            'loading': 'cursor-wait opacity-75',
+        },
+    }
+
+
+def variant_selections(count: int = 2000) -> List[Tuple[str, str, str]]:
+    """Random (size, intent, state) selections of `variant_axes`; state may be None."""
+    rng = random.Random(SEED + 8)
+    axes = variant_axes()
+    return [
+        (rng.choice(sorted(axes['size'])), rng.choice(sorted(axes['intent'])),
+         rng.choice(sorted(axes['state']) + [None, None]))
+        for _ in range(count)
+    ]
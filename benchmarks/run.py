@@ -0,0 +1,241 @@
+"""
+Benchmark suite for TailwindMerge.
+
+Run from the repository root:
+
+    python -m benchmarks.run                  # run and compare against benchmarks/baseline.json
+    python -m benchmarks.run --save           # run and overwrite the baseline
+    python -m benchmarks.run --only long_generated --only add_rule
+
+Every case reports throughput (ops/sec), per-call latency percentiles and the peak
+memory allocated while running it (via tracemalloc). When a baseline is present, a
+case whose throughput drops, or whose peak memory grows, by more than `--threshold`
+is reported as a regression and the run exits with status 1.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from tailwind_merge import TailwindMerge
+
+from . import corpora
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+class Case(NamedTuple):
+    name: str
+    # Returns the function under test and the argument tuples to call it with.
+    # Called once per round, so every round starts from a fresh instance.
+    prepare: Callable[[], Tuple[Callable[..., Any], Sequence[Tuple[Any, ...]]]]
+    # Run the calls once, untimed, before measuring (warms the token cache)
+    warmup: bool = True
+
+
+def _merge_case(name: str, calls: List[Tuple[str, ...]], **options: Any) -> Case:
+    def prepare():
+        return TailwindMerge(**options).merge, calls
+    return Case(name, prepare)
+
+
+def _cn_case() -> Case:
+    calls = corpora.conditional_components()
+
+    def prepare():
+        return TailwindMerge().cn, calls
+    return Case('conditional_cn', prepare)
+
+
+def _variants_case() -> Case:
+    axes = corpora.variant_axes()
+    calls = corpora.variant_selections()
+
+    def prepare():
+        button = TailwindMerge().variants("inline-flex items-center rounded-md font-medium", axes)
+        return lambda size, intent, state: button(size=size, intent=intent, state=state), calls
+    return Case('variants', prepare)
+
+
+def _custom_rule_case() -> Case:
+    rules = corpora.custom_rules()
+    calls = corpora.custom_rule_heavy()
+
+    def prepare():
+        twm = TailwindMerge(cache_size=None)
+        for category, classes in rules:
+            twm.add_rule(category, classes)
+        return twm.merge, calls
+    return Case('custom_rule_heavy', prepare)
+
+
+def _add_rule_case() -> Case:
+    rules = corpora.custom_rules()
+
+    def prepare():
+        return TailwindMerge().add_rule, rules
+    return Case('add_rule', prepare, warmup=False)
+
+
+def default_cases() -> List[Case]:
+    # The result cache is disabled so every call does the full merge work;
+    # `short_components_cached` shows the effect of the default cache.
+    return [
+        _merge_case('short_components', corpora.short_components(), cache_size=None),
+        _merge_case('short_components_cached', corpora.repeated(corpora.short_components(200), 10)),
+        _merge_case('long_generated', corpora.long_generated(), cache_size=None),
+        _merge_case('modifier_heavy', corpora.modifier_heavy(), cache_size=None),
+        _merge_case('arbitrary_heavy', corpora.arbitrary_heavy(), cache_size=None),
+        _merge_case('short_components_v3', corpora.short_components(), cache_size=None, version=3),
+        _cn_case(),
+        _variants_case(),
+        _custom_rule_case(),
+        _add_rule_case(),
+    ]
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(case: Case, min_time: float = 0.5) -> Dict[str, float]:
+    """Measure one case: throughput over at least `min_time` seconds, then latency and memory."""
+    # Throughput: whole rounds until min_time has elapsed
+    total_calls = 0
+    total_time = 0.0
+    while total_time < min_time:
+        fn, calls = case.prepare()
+        if case.warmup:
+            for args in calls:
+                fn(*args)
+        gc.disable()
+        start = time.perf_counter()
+        for args in calls:
+            fn(*args)
+        total_time += time.perf_counter() - start
+        gc.enable()
+        total_calls += len(calls)
+
+    # Latency: time every call of one round individually
+    fn, calls = case.prepare()
+    if case.warmup:
+        for args in calls:
+            fn(*args)
+    latencies = []
+    perf_counter_ns = time.perf_counter_ns
+    for args in calls:
+        start_ns = perf_counter_ns()
+        fn(*args)
+        latencies.append(perf_counter_ns() - start_ns)
+    latencies.sort()
+
+    # Memory: peak allocation of one cold round, including the instance's caches
+    tracemalloc.start()
+    fn, calls = case.prepare()
+    for args in calls:
+        fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'ops_per_sec': total_calls / total_time,
+        'p50_us': _percentile(latencies, 0.50) / 1000,
+        'p90_us': _percentile(latencies, 0.90) / 1000,
+        'p99_us': _percentile(latencies, 0.99) / 1000,
+        'peak_kib': peak / 1024,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return a message for every case that regressed against the baseline."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None:
+            continue
+        if current['ops_per_sec'] < previous['ops_per_sec'] * (1 - threshold):
+            regressions.append(
+                f"{name}: {current['ops_per_sec']:,.0f} ops/sec vs baseline "
+                f"{previous['ops_per_sec']:,.0f} ({current['ops_per_sec'] / previous['ops_per_sec'] - 1:+.0%})"
+            )
+        if current['peak_kib'] > previous['peak_kib'] * (1 + threshold):
+            regressions.append(
+                f"{name}: peak {current['peak_kib']:,.1f} KiB vs baseline "
+                f"{previous['peak_kib']:,.1f} KiB ({current['peak_kib'] / previous['peak_kib'] - 1:+.0%})"
+            )
+    return regressions
+
+
+def _print_table(results: Dict[str, Dict[str, float]], baseline: Optional[Dict[str, Any]]) -> None:
+    header = f"{'case':<26}{'ops/sec':>14}{'vs base':>9}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}{'peak KiB':>11}"
+    print(header)
+    print('-' * len(header))
+    for name, r in results.items():
+        previous = (baseline or {}).get('results', {}).get(name)
+        delta = f"{r['ops_per_sec'] / previous['ops_per_sec'] - 1:+.0%}" if previous else '-'
+        print(f"{name:<26}{r['ops_per_sec']:>14,.0f}{delta:>9}{r['p50_us']:>10.2f}"
+              f"{r['p90_us']:>10.2f}{r['p99_us']:>10.2f}{r['peak_kib']:>11,.1f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--only', action='append', metavar='CASE', help='run only the named case(s)')
+    parser.add_argument('--save', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline file (default: %(default)s)')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed relative slowdown / memory growth (default: %(default)s)')
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help='seconds of throughput measurement per case (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    cases = default_cases()
+    if args.only:
+        unknown = set(args.only) - {case.name for case in cases}
+        if unknown:
+            parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+        cases = [case for case in cases if case.name in args.only]
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {case.name: measure(case, args.min_time) for case in cases}
+    _print_table(results, baseline)
+
+    if args.save:
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'results': {
+                    name: {metric: round(value, 3) for metric, value in metrics.items()}
+                    for name, metrics in results.items()
+                },
+            }, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print("\nNo baseline found; run with --save to create one.")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nPERFORMANCE REGRESSION (threshold {args.threshold:.0%}):", file=sys.stderr)
+        for message in regressions:
+            print(f"  {message}", file=sys.stderr)
+        return 1
+    print(f"\nNo regressions against baseline (threshold {args.threshold:.0%}).")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
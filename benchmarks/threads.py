@@ -0,0 +1,81 @@
+"""
+Throughput of one shared TailwindMerge across threads.
+
+    python -m benchmarks.threads [--threads 1 2 4 8] [--seconds 1.0] [--with-writer]
+
+Each thread merges the short component corpus in a loop against a single shared
+instance. With `--with-writer`, another thread keeps calling add_rule meanwhile.
+On a GIL build the totals stay roughly flat; on a free-threaded build (3.13t)
+they should scale with the thread count, since merges never take a lock.
+"""
+import argparse
+import sys
+import sysconfig
+import threading
+import time
+from typing import List, Optional
+
+from tailwind_merge import TailwindMerge
+
+from . import corpora
+
+
+def run(thread_count: int, seconds: float, with_writer: bool) -> float:
+    """Return the total merges per second achieved by `thread_count` threads."""
+    twm = TailwindMerge(cache_size=None)
+    calls = corpora.short_components()
+    stop = threading.Event()
+    start_barrier = threading.Barrier(thread_count + 1)
+    counts = [0] * thread_count
+
+    def worker(index: int) -> None:
+        merge = twm.merge
+        done = 0
+        start_barrier.wait()
+        while not stop.is_set():
+            for args in calls:
+                merge(*args)
+            done += len(calls)
+        counts[index] = done
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            twm.add_rule(f"bench_{i}", [f"bench{i}-"])
+            i += 1
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(thread_count)]
+    if with_writer:
+        threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - started)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seconds', type=float, default=1.0)
+    parser.add_argument('--with-writer', action='store_true', help='call add_rule concurrently')
+    args = parser.parse_args(argv)
+
+    gil = 'disabled' if sysconfig.get_config_var('Py_GIL_DISABLED') else 'enabled'
+    print(f"Python {sys.version.split()[0]}, GIL {gil}")
+    print(f"{'threads':>8}{'merges/sec':>14}{'scaling':>9}")
+    single = None
+    for thread_count in args.threads:
+        rate = run(thread_count, args.seconds, args.with_writer)
+        single = single or rate
+        print(f"{thread_count:>8}{rate:>14,.0f}{rate / single:>8.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
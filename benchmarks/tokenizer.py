@@ -0,0 +1,71 @@
+"""
+Class token parsing: the bracket-aware tokenizer against the previous split/regex path.
+
+    python -m benchmarks.tokenizer [--min-time 0.5]
+
+For every distinct token of a corpus, reports tokens/sec for
+  * `legacy`: split(':') into modifiers and base, then the per-call arbitrary value regex
+    that `_get_group` used to run (kept here only as a reference point), and
+  * `tokenizer`: `parse_class`, which also finds the important marker, the sign and the
+    '/' postfix.
+The last column is full classification (tokenizer plus rule lookup) with every cache off.
+"""
+import argparse
+import re
+import sys
+import time
+from typing import Callable, List, Optional
+
+from tailwind_merge import TailwindMerge
+from tailwind_merge.tokenizer import parse_class
+
+from . import corpora
+
+
+def legacy_parse(class_name: str):
+    parts = class_name.split(':')
+    if len(parts) == 1:
+        modifiers, base_class_name = "", class_name
+    else:
+        base_class_name = parts[-1]
+        modifiers = ":".join(parts[:-1]) + ":"
+    arbitrary_match = re.match(r'([a-zA-Z0-9-]+(?:-[a-zA-Z0-9]+)*)-\[([^\]]+)\]$', base_class_name)
+    return modifiers, base_class_name, arbitrary_match
+
+
+def tokens_per_second(function: Callable[[str], object], tokens: List[str], min_time: float) -> float:
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        for token in tokens:
+            function(token)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return rounds * len(tokens) / elapsed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.tokenizer')
+    parser.add_argument('--min-time', type=float, default=0.5, help='seconds to run each measurement')
+    args = parser.parse_args(argv)
+
+    twm = TailwindMerge(cache_size=None, token_cache_size=None)
+    classify = lambda token: twm._classify(token, twm._rules)  # noqa: E731
+
+    print(f"{'corpus':<20}{'tokens':>8}{'legacy/s':>14}{'tokenizer/s':>14}{'classify/s':>14}")
+    for name, calls in (
+        ('short_components', corpora.short_components()),
+        ('modifier_heavy', corpora.modifier_heavy()),
+        ('arbitrary_heavy', corpora.arbitrary_heavy()),
+    ):
+        tokens = list(dict.fromkeys(token for call in calls for token in ' '.join(call).split()))
+        legacy = tokens_per_second(legacy_parse, tokens, args.min_time)
+        tokenizer = tokens_per_second(parse_class, tokens, args.min_time)
+        classified = tokens_per_second(classify, tokens, args.min_time)
+        print(f"{name:<20}{len(tokens):>8}{legacy:>14,.0f}{tokenizer:>14,.0f}{classified:>14,.0f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
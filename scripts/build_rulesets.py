@@ -0,0 +1,534 @@
+"""
+Source definitions of the full Tailwind rulesets shipped in tailwind_merge/data.
+
+Run from the repository root after editing:
+
+    python -m scripts.build_rulesets          # regenerate the data files
+    python -m scripts.build_rulesets --check  # exit 1 if a data file is out of date
+
+Groups use the same form as DEFAULT_GROUPS: exact class names, or prefixes ending in
+'-' matched longest-first. Negative values ('-mt-4') belong to the same group as their
+positive counterpart. A class or prefix may appear in one group only.
+"""
+import argparse
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+from tailwind_merge.rulesets import SUPPORTED_VERSIONS, data_path, dump_rule_data
+
+_Groups = List[Tuple[str, List[str]]]
+
+_SIDES = (('top', 't'), ('right', 'r'), ('bottom', 'b'), ('left', 'l'))
+_LOGICAL_SIDES = (('start', 's'), ('end', 'e'))
+_CORNERS = (
+    ('tl', 'tl'), ('tr', 'tr'), ('br', 'br'), ('bl', 'bl'),
+    ('ss', 'ss'), ('se', 'se'), ('ee', 'ee'), ('es', 'es'),
+)
+
+
+def _spacing(name: str, prefix: str, negative: bool) -> _Groups:
+    """Groups for a spacing family: 'p-', 'px-', 'py-', 'ps-', 'pe-', 'pt-', ... ('scroll-' keeps its dash)."""
+    groups = []
+    for suffix, abbr in (('all', ''), ('x', 'x'), ('y', 'y')) + _LOGICAL_SIDES + _SIDES:
+        item = f'{prefix}{abbr}-'
+        groups.append((f'{name}_{suffix}', [item, f'-{item}'] if negative else [item]))
+    return groups
+
+
+def _spacing_conflicts(name: str) -> Dict[str, Tuple[str, ...]]:
+    return {
+        f'{name}_all': tuple(f'{name}_{suffix}' for suffix in ('x', 'y', 'start', 'end', 'top', 'right', 'bottom', 'left')),
+        f'{name}_x': (f'{name}_left', f'{name}_right'),
+        f'{name}_y': (f'{name}_top', f'{name}_bottom'),
+    }
+
+
+def _border_width(name: str, prefix: str, widths: Sequence[str]) -> _Groups:
+    """Width groups for 'border', 'border-x', ..., each with its fixed widths and arbitrary values."""
+    groups = []
+    for suffix, abbr in (('all', ''), ('x', '-x'), ('y', '-y')) + tuple(
+        (side, f'-{abbr}') for side, abbr in _LOGICAL_SIDES + _SIDES
+    ):
+        base = f'{prefix}{abbr}'
+        groups.append((f'{name}_{suffix}', [base] + [f'{base}-{width}' for width in widths]))
+    return groups
+
+
+def _border_color(name: str, prefix: str) -> _Groups:
+    groups = [(f'{name}_all', [f'{prefix}-'])]
+    for suffix, abbr in (('x', 'x'), ('y', 'y')) + _LOGICAL_SIDES + _SIDES:
+        groups.append((f'{name}_{suffix}', [f'{prefix}-{abbr}-']))
+    return groups
+
+
+def _sided_conflicts(name: str, sides: Sequence[str] = ('start', 'end', 'top', 'right', 'bottom', 'left')) -> Dict[str, Tuple[str, ...]]:
+    return {
+        f'{name}_all': tuple(f'{name}_{suffix}' for suffix in ('x', 'y') + tuple(sides)),
+        f'{name}_x': (f'{name}_left', f'{name}_right'),
+        f'{name}_y': (f'{name}_top', f'{name}_bottom'),
+    }
+
+
+def _radius() -> _Groups:
+    groups = [('border_radius_all', ['rounded', 'rounded-'])]
+    for suffix, abbr in _LOGICAL_SIDES + _SIDES + _CORNERS:
+        groups.append((f'border_radius_{suffix}', [f'rounded-{abbr}', f'rounded-{abbr}-']))
+    return groups
+
+
+_RADIUS_CONFLICTS = {
+    'border_radius_all': tuple(
+        f'border_radius_{suffix}' for suffix, _ in _LOGICAL_SIDES + _SIDES + _CORNERS
+    ),
+    'border_radius_start': ('border_radius_ss', 'border_radius_es'),
+    'border_radius_end': ('border_radius_se', 'border_radius_ee'),
+    'border_radius_top': ('border_radius_tl', 'border_radius_tr'),
+    'border_radius_right': ('border_radius_tr', 'border_radius_br'),
+    'border_radius_bottom': ('border_radius_br', 'border_radius_bl'),
+    'border_radius_left': ('border_radius_tl', 'border_radius_bl'),
+}
+
+_DISPLAY = [
+    'block', 'inline-block', 'inline', 'flex', 'inline-flex', 'table', 'inline-table',
+    'table-caption', 'table-cell', 'table-column', 'table-column-group', 'table-footer-group',
+    'table-header-group', 'table-row-group', 'table-row', 'flow-root', 'grid', 'inline-grid',
+    'contents', 'list-item', 'hidden',
+]
+_BORDER_STYLES = ['solid', 'dashed', 'dotted', 'double', 'hidden', 'none']
+
+
+def v3_groups() -> _Groups:
+    return [
+        # Layout
+        ('aspect_ratio', ['aspect-']),
+        ('container', ['container']),
+        ('columns', ['columns-']),
+        ('break_after', ['break-after-']),
+        ('break_before', ['break-before-']),
+        ('break_inside', ['break-inside-']),
+        ('box_decoration', ['box-decoration-slice', 'box-decoration-clone', 'decoration-slice', 'decoration-clone']),
+        ('box_sizing', ['box-border', 'box-content']),
+        ('display', list(_DISPLAY)),
+        ('float', ['float-']),
+        ('clear', ['clear-']),
+        ('isolation', ['isolate', 'isolation-auto']),
+        ('object_fit', ['object-contain', 'object-cover', 'object-fill', 'object-none', 'object-scale-down']),
+        ('object_position', ['object-']),
+        ('overflow_all', ['overflow-auto', 'overflow-hidden', 'overflow-clip', 'overflow-visible', 'overflow-scroll']),
+        ('overflow_x', ['overflow-x-']),
+        ('overflow_y', ['overflow-y-']),
+        ('overscroll_all', ['overscroll-auto', 'overscroll-contain', 'overscroll-none']),
+        ('overscroll_x', ['overscroll-x-']),
+        ('overscroll_y', ['overscroll-y-']),
+        ('position', ['static', 'fixed', 'absolute', 'relative', 'sticky']),
+        ('inset_all', ['inset-', '-inset-']),
+        ('inset_x', ['inset-x-', '-inset-x-']),
+        ('inset_y', ['inset-y-', '-inset-y-']),
+        ('start', ['start-', '-start-']),
+        ('end', ['end-', '-end-']),
+        ('top', ['top-', '-top-']),
+        ('right', ['right-', '-right-']),
+        ('bottom', ['bottom-', '-bottom-']),
+        ('left', ['left-', '-left-']),
+        ('visibility', ['visible', 'invisible', 'collapse']),
+        ('z_index', ['z-', '-z-']),
+
+        # Flexbox & Grid
+        ('flex_basis', ['basis-']),
+        ('flex_direction', ['flex-row', 'flex-row-reverse', 'flex-col', 'flex-col-reverse']),
+        ('flex_wrap', ['flex-wrap', 'flex-wrap-reverse', 'flex-nowrap']),
+        ('flex', ['flex-1', 'flex-auto', 'flex-initial', 'flex-none', 'flex-']),
+        ('flex_grow', ['grow', 'grow-', 'flex-grow', 'flex-grow-']),
+        ('flex_shrink', ['shrink', 'shrink-', 'flex-shrink', 'flex-shrink-']),
+        ('order', ['order-', '-order-']),
+        ('grid_template_cols', ['grid-cols-']),
+        ('grid_col_span', ['col-auto', 'col-span-', 'col-']),
+        ('grid_col_start', ['col-start-']),
+        ('grid_col_end', ['col-end-']),
+        ('grid_template_rows', ['grid-rows-']),
+        ('grid_row_span', ['row-auto', 'row-span-', 'row-']),
+        ('grid_row_start', ['row-start-']),
+        ('grid_row_end', ['row-end-']),
+        ('grid_auto_flow', ['grid-flow-']),
+        ('grid_auto_cols', ['auto-cols-']),
+        ('grid_auto_rows', ['auto-rows-']),
+        ('gap_all', ['gap-']),
+        ('gap_x', ['gap-x-']),
+        ('gap_y', ['gap-y-']),
+        ('justify_content', [
+            'justify-normal', 'justify-start', 'justify-end', 'justify-center', 'justify-between',
+            'justify-around', 'justify-evenly', 'justify-stretch',
+        ]),
+        ('justify_items', ['justify-items-']),
+        ('justify_self', ['justify-self-']),
+        ('align_content', [
+            'content-normal', 'content-center', 'content-start', 'content-end', 'content-between',
+            'content-around', 'content-evenly', 'content-baseline', 'content-stretch',
+        ]),
+        ('align_items', ['items-']),
+        ('align_self', ['self-']),
+        ('place_content', ['place-content-']),
+        ('place_items', ['place-items-']),
+        ('place_self', ['place-self-']),
+
+        # Spacing
+        *_spacing('padding', 'p', negative=False),
+        *_spacing('margin', 'm', negative=True),
+        ('space_x', ['space-x-', '-space-x-']),
+        ('space_x_reverse', ['space-x-reverse']),
+        ('space_y', ['space-y-', '-space-y-']),
+        ('space_y_reverse', ['space-y-reverse']),
+
+        # Sizing
+        ('width', ['w-']),
+        ('min_width', ['min-w-']),
+        ('max_width', ['max-w-']),
+        ('height', ['h-']),
+        ('min_height', ['min-h-']),
+        ('max_height', ['max-h-']),
+        ('size', ['size-']),
+
+        # Typography
+        ('font_family', ['font-sans', 'font-serif', 'font-mono']),
+        ('font_size', [
+            'text-xs', 'text-sm', 'text-base', 'text-lg', 'text-xl', 'text-2xl', 'text-3xl',
+            'text-4xl', 'text-5xl', 'text-6xl', 'text-7xl', 'text-8xl', 'text-9xl',
+        ]),
+        ('font_smoothing', ['antialiased', 'subpixel-antialiased']),
+        ('font_style', ['italic', 'not-italic']),
+        ('font_weight', [
+            'font-thin', 'font-extralight', 'font-light', 'font-normal', 'font-medium',
+            'font-semibold', 'font-bold', 'font-extrabold', 'font-black', 'font-',
+        ]),
+        ('fvn_normal', ['normal-nums']),
+        ('fvn_ordinal', ['ordinal']),
+        ('fvn_slashed_zero', ['slashed-zero']),
+        ('fvn_figure', ['lining-nums', 'oldstyle-nums']),
+        ('fvn_spacing', ['proportional-nums', 'tabular-nums']),
+        ('fvn_fraction', ['diagonal-fractions', 'stacked-fractions']),
+        ('letter_spacing', ['tracking-', '-tracking-']),
+        ('line_clamp', ['line-clamp-']),
+        ('line_height', ['leading-']),
+        ('list_image', ['list-image-']),
+        ('list_position', ['list-inside', 'list-outside']),
+        ('list_style', ['list-']),
+        ('text_align', ['text-left', 'text-center', 'text-right', 'text-justify', 'text-start', 'text-end']),
+        ('text_color', ['text-']),
+        ('text_opacity', ['text-opacity-']),
+        ('text_decoration', ['underline', 'overline', 'line-through', 'no-underline']),
+        ('text_decoration_color', ['decoration-']),
+        ('text_decoration_style', [
+            'decoration-solid', 'decoration-double', 'decoration-dotted', 'decoration-dashed', 'decoration-wavy',
+        ]),
+        ('text_decoration_thickness', [
+            'decoration-auto', 'decoration-from-font', 'decoration-0', 'decoration-1', 'decoration-2',
+            'decoration-4', 'decoration-8',
+        ]),
+        ('underline_offset', ['underline-offset-']),
+        ('text_transform', ['uppercase', 'lowercase', 'capitalize', 'normal-case']),
+        ('text_overflow', ['truncate', 'text-ellipsis', 'text-clip', 'overflow-ellipsis']),
+        ('text_wrap', ['text-wrap', 'text-nowrap', 'text-balance', 'text-pretty']),
+        ('text_indent', ['indent-', '-indent-']),
+        ('vertical_align', ['align-']),
+        ('whitespace', ['whitespace-']),
+        ('word_break', ['break-normal', 'break-words', 'break-all', 'break-keep']),
+        ('hyphens', ['hyphens-']),
+        ('content', ['content-none', 'content-']),
+
+        # Backgrounds
+        ('bg_attachment', ['bg-fixed', 'bg-local', 'bg-scroll']),
+        ('bg_clip', ['bg-clip-']),
+        ('bg_color', ['bg-']),
+        ('bg_opacity', ['bg-opacity-']),
+        ('bg_origin', ['bg-origin-']),
+        ('bg_position', [
+            'bg-bottom', 'bg-center', 'bg-left', 'bg-left-bottom', 'bg-left-top', 'bg-right',
+            'bg-right-bottom', 'bg-right-top', 'bg-top',
+        ]),
+        ('bg_repeat', ['bg-repeat', 'bg-no-repeat', 'bg-repeat-x', 'bg-repeat-y', 'bg-repeat-round', 'bg-repeat-space']),
+        ('bg_size', ['bg-auto', 'bg-cover', 'bg-contain']),
+        ('bg_image', ['bg-none', 'bg-gradient-to-']),
+        ('gradient_from', ['from-']),
+        ('gradient_via', ['via-']),
+        ('gradient_to', ['to-']),
+
+        # Borders
+        *_radius(),
+        *_border_width('border_width', 'border', ('0', '2', '4', '8')),
+        *_border_color('border_color', 'border'),
+        ('border_opacity', ['border-opacity-']),
+        ('border_style', [f'border-{style}' for style in _BORDER_STYLES]),
+        ('divide_x', ['divide-x', 'divide-x-0', 'divide-x-2', 'divide-x-4', 'divide-x-8', 'divide-x-']),
+        ('divide_x_reverse', ['divide-x-reverse']),
+        ('divide_y', ['divide-y', 'divide-y-0', 'divide-y-2', 'divide-y-4', 'divide-y-8', 'divide-y-']),
+        ('divide_y_reverse', ['divide-y-reverse']),
+        ('divide_color', ['divide-']),
+        ('divide_opacity', ['divide-opacity-']),
+        ('divide_style', [f'divide-{style}' for style in _BORDER_STYLES if style != 'hidden']),
+        ('outline_width', ['outline-0', 'outline-1', 'outline-2', 'outline-4', 'outline-8']),
+        ('outline_color', ['outline-']),
+        ('outline_style', ['outline', 'outline-none', 'outline-dashed', 'outline-dotted', 'outline-double']),
+        ('outline_offset', ['outline-offset-', '-outline-offset-']),
+        ('ring_width', ['ring', 'ring-0', 'ring-1', 'ring-2', 'ring-4', 'ring-8']),
+        ('ring_inset', ['ring-inset']),
+        ('ring_color', ['ring-']),
+        ('ring_opacity', ['ring-opacity-']),
+        ('ring_offset_width', ['ring-offset-0', 'ring-offset-1', 'ring-offset-2', 'ring-offset-4', 'ring-offset-8']),
+        ('ring_offset_color', ['ring-offset-']),
+
+        # Effects
+        ('shadow', [
+            'shadow-sm', 'shadow', 'shadow-md', 'shadow-lg', 'shadow-xl', 'shadow-2xl', 'shadow-inner', 'shadow-none',
+        ]),
+        ('shadow_color', ['shadow-']),
+        ('opacity', ['opacity-']),
+        ('mix_blend', ['mix-blend-']),
+        ('bg_blend', ['bg-blend-']),
+
+        # Filters
+        ('filter', ['filter', 'filter-none']),
+        ('blur', ['blur', 'blur-']),
+        ('brightness', ['brightness-']),
+        ('contrast', ['contrast-']),
+        ('drop_shadow', ['drop-shadow', 'drop-shadow-']),
+        ('grayscale', ['grayscale', 'grayscale-']),
+        ('hue_rotate', ['hue-rotate-', '-hue-rotate-']),
+        ('invert', ['invert', 'invert-']),
+        ('saturate', ['saturate-']),
+        ('sepia', ['sepia', 'sepia-']),
+        ('backdrop_filter', ['backdrop-filter', 'backdrop-filter-none']),
+        ('backdrop_blur', ['backdrop-blur', 'backdrop-blur-']),
+        ('backdrop_brightness', ['backdrop-brightness-']),
+        ('backdrop_contrast', ['backdrop-contrast-']),
+        ('backdrop_grayscale', ['backdrop-grayscale', 'backdrop-grayscale-']),
+        ('backdrop_hue_rotate', ['backdrop-hue-rotate-', '-backdrop-hue-rotate-']),
+        ('backdrop_invert', ['backdrop-invert', 'backdrop-invert-']),
+        ('backdrop_opacity', ['backdrop-opacity-']),
+        ('backdrop_saturate', ['backdrop-saturate-']),
+        ('backdrop_sepia', ['backdrop-sepia', 'backdrop-sepia-']),
+
+        # Tables
+        ('border_collapse', ['border-collapse', 'border-separate']),
+        ('border_spacing_all', ['border-spacing-']),
+        ('border_spacing_x', ['border-spacing-x-']),
+        ('border_spacing_y', ['border-spacing-y-']),
+        ('table_layout', ['table-auto', 'table-fixed']),
+        ('caption_side', ['caption-top', 'caption-bottom']),
+
+        # Transitions & Animation
+        ('transition', ['transition', 'transition-']),
+        ('transition_duration', ['duration-']),
+        ('transition_timing', ['ease-']),
+        ('transition_delay', ['delay-']),
+        ('animation', ['animate-']),
+
+        # Transforms
+        ('transform_core', ['transform', 'transform-cpu', 'transform-gpu', 'transform-none']),
+        ('scale_all', ['scale-', '-scale-']),
+        ('scale_x', ['scale-x-', '-scale-x-']),
+        ('scale_y', ['scale-y-', '-scale-y-']),
+        ('rotate', ['rotate-', '-rotate-']),
+        ('translate_x', ['translate-x-', '-translate-x-']),
+        ('translate_y', ['translate-y-', '-translate-y-']),
+        ('skew_x', ['skew-x-', '-skew-x-']),
+        ('skew_y', ['skew-y-', '-skew-y-']),
+        ('transform_origin', ['origin-']),
+
+        # Interactivity
+        ('accent_color', ['accent-']),
+        ('appearance', ['appearance-none', 'appearance-auto']),
+        ('cursor', ['cursor-']),
+        ('caret_color', ['caret-']),
+        ('pointer_events', ['pointer-events-none', 'pointer-events-auto']),
+        ('resize', ['resize-none', 'resize-y', 'resize-x', 'resize']),
+        ('scroll_behavior', ['scroll-auto', 'scroll-smooth']),
+        *_spacing('scroll_margin', 'scroll-m', negative=True),
+        *_spacing('scroll_padding', 'scroll-p', negative=False),
+        ('snap_align', ['snap-start', 'snap-end', 'snap-center', 'snap-align-none']),
+        ('snap_stop', ['snap-normal', 'snap-always']),
+        ('snap_type', ['snap-none', 'snap-x', 'snap-y', 'snap-both']),
+        ('snap_strictness', ['snap-mandatory', 'snap-proximity']),
+        ('touch', ['touch-auto', 'touch-none', 'touch-manipulation']),
+        ('touch_x', ['touch-pan-x', 'touch-pan-left', 'touch-pan-right']),
+        ('touch_y', ['touch-pan-y', 'touch-pan-up', 'touch-pan-down']),
+        ('touch_pinch_zoom', ['touch-pinch-zoom']),
+        ('user_select', ['select-']),
+        ('will_change', ['will-change-']),
+        ('placeholder_color', ['placeholder-']),
+        ('placeholder_opacity', ['placeholder-opacity-']),
+
+        # SVG
+        ('fill', ['fill-']),
+        ('stroke_width', ['stroke-0', 'stroke-1', 'stroke-2']),
+        ('stroke', ['stroke-']),
+
+        # Accessibility
+        ('screen_readers', ['sr-only', 'not-sr-only']),
+        ('forced_color_adjust', ['forced-color-adjust-']),
+    ]
+
+
+def v3_conflicts() -> Dict[str, Tuple[str, ...]]:
+    return {
+        'overflow_all': ('overflow_x', 'overflow_y'),
+        'overscroll_all': ('overscroll_x', 'overscroll_y'),
+        'inset_all': ('inset_x', 'inset_y', 'start', 'end', 'top', 'right', 'bottom', 'left'),
+        'inset_x': ('right', 'left'),
+        'inset_y': ('top', 'bottom'),
+        'flex': ('flex_basis', 'flex_grow', 'flex_shrink'),
+        'grid_col_span': ('grid_col_start', 'grid_col_end'),
+        'grid_row_span': ('grid_row_start', 'grid_row_end'),
+        'gap_all': ('gap_x', 'gap_y'),
+        **_spacing_conflicts('padding'),
+        **_spacing_conflicts('margin'),
+        **_spacing_conflicts('scroll_margin'),
+        **_spacing_conflicts('scroll_padding'),
+        'size': ('width', 'height'),
+        'font_size': ('line_height',),
+        'fvn_normal': ('fvn_ordinal', 'fvn_slashed_zero', 'fvn_figure', 'fvn_spacing', 'fvn_fraction'),
+        'line_clamp': ('display', 'overflow_all'),
+        **_RADIUS_CONFLICTS,
+        **_sided_conflicts('border_width'),
+        **_sided_conflicts('border_color'),
+        'border_spacing_all': ('border_spacing_x', 'border_spacing_y'),
+        'scale_all': ('scale_x', 'scale_y'),
+        'touch': ('touch_x', 'touch_y', 'touch_pinch_zoom'),
+    }
+
+
+# Utilities removed in Tailwind v4 (the opacity utilities gave way to color/opacity modifiers)
+_V4_REMOVED = {
+    'bg_opacity', 'text_opacity', 'border_opacity', 'divide_opacity', 'ring_opacity',
+    'placeholder_color', 'placeholder_opacity', 'filter', 'backdrop_filter', 'transform_core',
+}
+_V4_REMOVED_ITEMS = {
+    'flex-grow', 'flex-grow-', 'flex-shrink', 'flex-shrink-', 'overflow-ellipsis',
+    'decoration-slice', 'decoration-clone', 'shadow-inner',
+}
+# Groups whose v4 definition replaces the v3 one
+_V4_REPLACED = {
+    'shadow': ['shadow-2xs', 'shadow-xs', 'shadow-sm', 'shadow', 'shadow-md', 'shadow-lg', 'shadow-xl', 'shadow-2xl', 'shadow-none'],
+    'outline_width': ['outline', 'outline-0', 'outline-1', 'outline-2', 'outline-4', 'outline-8'],
+    'outline_style': ['outline-solid', 'outline-none', 'outline-hidden', 'outline-dashed', 'outline-dotted', 'outline-double'],
+    'bg_image': ['bg-none', 'bg-linear-', 'bg-radial', 'bg-radial-', 'bg-conic', 'bg-conic-', 'bg-gradient-to-'],
+}
+# Groups new in v4, each inserted after the named v3 group
+_V4_ADDED = {
+    'object_position': [('field_sizing', ['field-sizing-'])],
+    'font_weight': [('font_stretch', ['font-stretch-'])],
+    'word_break': [('overflow_wrap', ['wrap-break-word', 'wrap-anywhere', 'wrap-normal'])],
+    'shadow_color': [
+        ('inset_shadow', ['inset-shadow-2xs', 'inset-shadow-xs', 'inset-shadow-sm', 'inset-shadow-none']),
+        ('inset_shadow_color', ['inset-shadow-']),
+        ('inset_ring_width', ['inset-ring', 'inset-ring-0', 'inset-ring-1', 'inset-ring-2', 'inset-ring-4', 'inset-ring-8']),
+        ('inset_ring_color', ['inset-ring-']),
+        ('text_shadow', ['text-shadow-2xs', 'text-shadow-xs', 'text-shadow-sm', 'text-shadow-md', 'text-shadow-lg', 'text-shadow-none']),
+        ('text_shadow_color', ['text-shadow-']),
+    ],
+    'scale_y': [('scale_z', ['scale-z-', '-scale-z-']), ('scale_3d', ['scale-3d'])],
+    'rotate': [
+        ('rotate_x', ['rotate-x-', '-rotate-x-']),
+        ('rotate_y', ['rotate-y-', '-rotate-y-']),
+        ('rotate_z', ['rotate-z-', '-rotate-z-']),
+    ],
+    'translate_y': [
+        ('translate_z', ['translate-z-', '-translate-z-']),
+        ('translate_all', ['translate-', '-translate-', 'translate-none']),
+    ],
+    'skew_y': [('skew_all', ['skew-', '-skew-'])],
+    'transform_origin': [
+        ('perspective', ['perspective-']),
+        ('perspective_origin', ['perspective-origin-']),
+        ('transform_style', ['transform-3d', 'transform-flat']),
+        ('backface', ['backface-visible', 'backface-hidden']),
+    ],
+    'caret_color': [('color_scheme', ['scheme-'])],
+}
+
+
+def v4_groups() -> _Groups:
+    groups: _Groups = []
+    for group_name, classes_or_prefixes in v3_groups():
+        if group_name not in _V4_REMOVED:
+            classes_or_prefixes = _V4_REPLACED.get(group_name, classes_or_prefixes)
+            groups.append((group_name, [item for item in classes_or_prefixes if item not in _V4_REMOVED_ITEMS]))
+        groups.extend(_V4_ADDED.get(group_name, ()))
+    return groups
+
+
+def v4_conflicts() -> Dict[str, Tuple[str, ...]]:
+    return {
+        **v3_conflicts(),
+        'scale_all': ('scale_x', 'scale_y'),
+        'scale_3d': ('scale_all', 'scale_x', 'scale_y', 'scale_z'),
+        'translate_all': ('translate_x', 'translate_y'),
+        'skew_all': ('skew_x', 'skew_y'),
+    }
+
+
+def v3_typed_prefixes() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Prefixes whose arbitrary values are routed by type; their own group takes the rest (colors)."""
+    # Line widths may be given unitless ('stroke-[3]')
+    widths = ('length', 'number')
+    typed = {
+        'text-': (('length', 'font_size'),),
+        'bg-': (('image', 'bg_image'), ('percentage', 'bg_position'), ('length', 'bg_size')),
+        'border-': (('length', 'border_width_all'),),
+        'border-x-': (('length', 'border_width_x'),),
+        'border-y-': (('length', 'border_width_y'),),
+        'stroke-': tuple((value_type, 'stroke_width') for value_type in widths),
+        'outline-': tuple((value_type, 'outline_width') for value_type in widths),
+        'ring-': tuple((value_type, 'ring_width') for value_type in widths),
+        'ring-offset-': (('length', 'ring_offset_width'),),
+        'decoration-': tuple((value_type, 'text_decoration_thickness') for value_type in widths),
+    }
+    for name, short in _SIDES + _LOGICAL_SIDES:
+        typed[f'border-{short}-'] = (('length', f'border_width_{name}'),)
+    return typed
+
+
+def v4_typed_prefixes() -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    return {
+        **v3_typed_prefixes(),
+        'inset-ring-': (('length', 'inset_ring_width'), ('number', 'inset_ring_width')),
+    }
+
+
+RULESETS = {
+    '3': (v3_groups, v3_conflicts, v3_typed_prefixes),
+    '4': (v4_groups, v4_conflicts, v4_typed_prefixes),
+}
+
+
+def build(version: str) -> bytes:
+    groups, conflicts, typed_prefixes = RULESETS[version]
+    return dump_rule_data(version, groups(), conflicts(), typed_prefixes())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m scripts.build_rulesets')
+    parser.add_argument('--check', action='store_true', help='only check that the data files are up to date')
+    args = parser.parse_args(argv)
+
+    stale = []
+    for version in SUPPORTED_VERSIONS:
+        path = data_path(version)
+        data = build(version)
+        try:
+            with open(path, 'rb') as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current == data:
+            continue
+        stale.append(path)
+        if not args.check:
+            with open(path, 'wb') as f:
+                f.write(data)
+    for path in stale:
+        print(f"{'out of date' if args.check else 'wrote'}: {path}")
+    return 1 if args.check and stale else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,9 @@
-from .core import TailwindMerge
+from .builder import MergedClasses
+from .core import DEFAULT_CONFLICTS, DEFAULT_GROUPS, CacheInfo, ClassValue, TailwindMerge, cn, default_merger, merge
+from .instrumentation import MergeStats
+from .rewrite import rewrite_html
+from .shared_cache import SharedCache
+from .variants import Variants
 
-__version__ = "0.3.0"
-__all__ = ["TailwindMerge"]
\ No newline at end of file
+__version__ = "0.3.3"
+__all__ = ["TailwindMerge", "CacheInfo", "DEFAULT_GROUPS", "DEFAULT_CONFLICTS", "default_merger", "merge", "cn", "ClassValue", "MergeStats", "MergedClasses", "rewrite_html", "SharedCache", "Variants"]
@@ -0,0 +1,144 @@
+"""
+Command line interface.
+
+    python -m tailwind_merge rewrite in.html > out.html
+    python -m tailwind_merge warm templates/ -o tailwind-merge.snapshot
+    python -m tailwind_merge compile -o myapp/tailwind_classifier.py --merger myapp.styles:twm
+"""
+import argparse
+import importlib
+import sys
+from typing import List, Optional
+
+from . import codegen
+from .core import TailwindMerge
+from .rewrite import DEFAULT_CHUNK_SIZE, rewrite_html
+from .snapshot import DEFAULT_EXTENSIONS, warm
+
+
+def _rewrite(args: argparse.Namespace) -> int:
+    source = sys.stdin if args.input == '-' else open(args.input, encoding=args.encoding, newline='')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', encoding=args.encoding, newline='')
+    try:
+        for text in rewrite_html(source, chunk_size=args.chunk_size):
+            target.write(text)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+
+def _load_merger(spec: str) -> TailwindMerge:
+    """Import a configured instance given as 'package.module:attribute'."""
+    module_name, _, attribute = spec.partition(':')
+    if not attribute:
+        raise SystemExit(f"--merger must look like 'package.module:attribute', not {spec!r}")
+    merger = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(merger, TailwindMerge):
+        raise SystemExit(f"{spec} is not a TailwindMerge instance")
+    return merger
+
+
+def _selected_merger(args: argparse.Namespace) -> TailwindMerge:
+    if args.merger is not None:
+        return _load_merger(args.merger)
+    return TailwindMerge(version=args.tailwind_version)
+
+
+def _add_rules_arguments(parser: argparse.ArgumentParser) -> None:
+    rules = parser.add_mutually_exclusive_group()
+    rules.add_argument(
+        '--version', dest='tailwind_version', choices=('3', '4'),
+        help='use the full Tailwind ruleset for this version (the built-in rules by default)',
+    )
+    rules.add_argument(
+        '--merger', metavar='MODULE:ATTRIBUTE',
+        help="use the rules of your app's configured instance, e.g. myapp.styles:twm",
+    )
+
+
+def _warm(args: argparse.Namespace) -> int:
+    merger = _selected_merger(args)
+    extensions = tuple(args.ext) if args.ext else DEFAULT_EXTENSIONS
+    count = warm(merger, args.paths, args.output, extensions, args.encoding)
+    print(f"Scanned {count} file(s), wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+def _compile(args: argparse.Namespace) -> int:
+    output = args.output
+    if output is None:
+        if args.merger is not None or args.tailwind_version is not None:
+            raise SystemExit("--output is required with --merger or --version")
+        output = codegen.DEFAULT_CLASSIFIER_PATH
+    merger = _selected_merger(args)
+    if codegen.is_current(merger, output):
+        return 0
+    if args.check:
+        print(f"out of date: {output}", file=sys.stderr)
+        return 1
+    codegen.write(merger, output)
+    print(f"wrote: {output}", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m tailwind_merge')
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    rewrite = subparsers.add_parser(
+        'rewrite', help='merge the classes of every class attribute in an HTML file',
+        description=(
+            'Stream an HTML file, merging the Tailwind classes of every class="..." attribute. '
+            'Comments and <script> and <style> elements are copied unchanged.'
+        ),
+    )
+    rewrite.add_argument('input', nargs='?', default='-', help="HTML file to read ('-' for stdin, the default)")
+    rewrite.add_argument('-o', '--output', default='-', help="file to write ('-' for stdout, the default)")
+    rewrite.add_argument('--encoding', default='utf-8', help='encoding of the input and output files')
+    rewrite.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help=argparse.SUPPRESS)
+    rewrite.set_defaults(handler=_rewrite)
+
+    warm_parser = subparsers.add_parser(
+        'warm', help='write a cache snapshot for the classes used in templates',
+        description=(
+            'Scan HTML, Jinja, Django and JSX templates for class attributes, and write a '
+            'snapshot of their classifications and merge results for TailwindMerge.load_snapshot.'
+        ),
+    )
+    warm_parser.add_argument('paths', nargs='+', help='template files, or directories to search')
+    warm_parser.add_argument('-o', '--output', required=True, help='snapshot file to write')
+    _add_rules_arguments(warm_parser)
+    warm_parser.add_argument(
+        '--ext', action='append', metavar='.EXT',
+        help=f"file extension to search directories for, repeatable (default: {' '.join(DEFAULT_EXTENSIONS)})",
+    )
+    warm_parser.add_argument('--encoding', default='utf-8', help='encoding of the template files')
+    warm_parser.set_defaults(handler=_warm)
+
+    compile_parser = subparsers.add_parser(
+        'compile', help='generate a specialized classifier module for a ruleset',
+        description=(
+            'Generate a Python module that classifies classes for one ruleset, for '
+            'TailwindMerge.use_classifier. Without options, regenerates the classifier '
+            'the package ships for its built-in rules.'
+        ),
+    )
+    compile_parser.add_argument(
+        '-o', '--output', help="module to write (the package's built-in classifier by default)",
+    )
+    _add_rules_arguments(compile_parser)
+    compile_parser.add_argument(
+        '--check', action='store_true', help='only check that the module matches the rules',
+    )
+    compile_parser.set_defaults(handler=_compile)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,352 @@
+# Generated by `python -m tailwind_merge compile`; do not edit.
+# The specialized classifier for one tailwind-merge ruleset, see tailwind_merge/codegen.py.
+
+from tailwind_merge.validators import route
+
+FINGERPRINT = bytes.fromhex('c4d43978a74e8fd3')
+
+_EXACT = {
+    'absolute': 'position',
+    'appearance-none': 'appearance',
+    'bg-auto': 'bg_size',
+    'bg-bottom': 'bg_position',
+    'bg-center': 'bg_position',
+    'bg-contain': 'bg_size',
+    'bg-cover': 'bg_size',
+    'bg-fixed': 'bg_attachment',
+    'bg-left': 'bg_position',
+    'bg-left-bottom': 'bg_position',
+    'bg-left-top': 'bg_position',
+    'bg-local': 'bg_attachment',
+    'bg-no-repeat': 'bg_repeat',
+    'bg-none': 'bg_image',
+    'bg-repeat': 'bg_repeat',
+    'bg-repeat-round': 'bg_repeat',
+    'bg-repeat-space': 'bg_repeat',
+    'bg-repeat-x': 'bg_repeat',
+    'bg-repeat-y': 'bg_repeat',
+    'bg-right': 'bg_position',
+    'bg-right-bottom': 'bg_position',
+    'bg-right-top': 'bg_position',
+    'bg-scroll': 'bg_attachment',
+    'bg-top': 'bg_position',
+    'block': 'display',
+    'border': 'border_width_all',
+    'border-0': 'border_width_all',
+    'border-2': 'border_width_all',
+    'border-4': 'border_width_all',
+    'border-8': 'border_width_all',
+    'border-b': 'border_width_b',
+    'border-b-0': 'border_width_b',
+    'border-b-2': 'border_width_b',
+    'border-b-4': 'border_width_b',
+    'border-b-8': 'border_width_b',
+    'border-dashed': 'border_style',
+    'border-dotted': 'border_style',
+    'border-double': 'border_style',
+    'border-hidden': 'border_style',
+    'border-l': 'border_width_l',
+    'border-l-0': 'border_width_l',
+    'border-l-2': 'border_width_l',
+    'border-l-4': 'border_width_l',
+    'border-l-8': 'border_width_l',
+    'border-none': 'border_style',
+    'border-r': 'border_width_r',
+    'border-r-0': 'border_width_r',
+    'border-r-2': 'border_width_r',
+    'border-r-4': 'border_width_r',
+    'border-r-8': 'border_width_r',
+    'border-solid': 'border_style',
+    'border-t': 'border_width_t',
+    'border-t-0': 'border_width_t',
+    'border-t-2': 'border_width_t',
+    'border-t-4': 'border_width_t',
+    'border-t-8': 'border_width_t',
+    'break-all': 'word_break',
+    'break-normal': 'word_break',
+    'break-words': 'word_break',
+    'capitalize': 'text_transform',
+    'col-auto': 'grid_col_auto',
+    'content-around': 'align_content',
+    'content-baseline': 'align_content',
+    'content-between': 'align_content',
+    'content-center': 'align_content',
+    'content-end': 'align_content',
+    'content-evenly': 'align_content',
+    'content-start': 'align_content',
+    'contents': 'display',
+    'fixed': 'position',
+    'flex': 'display',
+    'flex-1': 'flex',
+    'flex-auto': 'flex',
+    'flex-col': 'flex_direction',
+    'flex-col-reverse': 'flex_direction',
+    'flex-grow': 'flex_grow',
+    'flex-initial': 'flex',
+    'flex-none': 'flex',
+    'flex-nowrap': 'flex_wrap',
+    'flex-row': 'flex_direction',
+    'flex-row-reverse': 'flex_direction',
+    'flex-shrink': 'flex_shrink',
+    'flex-wrap': 'flex_wrap',
+    'flex-wrap-reverse': 'flex_wrap',
+    'flow-root': 'display',
+    'font-black': 'font_weight',
+    'font-bold': 'font_weight',
+    'font-extrabold': 'font_weight',
+    'font-extralight': 'font_weight',
+    'font-light': 'font_weight',
+    'font-medium': 'font_weight',
+    'font-mono': 'font_family',
+    'font-normal': 'font_weight',
+    'font-sans': 'font_family',
+    'font-semibold': 'font_weight',
+    'font-serif': 'font_family',
+    'font-thin': 'font_weight',
+    'grid': 'display',
+    'grid-flow-col': 'grid_auto_flow',
+    'grid-flow-col-dense': 'grid_auto_flow',
+    'grid-flow-dense': 'grid_auto_flow',
+    'grid-flow-row': 'grid_auto_flow',
+    'grid-flow-row-dense': 'grid_auto_flow',
+    'grow': 'flex_grow',
+    'grow-0': 'flex_grow',
+    'hidden': 'display',
+    'inline': 'display',
+    'inline-block': 'display',
+    'inline-flex': 'display',
+    'inline-grid': 'display',
+    'inline-table': 'display',
+    'italic': 'font_style',
+    'items-baseline': 'align_items',
+    'items-center': 'align_items',
+    'items-end': 'align_items',
+    'items-start': 'align_items',
+    'items-stretch': 'align_items',
+    'justify-around': 'justify_content',
+    'justify-between': 'justify_content',
+    'justify-center': 'justify_content',
+    'justify-end': 'justify_content',
+    'justify-evenly': 'justify_content',
+    'justify-items-center': 'justify_items',
+    'justify-items-end': 'justify_items',
+    'justify-items-start': 'justify_items',
+    'justify-items-stretch': 'justify_items',
+    'justify-self-auto': 'justify_self',
+    'justify-self-center': 'justify_self',
+    'justify-self-end': 'justify_self',
+    'justify-self-start': 'justify_self',
+    'justify-self-stretch': 'justify_self',
+    'justify-start': 'justify_content',
+    'line-through': 'text_decoration',
+    'list-item': 'display',
+    'lowercase': 'text_transform',
+    'no-underline': 'text_decoration',
+    'normal-case': 'text_transform',
+    'not-italic': 'font_style',
+    'overflow-auto': 'overflow_all',
+    'overflow-clip': 'text_overflow',
+    'overflow-ellipsis': 'text_overflow',
+    'overflow-hidden': 'overflow_all',
+    'overflow-scroll': 'overflow_all',
+    'overflow-visible': 'overflow_all',
+    'overflow-x-auto': 'overflow_x',
+    'overflow-x-hidden': 'overflow_x',
+    'overflow-x-scroll': 'overflow_x',
+    'overflow-x-visible': 'overflow_x',
+    'overflow-y-auto': 'overflow_y',
+    'overflow-y-hidden': 'overflow_y',
+    'overflow-y-scroll': 'overflow_y',
+    'overflow-y-visible': 'overflow_y',
+    'pointer-events-auto': 'pointer_events',
+    'pointer-events-none': 'pointer_events',
+    'relative': 'position',
+    'resize': 'resize',
+    'resize-none': 'resize',
+    'resize-x': 'resize',
+    'resize-y': 'resize',
+    'rounded': 'border_radius_all',
+    'row-auto': 'grid_row_auto',
+    'select-all': 'user_select',
+    'select-auto': 'user_select',
+    'select-none': 'user_select',
+    'select-text': 'user_select',
+    'self-auto': 'align_self',
+    'self-baseline': 'align_self',
+    'self-center': 'align_self',
+    'self-end': 'align_self',
+    'self-start': 'align_self',
+    'self-stretch': 'align_self',
+    'shadow': 'shadow',
+    'shrink': 'flex_shrink',
+    'shrink-0': 'flex_shrink',
+    'static': 'position',
+    'sticky': 'position',
+    'table': 'display',
+    'table-caption': 'display',
+    'table-cell': 'display',
+    'table-column': 'display',
+    'table-column-group': 'display',
+    'table-footer-group': 'display',
+    'table-header-group': 'display',
+    'table-row': 'display',
+    'table-row-group': 'display',
+    'text-2xl': 'font_size',
+    'text-3xl': 'font_size',
+    'text-4xl': 'font_size',
+    'text-5xl': 'font_size',
+    'text-6xl': 'font_size',
+    'text-7xl': 'font_size',
+    'text-8xl': 'font_size',
+    'text-9xl': 'font_size',
+    'text-base': 'font_size',
+    'text-center': 'text_align',
+    'text-clip': 'text_overflow',
+    'text-ellipsis': 'text_overflow',
+    'text-justify': 'text_align',
+    'text-left': 'text_align',
+    'text-lg': 'font_size',
+    'text-right': 'text_align',
+    'text-sm': 'font_size',
+    'text-xl': 'font_size',
+    'text-xs': 'font_size',
+    'transform': 'transform_core',
+    'transform-gpu': 'transform_core',
+    'transform-none': 'transform_core',
+    'transition': 'transition',
+    'truncate': 'text_overflow',
+    'underline': 'text_decoration',
+    'uppercase': 'text_transform',
+    'whitespace-normal': 'whitespace',
+    'whitespace-nowrap': 'whitespace',
+    'whitespace-pre': 'whitespace',
+    'whitespace-pre-line': 'whitespace',
+    'whitespace-pre-wrap': 'whitespace',
+}
+
+_PREFIXES = {
+    '-m-': 'negative_margin_all',
+    '-mb-': 'negative_margin_bottom',
+    '-ml-': 'negative_margin_left',
+    '-mr-': 'negative_margin_right',
+    '-mt-': 'negative_margin_top',
+    '-mx-': 'negative_margin_x',
+    '-my-': 'negative_margin_y',
+    'auto-cols-': 'grid_auto_cols',
+    'auto-rows-': 'grid_auto_rows',
+    'basis-': 'flex_basis',
+    'bg-': 'bg_color',
+    'bg-gradient-to-': 'bg_image',
+    'bg-opacity-': 'bg_opacity',
+    'border-': 'border_color',
+    'border-opacity-': 'border_opacity',
+    'bottom-': 'bottom',
+    'col-end-': 'grid_col_end',
+    'col-span-': 'grid_col_span',
+    'col-start-': 'grid_col_start',
+    'cursor-': 'cursor',
+    'delay-': 'transition_delay',
+    'duration-': 'transition_duration',
+    'ease-': 'transition_timing',
+    'gap-': 'gap_all',
+    'gap-x-': 'gap_x',
+    'gap-y-': 'gap_y',
+    'grid-cols-': 'grid_template_cols',
+    'grid-rows-': 'grid_template_rows',
+    'h-': 'height',
+    'inset-': 'inset_all',
+    'inset-x-': 'inset_x',
+    'inset-y-': 'inset_y',
+    'leading-': 'line_height',
+    'left-': 'left',
+    'm-': 'margin_all',
+    'max-h-': 'max_height',
+    'max-w-': 'max_width',
+    'mb-': 'margin_bottom',
+    'min-h-': 'min_height',
+    'min-w-': 'min_width',
+    'ml-': 'margin_left',
+    'mr-': 'margin_right',
+    'mt-': 'margin_top',
+    'mx-': 'margin_x',
+    'my-': 'margin_y',
+    'opacity-': 'opacity',
+    'order-': 'order',
+    'origin-': 'transform_origin',
+    'p-': 'padding_all',
+    'pb-': 'padding_bottom',
+    'pl-': 'padding_left',
+    'placeholder-': 'placeholder_color',
+    'pr-': 'padding_right',
+    'pt-': 'padding_top',
+    'px-': 'padding_x',
+    'py-': 'padding_y',
+    'right-': 'right',
+    'rotate-': 'rotate',
+    'rounded-': 'border_radius_all',
+    'rounded-b-': 'border_radius_b',
+    'rounded-bl-': 'border_radius_bl',
+    'rounded-br-': 'border_radius_br',
+    'rounded-l-': 'border_radius_l',
+    'rounded-r-': 'border_radius_r',
+    'rounded-t-': 'border_radius_t',
+    'rounded-tl-': 'border_radius_tl',
+    'rounded-tr-': 'border_radius_tr',
+    'row-end-': 'grid_row_end',
+    'row-span-': 'grid_row_span',
+    'row-start-': 'grid_row_start',
+    'scale-': 'scale_all',
+    'scale-x-': 'scale_x',
+    'scale-y-': 'scale_y',
+    'skew-x-': 'skew_x',
+    'skew-y-': 'skew_y',
+    'text-': 'text_color',
+    'text-opacity-': 'text_opacity',
+    'top-': 'top',
+    'tracking-': 'letter_spacing',
+    'translate-x-': 'translate_x',
+    'translate-y-': 'translate_y',
+    'w-': 'width',
+    'z-': 'z_index',
+}
+
+_TYPED_PREFIXES = {
+    'bg-': (('image', 'bg_image'), ('percentage', 'bg_position'), ('length', 'bg_size')),
+    'border-': (('length', 'border_width_all'),),
+    'border-b-': (('length', 'border_width_b'),),
+    'border-l-': (('length', 'border_width_l'),),
+    'border-r-': (('length', 'border_width_r'),),
+    'border-t-': (('length', 'border_width_t'),),
+    'text-': (('length', 'font_size'),),
+}
+
+
+def get_group(name, postfix, arbitrary, _exact=_EXACT.get, _prefixes=_PREFIXES.get, _typed_prefixes=_TYPED_PREFIXES.get):
+    """The group of a parsed class (see ParsedClass.base), or None."""
+    if not name:
+        return None
+    if arbitrary is None:
+        group = _exact(name)
+        if group is not None:
+            return group
+    else:
+        name += '-'
+        routes = _typed_prefixes(name)
+        if routes is not None:
+            group = route(routes, arbitrary)
+            if group is not None:
+                return group
+    end1 = name.find('-')
+    if end1 == -1:
+        return None
+    end2 = name.find('-', end1 + 1)
+    if end2 != -1:
+        end3 = name.find('-', end2 + 1)
+        if end3 != -1:
+            group = _prefixes(name[:end3 + 1])
+            if group is not None:
+                return group
+        group = _prefixes(name[:end2 + 1])
+        if group is not None:
+            return group
+    return _prefixes(name[:end1 + 1])
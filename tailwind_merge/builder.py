@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .core import TailwindMerge, _Ruleset
+
+
+class MergedClasses:
+    """
+    An incrementally merged class list, created with `TailwindMerge.builder()`.
+
+    Holds the current winner of every conflict key (group + modifiers, or the class
+    itself for classes outside any group) in insertion order. `add` classifies only
+    the new tokens: each one evicts the winner of its own key and of every key its
+    group overrides, then becomes the newest entry. Since overrides are transitively
+    closed, this keeps exactly the classes `merge` would keep, in the same order, so
+
+        str(twm.builder(a).add(b, c)) == twm.merge(a, b, c)
+
+    A builder keeps the rules its merger had when the builder was created (copies
+    share them); rules added later don't apply to it. It is not safe to add to the
+    same builder from several threads at once.
+    """
+    __slots__ = ('_merger', '_rules', '_winners', '_rendered')
+
+    def __init__(
+        self, merger: "TailwindMerge", rules: "_Ruleset", winners: Optional[Dict[Any, str]] = None
+    ):
+        self._merger = merger
+        self._rules = rules
+        self._winners: Dict[Any, str] = {} if winners is None else winners
+        self._rendered: Optional[str] = None
+
+    def add(self, *class_lists: str) -> "MergedClasses":
+        """Merge more class strings into this builder in place. Returns the builder."""
+        rules = self._rules
+        table = rules.token_cache
+        classify = self._merger._classify
+        winners = self._winners
+        for class_str in class_lists:
+            if not class_str:
+                continue
+            for class_name in class_str.split():
+                info = table.get(class_name)
+                if info is None:
+                    info = classify(class_name, rules)
+                key = info[3]
+                if key is None:
+                    # Classes outside any group conflict only with themselves
+                    key = class_name
+                else:
+                    for overridden_key in info[4]:
+                        winners.pop(overridden_key, None)
+                # Re-inserting moves the key to the end, where its newest class belongs
+                winners.pop(key, None)
+                winners[key] = class_name
+        self._rendered = None
+        return self
+
+    def copy(self) -> "MergedClasses":
+        """Return an independent builder with the same classes, costing one dict copy."""
+        copied = MergedClasses(self._merger, self._rules, dict(self._winners))
+        copied._rendered = self._rendered
+        return copied
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            self._rendered = ' '.join(self._winners.values())
+        return self._rendered
+
+    def __repr__(self) -> str:
+        return f"MergedClasses({str(self)!r})"
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._winners.values())
+
+    def __len__(self) -> int:
+        return len(self._winners)
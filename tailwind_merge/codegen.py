@@ -0,0 +1,161 @@
+"""
+Ahead-of-time compilation of a ruleset into a specialized classifier module.
+
+    python -m tailwind_merge compile -o myapp/tailwind_classifier.py --merger myapp.styles:twm
+
+    from myapp import tailwind_classifier
+    twm.use_classifier(tailwind_classifier)
+
+The generated module holds the ruleset's exact and prefix mappings as literals (every
+section of a full ruleset included) and a `get_group` function with the lookup
+unrolled for that ruleset: prefix probes are limited to the dash positions the
+ruleset's prefixes actually have, and checks it can never need (postfixed exact
+classes, say) are left out. Typed prefixes are compiled in too, unless they use
+custom validator callables, which can't be written out. It records the fingerprint of
+the rules it was built from (`_Ruleset.rules_fingerprint`, which leaves out the library
+version), and `use_classifier` refuses a module built from other rules.
+
+The built-in rules are compiled into tailwind_merge/_classifier.py. Instances don't
+use it unless asked to (`twm.use_classifier(tailwind_merge._classifier)`): for rules
+this small the interpreted lookup classifies about as fast, and the generated module
+only pays off for large rulesets like the full Tailwind ones (see
+`python -m benchmarks.classifier`). Regenerate it after changing DEFAULT_GROUPS with
+`python -m tailwind_merge compile`.
+"""
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
+
+from .validators import describe
+
+if TYPE_CHECKING:
+    from .core import TailwindMerge
+
+DEFAULT_CLASSIFIER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_classifier.py')
+
+
+def _mappings(merger: "TailwindMerge") -> Tuple[Dict[str, str], Dict[str, str]]:
+    """The complete exact and prefix mappings of `merger`'s current rules."""
+    rules = merger._rules
+    if rules.data is not None:
+        # Fill in every section, exactly as lookups would one by one
+        for key in rules.data.sections:
+            rules.load_section(key)
+    with rules.section_lock:
+        return dict(rules.exact_mapping), dict(rules.prefix_mapping)
+
+
+def _dict_literal(name: str, mapping: Dict[str, Any]) -> List[str]:
+    lines = [f'{name} = {{']
+    lines.extend(f'    {key!r}: {value!r},' for key, value in sorted(mapping.items()))
+    lines.append('}')
+    return lines
+
+
+def generate(merger: "TailwindMerge") -> str:
+    """Return the source of a classifier module for `merger`'s current rules."""
+    rules = merger._rules
+    exact_mapping, prefix_mapping = _mappings(merger)
+    # Prefixes end with '-': one ending at the n-th dash of a name is probed at depth n
+    depths = {prefix.count('-') for prefix in prefix_mapping}
+    postfixed = any('/' in class_name for class_name in exact_mapping)
+    typed_prefixes = rules.typed_prefixes
+    for prefix, routes in typed_prefixes.items():
+        for value_type, _ in routes:
+            if not isinstance(value_type, str):
+                raise ValueError(
+                    f"Can't compile the custom validator {describe(value_type)} for '{prefix}'"
+                )
+
+    lines = [
+        '# Generated by `python -m tailwind_merge compile`; do not edit.',
+        '# The specialized classifier for one tailwind-merge ruleset, see tailwind_merge/codegen.py.',
+        '',
+    ]
+    if typed_prefixes:
+        lines += ['from tailwind_merge.validators import route', '']
+    lines += [
+        f'FINGERPRINT = bytes.fromhex({rules.rules_fingerprint().hex()!r})',
+        '',
+    ]
+    lines += _dict_literal('_EXACT', exact_mapping)
+    lines.append('')
+    lines += _dict_literal('_PREFIXES', prefix_mapping)
+    signature = 'def get_group(name, postfix, arbitrary, _exact=_EXACT.get, _prefixes=_PREFIXES.get'
+    if typed_prefixes:
+        lines.append('')
+        lines += _dict_literal('_TYPED_PREFIXES', typed_prefixes)
+        signature += ', _typed_prefixes=_TYPED_PREFIXES.get'
+    lines += [
+        '',
+        '',
+        signature + '):',
+        '    """The group of a parsed class (see ParsedClass.base), or None."""',
+        '    if not name:',
+        '        return None',
+        '    if arbitrary is None:',
+    ]
+    if postfixed:
+        lines += [
+            '        if postfix is not None:',
+            "            group = _exact(name + '/' + postfix)",
+            '            if group is not None:',
+            '                return group',
+        ]
+    lines += [
+        '        group = _exact(name)',
+        '        if group is not None:',
+        '            return group',
+        '    else:',
+        "        name += '-'",
+    ]
+    if typed_prefixes:
+        lines += [
+            '        routes = _typed_prefixes(name)',
+            '        if routes is not None:',
+            '            group = route(routes, arbitrary)',
+            '            if group is not None:',
+            '                return group',
+        ]
+    if depths:
+        lines.append("    end1 = name.find('-')")
+        lines.append('    if end1 == -1:')
+        lines.append('        return None')
+        lines += _prefix_probes(1, max(depths), depths, '    ')
+    if not lines[-1].startswith('    return '):
+        lines.append('    return None')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def _prefix_probes(level: int, max_depth: int, depths: Set[int], indent: str) -> List[str]:
+    """
+    Lines probing the prefixes that end at the `level`-th dash of `name` and deeper,
+    longest first, given `end<level>` holds the position of that dash.
+    """
+    lines = []
+    if level < max_depth:
+        lines.append(f"{indent}end{level + 1} = name.find('-', end{level} + 1)")
+        lines.append(f'{indent}if end{level + 1} != -1:')
+        lines += _prefix_probes(level + 1, max_depth, depths, indent + '    ')
+    if level == 1 and level in depths:
+        lines.append(f'{indent}return _prefixes(name[:end1 + 1])')
+    elif level in depths:
+        lines.append(f'{indent}group = _prefixes(name[:end{level} + 1])')
+        lines.append(f'{indent}if group is not None:')
+        lines.append(f'{indent}    return group')
+    return lines
+
+
+def write(merger: "TailwindMerge", path: str) -> None:
+    """Generate the classifier module for `merger`'s current rules and write it to `path`."""
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(generate(merger))
+
+
+def is_current(merger: "TailwindMerge", path: str) -> bool:
+    """Whether the module at `path` is what `generate` produces for `merger`'s current rules."""
+    try:
+        with open(path, encoding='utf-8', newline='') as f:
+            return f.read() == generate(merger)
+    except FileNotFoundError:
+        return False
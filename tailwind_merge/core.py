@@ -1,429 +1,1302 @@
-from typing import List, Tuple, Dict, Optional, Set
-import re
+from collections import ChainMap, OrderedDict
+import functools
+import hashlib
+import importlib
+import itertools
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
+import threading
 
-class TailwindMerge:
-    def __init__(self):
-        # Define conflict groups with ordered prefixes (more specific first)
-        self.groups: List[Tuple[str, List[str]]] = [
-            # Font Size (specific sizes)
-            ('font_size', [
-                'text-xs', 'text-sm', 'text-base',
-                'text-lg', 'text-xl', 'text-2xl',
-                'text-3xl', 'text-4xl', 'text-5xl',
-                'text-6xl', 'text-7xl', 'text-8xl', 'text-9xl'
-            ]),
-            # Text Color (catch-all 'text-' after specific font sizes)
-            ('text_color', ['text-']),
-            # Text Alignment
-            ('text_align', ['text-left', 'text-center', 'text-right', 'text-justify']),
-            # Text Decoration
-            ('text_decoration', ['underline', 'no-underline', 'line-through']),
-            # Text Transform
-            ('text_transform', ['uppercase', 'lowercase', 'capitalize', 'normal-case']),
-            # Font Family
-            ('font_family', ['font-sans', 'font-serif', 'font-mono']),
-            # Font Weight
-            ('font_weight', [
-                'font-thin', 'font-extralight',
-                'font-light', 'font-normal',
-                'font-medium', 'font-semibold',
-                'font-bold', 'font-extrabold',
-                'font-black'
-            ]),
-            # Font Style
-            ('font_style', ['italic', 'not-italic']),
-            # Letter Spacing
-            ('letter_spacing', ['tracking-']),
-            # Line Height
-            ('line_height', ['leading-']),
-
-            # Background Color
-            ('bg_color', ['bg-']),
-            # Background Position
-            ('bg_position', ['bg-bottom', 'bg-center', 'bg-left', 'bg-left-bottom',
-                            'bg-left-top', 'bg-right', 'bg-right-bottom',
-                            'bg-right-top', 'bg-top']),
-            # Background Size
-            ('bg_size', ['bg-auto', 'bg-cover', 'bg-contain']),
-            # Background Repeat
-            ('bg_repeat', ['bg-repeat', 'bg-no-repeat', 'bg-repeat-x',
-                          'bg-repeat-y', 'bg-repeat-round', 'bg-repeat-space']),
-            # Background Attachment
-            ('bg_attachment', ['bg-fixed', 'bg-local', 'bg-scroll']),
-
-            # Width
-            ('width', ['w-']),
-            # Min Width
-            ('min_width', ['min-w-']),
-            # Max Width
-            ('max_width', ['max-w-']),
-
-            # Height
-            ('height', ['h-']),
-            # Min Height
-            ('min_height', ['min-h-']),
-            # Max Height
-            ('max_height', ['max-h-']),
-
-            # --- Margin --- (Split like padding for similar reasons)
-            ('margin_top', ['mt-']),
-            ('margin_right', ['mr-']),
-            ('margin_bottom', ['mb-']),
-            ('margin_left', ['ml-']),
-            ('margin_x', ['mx-']),
-            ('margin_y', ['my-']),
-            ('margin_all', ['m-']),
-            # Negative Margin (keep separate, maybe split further if needed)
-            ('negative_margin_top', ['-mt-']),
-            ('negative_margin_right', ['-mr-']),
-            ('negative_margin_bottom', ['-mb-']),
-            ('negative_margin_left', ['-ml-']),
-            ('negative_margin_x', ['-mx-']),
-            ('negative_margin_y', ['-my-']),
-            ('negative_margin_all', ['-m-']),
-            # --- End Margin ---
-
-            # --- Padding ---
-            # Order matters: More specific (sides) before less specific (axes/all)
-            ('padding_top', ['pt-']),
-            ('padding_right', ['pr-']),
-            ('padding_bottom', ['pb-']),
-            ('padding_left', ['pl-']),
-            # Axes conflict with respective sides and the 'all' padding
-            ('padding_x', ['px-']), # Conflicts with pl-, pr-, p-
-            ('padding_y', ['py-']), # Conflicts with pt-, pb-, p-
-            # General padding conflicts with all other padding types
-            ('padding_all', ['p-']),
-            # --- End Padding ---
-
-            # Display
-            ('display', [
-                'block', 'inline', 'inline-block',
-                'flex', 'inline-flex', 'grid',
-                'inline-grid', 'hidden', 'contents', 'table',
-                'inline-table', 'table-caption', 'table-cell',
-                'table-column', 'table-column-group', 'table-footer-group',
-                'table-header-group', 'table-row-group', 'table-row',
-                'flow-root',
-                'list-item'
-            ]),
-
-            # Position
-            ('position', ['static', 'fixed', 'absolute', 'relative', 'sticky']),
-            # Top, Right, Bottom, Left, Inset
-            ('inset_all', ['inset-']),
-            ('inset_x', ['inset-x-']),
-            ('inset_y', ['inset-y-']),
-            ('top', ['top-']),
-            ('right', ['right-']),
-            ('bottom', ['bottom-']),
-            ('left', ['left-']),
-
-            # Z-Index
-            ('z_index', ['z-']),
-
-            # Flex Direction
-            ('flex_direction', ['flex-row', 'flex-row-reverse', 'flex-col', 'flex-col-reverse']),
-            # Flex Wrap
-            ('flex_wrap', ['flex-wrap', 'flex-wrap-reverse', 'flex-nowrap']),
-            # Flex Grow
-            ('flex_grow', ['flex-grow', 'grow', 'grow-0']), # Added 'grow' alias
-            # Flex Shrink
-            ('flex_shrink', ['flex-shrink', 'shrink', 'shrink-0']), # Added 'shrink' alias
-            # Flex
-            ('flex', ['flex-1', 'flex-auto', 'flex-initial', 'flex-none']), # flex- is ambiguous now with direction etc. use specifics
-            # Flex Basis
-            ('flex_basis', ['basis-']),
-            # Order
-            ('order', ['order-']),
-
-            # Grid Template Columns
-            ('grid_template_cols', ['grid-cols-']),
-            # Grid Column Start / End / Span
-            ('grid_col_start', ['col-start-']),
-            ('grid_col_end', ['col-end-']),
-            ('grid_col_span', ['col-span-']), # Should conflict start/end conceptually, but often used together. Separate group ok.
-            ('grid_col_auto', ['col-auto']), # Specific col span
-            # Grid Template Rows
-            ('grid_template_rows', ['grid-rows-']),
-            # Grid Row Start / End / Span
-            ('grid_row_start', ['row-start-']),
-            ('grid_row_end', ['row-end-']),
-            ('grid_row_span', ['row-span-']), # See col-span note
-            ('grid_row_auto', ['row-auto']), # Specific row span
-             # Grid Auto Flow
-            ('grid_auto_flow', ['grid-flow-row', 'grid-flow-col', 'grid-flow-dense', 'grid-flow-row-dense', 'grid-flow-col-dense']), # Added 'dense' combinations
-            # Grid Auto Columns
-            ('grid_auto_cols', ['auto-cols-']),
-            # Grid Auto Rows
-            ('grid_auto_rows', ['auto-rows-']),
-            # Gap (Split like padding)
-            ('gap_all', ['gap-']),
-            ('gap_x', ['gap-x-']),
-            ('gap_y', ['gap-y-']),
-
-            # Justify Content
-            ('justify_content', ['justify-start', 'justify-end', 'justify-center', 'justify-between', 'justify-around', 'justify-evenly']),
-            # Justify Items
-            ('justify_items', ['justify-items-start', 'justify-items-end', 'justify-items-center', 'justify-items-stretch']),
-            # Justify Self
-            ('justify_self', ['justify-self-auto', 'justify-self-start', 'justify-self-end', 'justify-self-center', 'justify-self-stretch']),
-            # Align Content
-            ('align_content', ['content-center', 'content-start', 'content-end', 'content-between', 'content-around', 'content-evenly', 'content-baseline']), # Added baseline
-            # Align Items
-            ('align_items', ['items-start', 'items-end', 'items-center', 'items-baseline', 'items-stretch']),
-            # Align Self
-            ('align_self', ['self-auto', 'self-start', 'self-end', 'self-center', 'self-stretch', 'self-baseline']), # Added baseline
-
-            # --- Border Width --- (Split sides)
-            ('border_width_all', ['border', 'border-0', 'border-2', 'border-4', 'border-8']), # General width first
-            ('border_width_t', ['border-t', 'border-t-0', 'border-t-2', 'border-t-4', 'border-t-8']),
-            ('border_width_r', ['border-r', 'border-r-0', 'border-r-2', 'border-r-4', 'border-r-8']),
-            ('border_width_b', ['border-b', 'border-b-0', 'border-b-2', 'border-b-4', 'border-b-8']),
-            ('border_width_l', ['border-l', 'border-l-0', 'border-l-2', 'border-l-4', 'border-l-8']),
-            # --- End Border Width ---
-
-            # Border Color (Needs care with opacity potentially)
-            ('border_color', ['border-']), # Keep general for now, might need split if opacity added (e.g., border-red-500 vs border-opacity-50)
-            # Border Style
-            ('border_style', ['border-solid', 'border-dashed', 'border-dotted', 'border-double', 'border-hidden', 'border-none']), # Added hidden
-            # Border Radius (Split corners/sides)
-            ('border_radius_tl', ['rounded-tl-']),
-            ('border_radius_tr', ['rounded-tr-']),
-            ('border_radius_br', ['rounded-br-']),
-            ('border_radius_bl', ['rounded-bl-']),
-            ('border_radius_t', ['rounded-t-']),
-            ('border_radius_r', ['rounded-r-']),
-            ('border_radius_b', ['rounded-b-']),
-            ('border_radius_l', ['rounded-l-']),
-            ('border_radius_all', ['rounded', 'rounded-']), # General 'rounded' and 'rounded-[size]'
-
-            # Opacity
-            ('opacity', ['opacity-']),
-             # Background Opacity (Conflicts with bg-color potentially, tricky) - Keep separate for now
-            ('bg_opacity', ['bg-opacity-']),
-             # Border Opacity
-            ('border_opacity', ['border-opacity-']),
-             # Text Opacity
-            ('text_opacity', ['text-opacity-']),
-             # Placeholder Color
-            ('placeholder_color', ['placeholder-']),
-
-
-            # Box Shadow
-            ('shadow', ['shadow']), # shadow-sm, shadow, shadow-md etc.
-
-            # Transition Property
-            ('transition', ['transition']), # transition-all, transition-colors, etc.
-            # Transition Duration
-            ('transition_duration', ['duration-']),
-            # Transition Timing Function
-            ('transition_timing', ['ease-']),
-            # Transition Delay
-            ('transition_delay', ['delay-']),
-
-            # Transform - Core enabling classes
-            ('transform_core', ['transform', 'transform-gpu', 'transform-none']),
-            # Scale
-            ('scale_all', ['scale-']),
-            ('scale_x', ['scale-x-']),
-            ('scale_y', ['scale-y-']),
-            # Rotate
-            ('rotate', ['rotate-']),
-            # Translate
-            ('translate_x', ['translate-x-']),
-            ('translate_y', ['translate-y-']),
-            # Skew
-            ('skew_x', ['skew-x-']),
-            ('skew_y', ['skew-y-']),
-            # Transform Origin
-            ('transform_origin', ['origin-']),
-
-
-            # --- Overflow --- (Split axes)
-            ('overflow_all', ['overflow-auto', 'overflow-hidden', 'overflow-visible', 'overflow-scroll']),
-            ('overflow_x', ['overflow-x-auto', 'overflow-x-hidden', 'overflow-x-visible', 'overflow-x-scroll']),
-            ('overflow_y', ['overflow-y-auto', 'overflow-y-hidden', 'overflow-y-visible', 'overflow-y-scroll']),
-             # --- End Overflow ---
-
-            # Whitespace
-            ('whitespace', ['whitespace-normal', 'whitespace-nowrap', 'whitespace-pre', 'whitespace-pre-line', 'whitespace-pre-wrap']),
-            # Word Break
-            ('word_break', ['break-normal', 'break-words', 'break-all']),
-            # Text Overflow
-            ('text_overflow', ['truncate', 'overflow-ellipsis', 'text-ellipsis', 'overflow-clip', 'text-clip']), # Added aliases
-
-            # Appearance
-            ('appearance', ['appearance-none']),
-            # Cursor
-            ('cursor', ['cursor-']),
-            # Pointer Events
-            ('pointer_events', ['pointer-events-none', 'pointer-events-auto']),
-            # Resize
-            ('resize', ['resize-none', 'resize-y', 'resize-x', 'resize']),
-            # User Select
-            ('user_select', ['select-none', 'select-text', 'select-all', 'select-auto']),
-        ]
-
-        # Precomputed prefix mapping for performance
-        self._prefix_mapping: Dict[str, str] = {}
-        self._exact_mapping: Dict[str, str] = {}
-        self._initialize_mappings()
-
-        # Regex pattern for dynamic arbitrary values
-        self._arbitrary_pattern = re.compile(r'^((?:[a-zA-Z0-9-]+(?:\[[^\]]+\])?:)*)?([a-zA-Z0-9-]+(?:-[a-zA-Z0-9]+)*)-\[([^\]]+)\]$')
-
-    def _initialize_mappings(self):
-        """Precompute mappings for better performance"""
-        self._prefix_mapping = {}
-        self._exact_mapping = {}
-        for group_name, prefixes_or_exact in self.groups:
-            for class_or_prefix in prefixes_or_exact:
+from .builder import MergedClasses
+from .instrumentation import MergeStats
+from .parallel import DEFAULT_CHUNKSIZE, DEFAULT_MIN_PARALLEL
+from .rulesets import RuleData, load_rule_data, section_key
+from .shared_cache import SharedCache
+from .tokenizer import ParsedClass, parse_class
+from .validators import Route, ValueType, check_value_types, describe, route
+from .variants import DEFAULT_EAGER_LIMIT, Variants
+
+
+# Parsed form of a single class token:
+# (modifiers, base class name, group, conflict key, conflict keys it overrides).
+# For grouped important classes, the modifiers end with '!' ('hover:!').
+# The conflict key is None for classes outside any group; see TailwindMerge._classify.
+_ClassInfo = Tuple[str, str, Optional[str], Any, Tuple[Any, ...]]
+
+# What `cn` accepts: class strings, {class string: condition} mappings, iterables of
+# these (nested to any depth), and None or booleans, which are skipped
+ClassValue = Union[str, None, bool, Mapping[str, Any], Iterable[Any]]
+
+# Conflict keys pack (modifier id << _GROUP_ID_BITS) | group id into one small int
+_GROUP_ID_BITS = 20
+# Distinct modifier combinations given an id per instance; any beyond fall back to tuple keys
+_MAX_MODIFIER_IDS = 1 << 16
+# Mapping entries a ruleset layers over its shared base mappings before add_rule
+# folds them into new ones (see _Ruleset.with_rule)
+_MAX_ADDED_ENTRIES = 64
+# Inputs iter_merge_many reads and classifies together
+DEFAULT_BATCH_CHUNKSIZE = 1000
+
+
+# Define conflict groups with ordered prefixes (more specific first).
+# Compiled once at import time and shared read-only by every TailwindMerge instance.
+DEFAULT_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+    (group_name, tuple(classes_or_prefixes)) for group_name, classes_or_prefixes in [
+        # Font Size (specific sizes)
+        ('font_size', [
+            'text-xs', 'text-sm', 'text-base',
+            'text-lg', 'text-xl', 'text-2xl',
+            'text-3xl', 'text-4xl', 'text-5xl',
+            'text-6xl', 'text-7xl', 'text-8xl', 'text-9xl'
+        ]),
+        # Text Color (catch-all 'text-' after specific font sizes)
+        ('text_color', ['text-']),
+        # Text Alignment
+        ('text_align', ['text-left', 'text-center', 'text-right', 'text-justify']),
+        # Text Decoration
+        ('text_decoration', ['underline', 'no-underline', 'line-through']),
+        # Text Transform
+        ('text_transform', ['uppercase', 'lowercase', 'capitalize', 'normal-case']),
+        # Font Family
+        ('font_family', ['font-sans', 'font-serif', 'font-mono']),
+        # Font Weight
+        ('font_weight', [
+            'font-thin', 'font-extralight',
+            'font-light', 'font-normal',
+            'font-medium', 'font-semibold',
+            'font-bold', 'font-extrabold',
+            'font-black'
+        ]),
+        # Font Style
+        ('font_style', ['italic', 'not-italic']),
+        # Letter Spacing
+        ('letter_spacing', ['tracking-']),
+        # Line Height
+        ('line_height', ['leading-']),
+
+        # Background Color
+        ('bg_color', ['bg-']),
+        # Background Position
+        ('bg_position', ['bg-bottom', 'bg-center', 'bg-left', 'bg-left-bottom',
+                        'bg-left-top', 'bg-right', 'bg-right-bottom',
+                        'bg-right-top', 'bg-top']),
+        # Background Size
+        ('bg_size', ['bg-auto', 'bg-cover', 'bg-contain']),
+        # Background Repeat
+        ('bg_repeat', ['bg-repeat', 'bg-no-repeat', 'bg-repeat-x',
+                      'bg-repeat-y', 'bg-repeat-round', 'bg-repeat-space']),
+        # Background Attachment
+        ('bg_attachment', ['bg-fixed', 'bg-local', 'bg-scroll']),
+        # Background Image (arbitrary images are routed here by DEFAULT_TYPED_PREFIXES)
+        ('bg_image', ['bg-none', 'bg-gradient-to-']),
+
+        # Width
+        ('width', ['w-']),
+        # Min Width
+        ('min_width', ['min-w-']),
+        # Max Width
+        ('max_width', ['max-w-']),
+
+        # Height
+        ('height', ['h-']),
+        # Min Height
+        ('min_height', ['min-h-']),
+        # Max Height
+        ('max_height', ['max-h-']),
+
+        # --- Margin --- (Split like padding for similar reasons)
+        ('margin_top', ['mt-']),
+        ('margin_right', ['mr-']),
+        ('margin_bottom', ['mb-']),
+        ('margin_left', ['ml-']),
+        ('margin_x', ['mx-']),
+        ('margin_y', ['my-']),
+        ('margin_all', ['m-']),
+        # Negative Margin (keep separate, maybe split further if needed)
+        ('negative_margin_top', ['-mt-']),
+        ('negative_margin_right', ['-mr-']),
+        ('negative_margin_bottom', ['-mb-']),
+        ('negative_margin_left', ['-ml-']),
+        ('negative_margin_x', ['-mx-']),
+        ('negative_margin_y', ['-my-']),
+        ('negative_margin_all', ['-m-']),
+        # --- End Margin ---
+
+        # --- Padding ---
+        # Order matters: More specific (sides) before less specific (axes/all)
+        ('padding_top', ['pt-']),
+        ('padding_right', ['pr-']),
+        ('padding_bottom', ['pb-']),
+        ('padding_left', ['pl-']),
+        # Axes conflict with respective sides and the 'all' padding
+        ('padding_x', ['px-']), # Conflicts with pl-, pr-, p-
+        ('padding_y', ['py-']), # Conflicts with pt-, pb-, p-
+        # General padding conflicts with all other padding types
+        ('padding_all', ['p-']),
+        # --- End Padding ---
+
+        # Display
+        ('display', [
+            'block', 'inline', 'inline-block',
+            'flex', 'inline-flex', 'grid',
+            'inline-grid', 'hidden', 'contents', 'table',
+            'inline-table', 'table-caption', 'table-cell',
+            'table-column', 'table-column-group', 'table-footer-group',
+            'table-header-group', 'table-row-group', 'table-row',
+            'flow-root',
+            'list-item'
+        ]),
+
+        # Position
+        ('position', ['static', 'fixed', 'absolute', 'relative', 'sticky']),
+        # Top, Right, Bottom, Left, Inset
+        ('inset_all', ['inset-']),
+        ('inset_x', ['inset-x-']),
+        ('inset_y', ['inset-y-']),
+        ('top', ['top-']),
+        ('right', ['right-']),
+        ('bottom', ['bottom-']),
+        ('left', ['left-']),
+
+        # Z-Index
+        ('z_index', ['z-']),
+
+        # Flex Direction
+        ('flex_direction', ['flex-row', 'flex-row-reverse', 'flex-col', 'flex-col-reverse']),
+        # Flex Wrap
+        ('flex_wrap', ['flex-wrap', 'flex-wrap-reverse', 'flex-nowrap']),
+        # Flex Grow
+        ('flex_grow', ['flex-grow', 'grow', 'grow-0']), # Added 'grow' alias
+        # Flex Shrink
+        ('flex_shrink', ['flex-shrink', 'shrink', 'shrink-0']), # Added 'shrink' alias
+        # Flex
+        ('flex', ['flex-1', 'flex-auto', 'flex-initial', 'flex-none']), # flex- is ambiguous now with direction etc. use specifics
+        # Flex Basis
+        ('flex_basis', ['basis-']),
+        # Order
+        ('order', ['order-']),
+
+        # Grid Template Columns
+        ('grid_template_cols', ['grid-cols-']),
+        # Grid Column Start / End / Span
+        ('grid_col_start', ['col-start-']),
+        ('grid_col_end', ['col-end-']),
+        ('grid_col_span', ['col-span-']), # Should conflict start/end conceptually, but often used together. Separate group ok.
+        ('grid_col_auto', ['col-auto']), # Specific col span
+        # Grid Template Rows
+        ('grid_template_rows', ['grid-rows-']),
+        # Grid Row Start / End / Span
+        ('grid_row_start', ['row-start-']),
+        ('grid_row_end', ['row-end-']),
+        ('grid_row_span', ['row-span-']), # See col-span note
+        ('grid_row_auto', ['row-auto']), # Specific row span
+         # Grid Auto Flow
+        ('grid_auto_flow', ['grid-flow-row', 'grid-flow-col', 'grid-flow-dense', 'grid-flow-row-dense', 'grid-flow-col-dense']), # Added 'dense' combinations
+        # Grid Auto Columns
+        ('grid_auto_cols', ['auto-cols-']),
+        # Grid Auto Rows
+        ('grid_auto_rows', ['auto-rows-']),
+        # Gap (Split like padding)
+        ('gap_all', ['gap-']),
+        ('gap_x', ['gap-x-']),
+        ('gap_y', ['gap-y-']),
+
+        # Justify Content
+        ('justify_content', ['justify-start', 'justify-end', 'justify-center', 'justify-between', 'justify-around', 'justify-evenly']),
+        # Justify Items
+        ('justify_items', ['justify-items-start', 'justify-items-end', 'justify-items-center', 'justify-items-stretch']),
+        # Justify Self
+        ('justify_self', ['justify-self-auto', 'justify-self-start', 'justify-self-end', 'justify-self-center', 'justify-self-stretch']),
+        # Align Content
+        ('align_content', ['content-center', 'content-start', 'content-end', 'content-between', 'content-around', 'content-evenly', 'content-baseline']), # Added baseline
+        # Align Items
+        ('align_items', ['items-start', 'items-end', 'items-center', 'items-baseline', 'items-stretch']),
+        # Align Self
+        ('align_self', ['self-auto', 'self-start', 'self-end', 'self-center', 'self-stretch', 'self-baseline']), # Added baseline
+
+        # --- Border Width --- (Split sides)
+        ('border_width_all', ['border', 'border-0', 'border-2', 'border-4', 'border-8']), # General width first
+        ('border_width_t', ['border-t', 'border-t-0', 'border-t-2', 'border-t-4', 'border-t-8']),
+        ('border_width_r', ['border-r', 'border-r-0', 'border-r-2', 'border-r-4', 'border-r-8']),
+        ('border_width_b', ['border-b', 'border-b-0', 'border-b-2', 'border-b-4', 'border-b-8']),
+        ('border_width_l', ['border-l', 'border-l-0', 'border-l-2', 'border-l-4', 'border-l-8']),
+        # --- End Border Width ---
+
+        # Border Color (Needs care with opacity potentially)
+        ('border_color', ['border-']), # Keep general for now, might need split if opacity added (e.g., border-red-500 vs border-opacity-50)
+        # Border Style
+        ('border_style', ['border-solid', 'border-dashed', 'border-dotted', 'border-double', 'border-hidden', 'border-none']), # Added hidden
+        # Border Radius (Split corners/sides)
+        ('border_radius_tl', ['rounded-tl-']),
+        ('border_radius_tr', ['rounded-tr-']),
+        ('border_radius_br', ['rounded-br-']),
+        ('border_radius_bl', ['rounded-bl-']),
+        ('border_radius_t', ['rounded-t-']),
+        ('border_radius_r', ['rounded-r-']),
+        ('border_radius_b', ['rounded-b-']),
+        ('border_radius_l', ['rounded-l-']),
+        ('border_radius_all', ['rounded', 'rounded-']), # General 'rounded' and 'rounded-[size]'
+
+        # Opacity
+        ('opacity', ['opacity-']),
+         # Background Opacity (Conflicts with bg-color potentially, tricky) - Keep separate for now
+        ('bg_opacity', ['bg-opacity-']),
+         # Border Opacity
+        ('border_opacity', ['border-opacity-']),
+         # Text Opacity
+        ('text_opacity', ['text-opacity-']),
+         # Placeholder Color
+        ('placeholder_color', ['placeholder-']),
+
+
+        # Box Shadow
+        ('shadow', ['shadow']), # shadow-sm, shadow, shadow-md etc.
+
+        # Transition Property
+        ('transition', ['transition']), # transition-all, transition-colors, etc.
+        # Transition Duration
+        ('transition_duration', ['duration-']),
+        # Transition Timing Function
+        ('transition_timing', ['ease-']),
+        # Transition Delay
+        ('transition_delay', ['delay-']),
+
+        # Transform - Core enabling classes
+        ('transform_core', ['transform', 'transform-gpu', 'transform-none']),
+        # Scale
+        ('scale_all', ['scale-']),
+        ('scale_x', ['scale-x-']),
+        ('scale_y', ['scale-y-']),
+        # Rotate
+        ('rotate', ['rotate-']),
+        # Translate
+        ('translate_x', ['translate-x-']),
+        ('translate_y', ['translate-y-']),
+        # Skew
+        ('skew_x', ['skew-x-']),
+        ('skew_y', ['skew-y-']),
+        # Transform Origin
+        ('transform_origin', ['origin-']),
+
+
+        # --- Overflow --- (Split axes)
+        ('overflow_all', ['overflow-auto', 'overflow-hidden', 'overflow-visible', 'overflow-scroll']),
+        ('overflow_x', ['overflow-x-auto', 'overflow-x-hidden', 'overflow-x-visible', 'overflow-x-scroll']),
+        ('overflow_y', ['overflow-y-auto', 'overflow-y-hidden', 'overflow-y-visible', 'overflow-y-scroll']),
+         # --- End Overflow ---
+
+        # Whitespace
+        ('whitespace', ['whitespace-normal', 'whitespace-nowrap', 'whitespace-pre', 'whitespace-pre-line', 'whitespace-pre-wrap']),
+        # Word Break
+        ('word_break', ['break-normal', 'break-words', 'break-all']),
+        # Text Overflow
+        ('text_overflow', ['truncate', 'overflow-ellipsis', 'text-ellipsis', 'overflow-clip', 'text-clip']), # Added aliases
+
+        # Appearance
+        ('appearance', ['appearance-none']),
+        # Cursor
+        ('cursor', ['cursor-']),
+        # Pointer Events
+        ('pointer_events', ['pointer-events-none', 'pointer-events-auto']),
+        # Resize
+        ('resize', ['resize-none', 'resize-y', 'resize-x', 'resize']),
+        # User Select
+        ('user_select', ['select-none', 'select-text', 'select-all', 'select-auto']),
+    ]
+)
+
+
+# Groups that conflict across group boundaries: a later class of the key group removes
+# earlier classes of the listed groups (with the same modifiers), e.g. 'px-2 pl-4 p-0' -> 'p-0'.
+# The relation is directional ('p-0 px-2' keeps both) and applied transitively.
+DEFAULT_CONFLICTS: Dict[str, Tuple[str, ...]] = {
+    'padding_all': ('padding_x', 'padding_y', 'padding_top', 'padding_right', 'padding_bottom', 'padding_left'),
+    'padding_x': ('padding_left', 'padding_right'),
+    'padding_y': ('padding_top', 'padding_bottom'),
+    'margin_all': ('margin_x', 'margin_y', 'margin_top', 'margin_right', 'margin_bottom', 'margin_left',
+                   'negative_margin_all'),
+    'margin_x': ('margin_left', 'margin_right', 'negative_margin_x'),
+    'margin_y': ('margin_top', 'margin_bottom', 'negative_margin_y'),
+    'margin_top': ('negative_margin_top',),
+    'margin_right': ('negative_margin_right',),
+    'margin_bottom': ('negative_margin_bottom',),
+    'margin_left': ('negative_margin_left',),
+    # Negative margins set the same properties as their positive counterparts
+    'negative_margin_all': ('margin_all',),
+    'negative_margin_x': ('margin_x',),
+    'negative_margin_y': ('margin_y',),
+    'negative_margin_top': ('margin_top',),
+    'negative_margin_right': ('margin_right',),
+    'negative_margin_bottom': ('margin_bottom',),
+    'negative_margin_left': ('margin_left',),
+    'inset_all': ('inset_x', 'inset_y', 'top', 'right', 'bottom', 'left'),
+    'inset_x': ('left', 'right'),
+    'inset_y': ('top', 'bottom'),
+    'gap_all': ('gap_x', 'gap_y'),
+    'border_width_all': ('border_width_t', 'border_width_r', 'border_width_b', 'border_width_l'),
+    'border_radius_all': ('border_radius_t', 'border_radius_r', 'border_radius_b', 'border_radius_l',
+                          'border_radius_tl', 'border_radius_tr', 'border_radius_br', 'border_radius_bl'),
+    'border_radius_t': ('border_radius_tl', 'border_radius_tr'),
+    'border_radius_r': ('border_radius_tr', 'border_radius_br'),
+    'border_radius_b': ('border_radius_br', 'border_radius_bl'),
+    'border_radius_l': ('border_radius_tl', 'border_radius_bl'),
+    'overflow_all': ('overflow_x', 'overflow_y'),
+    'scale_all': ('scale_x', 'scale_y'),
+}
+
+
+# Prefixes whose arbitrary values belong to different groups depending on the value's
+# type (see validators.py): 'text-[14px]' is a font size, 'text-[#f00]' a text color.
+# Routes are tried in order; a value matching none goes to the prefix's own group.
+DEFAULT_TYPED_PREFIXES: Dict[str, Tuple[Route, ...]] = {
+    'text-': (('length', 'font_size'),),
+    'bg-': (('image', 'bg_image'), ('percentage', 'bg_position'), ('length', 'bg_size')),
+    'border-': (('length', 'border_width_all'),),
+    'border-t-': (('length', 'border_width_t'),),
+    'border-r-': (('length', 'border_width_r'),),
+    'border-b-': (('length', 'border_width_b'),),
+    'border-l-': (('length', 'border_width_l'),),
+}
+
+
+def _compile_mappings(groups) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Split group definitions into a prefix mapping and an exact class mapping."""
+    prefix_mapping: Dict[str, str] = {}
+    exact_mapping: Dict[str, str] = {}
+    for group_name, prefixes_or_exact in groups:
+        for class_or_prefix in prefixes_or_exact:
+            if class_or_prefix.endswith('-'):
+                # It's a prefix
+                prefix_mapping[class_or_prefix] = group_name
+            else:
+                # It's an exact class name
+                exact_mapping[class_or_prefix] = group_name
+    return prefix_mapping, exact_mapping
+
+
+def _compile_group_ids(groups) -> Dict[str, int]:
+    """Number the groups in order of first appearance."""
+    group_ids: Dict[str, int] = {}
+    for group_name, _ in groups:
+        group_ids.setdefault(group_name, len(group_ids))
+    return group_ids
+
+
+def _compile_overrides(group_ids: Dict[str, int], conflicts: Dict[str, Tuple[str, ...]]) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Compile declared conflicts into an adjacency table indexed by group id: entry `i`
+    holds the ids of every group that group `i` overrides, directly or transitively.
+    """
+    direct: List[Set[int]] = [set() for _ in group_ids]
+    for group_name, overridden in conflicts.items():
+        for other in overridden:
+            direct[group_ids[group_name]].add(group_ids[other])
+
+    overrides = []
+    for group_id in range(len(group_ids)):
+        reachable: Set[int] = set()
+        pending = list(direct[group_id])
+        while pending:
+            other = pending.pop()
+            if other not in reachable:
+                reachable.add(other)
+                pending.extend(direct[other])
+        reachable.discard(group_id)
+        overrides.append(tuple(sorted(reachable)))
+    return tuple(overrides)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_rule_data(data: RuleData) -> Tuple[Dict[str, int], Tuple[Tuple[int, ...], ...]]:
+    """Group ids and compiled conflicts of a data file, shared by every instance using it."""
+    group_ids = {group_name: group_id for group_id, group_name in enumerate(data.group_names)}
+    return group_ids, _compile_overrides(group_ids, data.conflicts)
+
+
+# Mappings for DEFAULT_GROUPS. Never mutated: add_rule works on copies.
+_DEFAULT_PREFIX_MAPPING, _DEFAULT_EXACT_MAPPING = _compile_mappings(DEFAULT_GROUPS)
+_DEFAULT_GROUP_IDS = _compile_group_ids(DEFAULT_GROUPS)
+_DEFAULT_OVERRIDES = _compile_overrides(_DEFAULT_GROUP_IDS, DEFAULT_CONFLICTS)
+
+
+def _collect_class_lists(values: Iterable[ClassValue], class_lists: List[str]) -> None:
+    """Append the class strings that `cn` keeps from `values` to `class_lists`, in order."""
+    for value in values:
+        # Exact type checks first: the ABC isinstance checks below are far slower
+        value_type = value.__class__
+        if value_type is str:
+            if value:
+                class_lists.append(value)
+        elif value is None or value_type is bool:
+            continue
+        elif value_type is dict:
+            for class_str, condition in value.items():
+                if condition and class_str:
+                    class_lists.append(class_str)
+        elif value_type is list or value_type is tuple:
+            _collect_class_lists(value, class_lists)
+        elif isinstance(value, str):
+            if value:
+                class_lists.append(value)
+        elif isinstance(value, Mapping):
+            class_lists.extend(class_str for class_str, condition in value.items() if condition and class_str)
+        elif isinstance(value, Iterable):
+            _collect_class_lists(value, class_lists)
+        else:
+            raise TypeError(f"Expected class strings, mappings or iterables, got {type(value).__name__}")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for the merge result cache, as returned by `TailwindMerge.cache_info()`."""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _Ruleset:
+    """
+    One immutable version of an instance's rules, plus the caches derived from it.
+
+    A published ruleset is never mutated: add_rule builds a new one and swaps it in
+    with a single attribute assignment. A merge reads the instance's ruleset once and
+    uses it throughout, so concurrent merges never lock and never see partial state.
+    The caches belong to the ruleset, so results computed against old rules can only
+    ever land in the old (discarded) caches.
+    """
+    __slots__ = (
+        'groups', 'base_prefixes', 'added_prefixes', 'base_exact', 'added_exact', 'group_ids',
+        'conflicts', 'overrides',
+        'typed_prefixes', 'data', 'loaded_sections', 'section_lock', 'classifier',
+        'modifier_ids', 'modifier_names', 'modifier_lock', 'token_cache', 'result_cache',
+        '_rules_fingerprint', '_fingerprint',
+    )
+
+    def __init__(
+        self,
+        groups: Tuple[Tuple[str, Tuple[str, ...]], ...],
+        prefix_mapping: Dict[str, str],
+        exact_mapping: Dict[str, str],
+        group_ids: Dict[str, int],
+        conflicts: Dict[str, Tuple[str, ...]],
+        overrides: Tuple[Tuple[int, ...], ...],
+        use_result_cache: bool,
+        data: Optional[RuleData] = None,
+        loaded_sections: Iterable[str] = (),
+        classifier: Optional[Callable[[str, Optional[str], Optional[str]], Optional[str]]] = None,
+        typed_prefixes: Optional[Dict[str, Tuple[Route, ...]]] = None,
+        added_prefixes: Optional[Dict[str, str]] = None,
+        added_exact: Optional[Dict[str, str]] = None,
+        section_lock: Optional[threading.Lock] = None,
+    ):
+        self.groups = groups
+        # Base mappings shared with the rulesets this one was derived from, and the entries
+        # added since they were last folded in (see with_rule), which lookups try first.
+        # That way add_rule never copies the whole mappings.
+        self.base_prefixes = prefix_mapping
+        self.added_prefixes: Dict[str, str] = added_prefixes or {}
+        self.base_exact = exact_mapping
+        self.added_exact: Dict[str, str] = added_exact or {}
+        # Compact integer id per group name, used to build conflict keys
+        self.group_ids = group_ids
+        # Declared cross-group conflicts, and their compiled form (see _compile_overrides)
+        self.conflicts = conflicts
+        self.overrides = overrides
+        # Prefix -> routes for its arbitrary values by value type (see validators.py)
+        self.typed_prefixes: Dict[str, Tuple[Route, ...]] = typed_prefixes or {}
+        # Full Tailwind rules are merged into the mappings one section at a time, on the
+        # first lookup that needs it (see load_section). Filling them in is idempotent and
+        # never replaces an entry, so rules added with add_rule keep precedence. Rulesets
+        # sharing the base mappings (given a `section_lock`) share what was loaded into them.
+        self.data = data
+        self.loaded_sections: Set[str] = set(loaded_sections) if section_lock is None else loaded_sections
+        self.section_lock = section_lock or threading.Lock()
+        # The `get_group` of a classifier module generated from exactly these rules (see
+        # codegen.py), used instead of TailwindMerge._get_group when set
+        self.classifier = classifier
+        # Interned modifier combinations ('hover:focus:'): string -> id and id -> string.
+        # They live next to the token cache because cached conflict keys embed their ids.
+        self.modifier_ids: Dict[str, int] = {'': 0}
+        self.modifier_names: List[str] = ['']
+        self.modifier_lock = threading.Lock()
+        self.token_cache: "OrderedDict[str, _ClassInfo]" = OrderedDict()
+        self.result_cache: Optional["OrderedDict[Tuple[str, ...], str]"] = (
+            OrderedDict() if use_result_cache else None
+        )
+        self._rules_fingerprint: Optional[bytes] = None
+        self._fingerprint: Optional[bytes] = None
+
+    @property
+    def prefix_mapping(self) -> "ChainMap[str, str]":
+        """Every prefix -> group entry, as one (slow) mapping."""
+        return ChainMap(self.added_prefixes, self.base_prefixes)
+
+    @property
+    def exact_mapping(self) -> "ChainMap[str, str]":
+        """Every exact class -> group entry, as one (slow) mapping."""
+        return ChainMap(self.added_exact, self.base_exact)
+
+    def rules_fingerprint(self) -> bytes:
+        """
+        8 bytes identifying the rules alone: a hash of the data file and every group,
+        conflict and typed prefix. Generated classifiers record it (see codegen.py), so
+        they stay valid across library versions as long as the rules don't change.
+        """
+        if self._rules_fingerprint is None:
+            digest = hashlib.sha256()
+            if self.data is not None:
+                digest.update(self.data.digest())
+            typed_prefixes = sorted(
+                (prefix, tuple((describe(value_type), group) for value_type, group in routes))
+                for prefix, routes in self.typed_prefixes.items()
+            )
+            digest.update(repr((self.groups, sorted(self.conflicts.items()), typed_prefixes)).encode('utf-8'))
+            self._rules_fingerprint = digest.digest()[:8]
+        return self._rules_fingerprint
+
+    def fingerprint(self) -> bytes:
+        """
+        8 bytes identifying the rules and the library version, for merge results and
+        classifications shared beyond this ruleset (SharedCache entries, snapshots),
+        which another version may compute differently.
+        """
+        if self._fingerprint is None:
+            from . import __version__
+
+            digest = hashlib.sha256(__version__.encode('utf-8'))
+            digest.update(self.rules_fingerprint())
+            self._fingerprint = digest.digest()[:8]
+        return self._fingerprint
+
+    def __reduce__(self):
+        # Pickle the rules only; the copy starts with empty caches and modifier ids. The
+        # classifier goes by its module's name, as a module loaded from a file path can't
+        # be pickled by reference (see _restore_ruleset).
+        classifier = self.classifier
+        with self.section_lock:
+            return (_restore_ruleset, ((
+                self.groups, dict(self.prefix_mapping), dict(self.exact_mapping), self.group_ids,
+                self.conflicts, self.overrides, self.result_cache is not None,
+                self.data, set(self.loaded_sections), None, self.typed_prefixes,
+            ), classifier.__module__ if classifier is not None else None))
+
+    def load_section(self, class_name: str) -> None:
+        """Make sure the data section that `class_name` would be found in is in the mappings."""
+        key = section_key(class_name)
+        if key in self.loaded_sections or key not in self.data.sections:
+            return
+        with self.section_lock:
+            if key in self.loaded_sections:
+                return
+            # Into the base mappings, where the added entries layered over them still win
+            prefix_mapping = self.base_prefixes
+            exact_mapping = self.base_exact
+            for class_or_prefix, group_name in self.data.section(key):
                 if class_or_prefix.endswith('-'):
-                    # It's a prefix
-                    self._prefix_mapping[class_or_prefix] = group_name
+                    prefix_mapping.setdefault(class_or_prefix, group_name)
                 else:
-                    # It's an exact class name
-                    self._exact_mapping[class_or_prefix] = group_name
+                    exact_mapping.setdefault(class_or_prefix, group_name)
+            # Only mark the section once it is complete; readers skip the lock after that
+            self.loaded_sections.add(key)
+
+    def intern_modifiers(self, modifiers: str) -> Tuple[str, Optional[int]]:
+        """
+        Return the canonical string object and the id for a modifier combination,
+        registering it if new. Past _MAX_MODIFIER_IDS combinations, returns a None id.
+        """
+        modifier_id = self.modifier_ids.get(modifiers)
+        if modifier_id is None:
+            with self.modifier_lock:
+                modifier_id = self.modifier_ids.get(modifiers)
+                if modifier_id is None:
+                    if len(self.modifier_names) >= _MAX_MODIFIER_IDS:
+                        return modifiers, None
+                    modifier_id = len(self.modifier_names)
+                    # Publish the name before the id, so any id a reader sees has a name
+                    self.modifier_names.append(modifiers)
+                    self.modifier_ids[modifiers] = modifier_id
+        return self.modifier_names[modifier_id], modifier_id
+
+    def class_info(self, modifiers: str, base_class_name: str, group: str) -> _ClassInfo:
+        """
+        Build the parsed form of a class in `group`, with `modifiers` already marked
+        important ('hover:!') where needed.
+        """
+        # The conflict key combines modifiers and group, so 'hover:pl-2' and 'pl-2'
+        # don't conflict. Both are small ints, packed into one int.
+        modifiers, modifier_id = self.intern_modifiers(modifiers)
+        group_id = self.group_ids[group]
+        overridden = self.overrides[group_id]
+        if modifier_id is not None and len(self.group_ids) <= 1 << _GROUP_ID_BITS:
+            shifted = modifier_id << _GROUP_ID_BITS
+            return (
+                modifiers, base_class_name, group, shifted | group_id,
+                tuple(shifted | other for other in overridden),
+            )
+        return (
+            modifiers, base_class_name, group, (modifiers, group_id),
+            tuple((modifiers, other) for other in overridden),
+        )
+
+    def with_rule(
+        self,
+        category: str,
+        classes_or_prefixes: List[str],
+        conflicts: Iterable[str] = (),
+        value_types: Iterable[ValueType] = (),
+    ) -> "_Ruleset":
+        """Return a copy of this ruleset with one more group (copy-on-write)."""
+        value_types = tuple(value_types)
+        check_value_types(value_types)
+        typed_prefixes = self.typed_prefixes
+        if value_types:
+            typed_prefixes = dict(typed_prefixes)
+            if self.data is not None:
+                # Typed prefixes keep the group the full ruleset gives them, so it must be loaded
+                for item in classes_or_prefixes:
+                    self.load_section(item)
+
+        # Only the entries added since the last fold are copied; the base mappings are shared
+        prefix_mapping = self.base_prefixes
+        exact_mapping = self.base_exact
+        added_prefixes = dict(self.added_prefixes)
+        added_exact = dict(self.added_exact)
+        for item in classes_or_prefixes:
+            if item.endswith('-') and value_types:
+                # Only arbitrary values of these types are routed to the new group; the
+                # prefix keeps its existing group, if any, for everything else
+                typed_prefixes[item] = (
+                    tuple((value_type, category) for value_type in value_types)
+                    + typed_prefixes.get(item, ())
+                )
+                if item not in added_prefixes and item not in prefix_mapping:
+                    added_prefixes[item] = category
+            elif item.endswith('-'):
+                # Check if prefix already exists and warn or decide overwrite policy
+                # if item in prefix_mapping and prefix_mapping[item] != category:
+                #     print(f"Warning: Overwriting prefix '{item}' group '{prefix_mapping[item]}' with '{category}'")
+                added_prefixes[item] = category
+            else:
+                # Check if exact match already exists
+                # if item in exact_mapping and exact_mapping[item] != category:
+                #     print(f"Warning: Overwriting exact match '{item}' group '{exact_mapping[item]}' with '{category}'")
+                added_exact[item] = category
+
+        loaded_sections = self.loaded_sections
+        section_lock: Optional[threading.Lock] = self.section_lock
+        if len(added_prefixes) + len(added_exact) > _MAX_ADDED_ENTRIES:
+            # Fold the added entries into new base mappings, so that copying them stays
+            # cheap: each fold copies the mappings once per _MAX_ADDED_ENTRIES entries
+            with self.section_lock:
+                prefix_mapping = {**prefix_mapping, **added_prefixes}
+                exact_mapping = {**exact_mapping, **added_exact}
+                loaded_sections = set(loaded_sections)
+            added_prefixes, added_exact, section_lock = {}, {}, None
+        group_ids = self.group_ids
+        if category not in group_ids:
+            group_ids = dict(group_ids)
+            group_ids[category] = len(group_ids)
+
+        declared = self.conflicts
+        overrides = self.overrides
+        conflicts = tuple(conflicts)
+        if conflicts:
+            unknown = [group_name for group_name in conflicts if group_name not in group_ids]
+            if unknown:
+                raise ValueError(f"Unknown conflict group(s) for '{category}': {', '.join(unknown)}")
+            declared = dict(declared)
+            declared[category] = tuple(dict.fromkeys(declared.get(category, ()) + conflicts))
+            overrides = _compile_overrides(group_ids, declared)
+        elif len(group_ids) != len(overrides):
+            # A new group without conflicts overrides nothing, and no existing group can
+            # override it yet, so the compiled table only needs an empty entry for it
+            overrides = overrides + ((),)
+
+        return _Ruleset(
+            self.groups + ((category, tuple(classes_or_prefixes)),),
+            prefix_mapping,
+            exact_mapping,
+            group_ids,
+            declared,
+            overrides,
+            self.result_cache is not None,
+            self.data,
+            loaded_sections,
+            typed_prefixes=typed_prefixes,
+            added_prefixes=added_prefixes,
+            added_exact=added_exact,
+            section_lock=section_lock,
+        )
+
+
+def _restore_ruleset(args: Tuple[Any, ...], classifier_module: Optional[str]) -> _Ruleset:
+    """
+    Unpickle a ruleset, using the classifier module named `classifier_module` if it can be
+    imported here and was generated from these rules; otherwise the interpreted lookup.
+    """
+    rules = _Ruleset(*args)
+    if classifier_module is not None:
+        try:
+            module = importlib.import_module(classifier_module)
+        except ImportError:
+            return rules
+        if getattr(module, 'FINGERPRINT', None) == rules.rules_fingerprint():
+            rules.classifier = module.get_group
+    return rules
+
+
+class TailwindMerge:
+    def __init__(
+        self,
+        cache_size: Optional[int] = 1024,
+        token_cache_size: Optional[int] = 8192,
+        version: Optional[Union[str, int]] = None,
+        shared_cache: Optional[SharedCache] = None,
+    ):
+        """
+        `cache_size` bounds the LRU cache of merge results, keyed on the exact
+        arguments passed to `merge`. Pass `None` or `0` to disable caching.
+        `token_cache_size` bounds the memo of parsed class tokens shared by all
+        merge calls. Pass `None` or `0` to disable it.
+        `version` selects the full Tailwind ruleset for that major version (3 or 4),
+        loaded lazily from the package data. By default, the built-in DEFAULT_GROUPS
+        are used.
+        `shared_cache` adds a `SharedCache`, a result cache shared by every process on
+        the host, consulted when a merge misses the per-instance cache.
+        """
+        # LRU cache of merge results: argument tuple -> merged string
+        if cache_size is not None and cache_size < 0:
+            raise ValueError("cache_size must be a non-negative integer or None")
+        self._cache_size = cache_size or 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
+        # Memo of parsed class tokens: token -> (modifiers, base class name, group, group key)
+        if token_cache_size is not None and token_cache_size < 0:
+            raise ValueError("token_cache_size must be a non-negative integer or None")
+        self._token_cache_size = token_cache_size or 0
+        self._shared_cache = shared_cache
+
+        if version is None:
+            # Share the precompiled default ruleset; add_rule publishes a copy
+            self._rules = _Ruleset(
+                DEFAULT_GROUPS, _DEFAULT_PREFIX_MAPPING, _DEFAULT_EXACT_MAPPING, _DEFAULT_GROUP_IDS,
+                DEFAULT_CONFLICTS, _DEFAULT_OVERRIDES, bool(self._cache_size),
+                typed_prefixes=DEFAULT_TYPED_PREFIXES,
+            )
+        else:
+            # Only the header is read here; sections are loaded as classes need them
+            data = load_rule_data(str(version))
+            group_ids, overrides = _compile_rule_data(data)
+            self._rules = _Ruleset(
+                (), {}, {}, group_ids, data.conflicts, overrides, bool(self._cache_size), data,
+                typed_prefixes=data.typed_prefixes,
+            )
+        # Serializes add_rule calls; merges never take it
+        self._write_lock = threading.Lock()
+
+        # Opt-in instrumentation, see enable_instrumentation()
+        self._stats: Optional[MergeStats] = None
+
+    # Views of the current ruleset
+    @property
+    def groups(self) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        rules = self._rules
+        if rules.data is not None:
+            # Loads every section of the data file
+            return rules.data.load_groups() + rules.groups
+        return rules.groups
+
+    @property
+    def _prefix_mapping(self) -> "ChainMap[str, str]":
+        return self._rules.prefix_mapping
+
+    @property
+    def _exact_mapping(self) -> "ChainMap[str, str]":
+        return self._rules.exact_mapping
+
+    @property
+    def _token_cache(self) -> "OrderedDict[str, _ClassInfo]":
+        return self._rules.token_cache
+
+    @property
+    def _cache(self) -> Optional["OrderedDict[Tuple[str, ...], str]"]:
+        return self._rules.result_cache
 
     def merge(self, *class_lists: str) -> str:
         """
         Merge Tailwind classes, resolving conflicts by keeping the last occurrence
         in each group. Handles modifiers like hover: etc.
         """
-        # Flatten, split, and filter empty classes
+        # Read the ruleset once, so the whole call sees a single consistent version
+        rules = self._rules
+        cache = rules.result_cache
+        if cache is None:
+            if self._shared_cache is not None:
+                return self._merge_shared(class_lists, rules)
+            return self._merge(class_lists, rules)
+
+        # Other threads may evict concurrently, so every step tolerates a missing key
+        try:
+            result = cache[class_lists]
+            cache.move_to_end(class_lists)
+        except KeyError:
+            pass
+        else:
+            self._cache_hits += 1
+            if self._stats is not None:
+                self._stats.result_cache_hits += 1
+            return result
+
+        self._cache_misses += 1
+        if self._shared_cache is not None:
+            result = self._merge_shared(class_lists, rules)
+        else:
+            result = self._merge(class_lists, rules)
+        cache[class_lists] = result
+        if len(cache) > self._cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+            else:
+                self._cache_evictions += 1
+        return result
+
+    def cn(self, *inputs: ClassValue) -> str:
+        """
+        Merge clsx-style inputs: class strings, `{class string: condition}` mappings
+        (a class is kept when its condition is truthy), lists, tuples and other
+        iterables of these at any depth, and None or False, which are skipped.
+
+            twm.cn("px-4 py-2", {"bg-blue-500": primary, "opacity-50": disabled}, extra)
+
+        The inputs are flattened into the tuple of class strings that are kept, without
+        joining them, and merged with `merge`, which caches on that tuple. Calls that
+        keep the same classes share a cache entry whatever their conditions were.
+        """
+        for value in inputs:
+            if value.__class__ is not str:
+                break
+        else:
+            return self.merge(*inputs)
+        class_lists: List[str] = []
+        _collect_class_lists(inputs, class_lists)
+        return self.merge(*class_lists)
+
+    def builder(self, *class_lists: str) -> MergedClasses:
+        """
+        Start an incremental merge of `class_lists`. More classes can be merged into the
+        returned `MergedClasses` with `.add()`, classifying only the new tokens, and
+        `.copy()` branches it cheaply; `str()` gives the same result as `merge` on all
+        the class strings added so far.
+        """
+        return MergedClasses(self, self._rules).add(*class_lists)
+
+    def variants(
+        self,
+        base: str,
+        axes: Mapping[str, Mapping[Hashable, str]],
+        defaults: Optional[Mapping[str, Hashable]] = None,
+        eager_limit: int = DEFAULT_EAGER_LIMIT,
+    ) -> Variants:
+        """
+        Define a component's classes by variant, like JavaScript's cva:
+
+            button = twm.variants(
+                "inline-flex rounded px-4 py-2",
+                {"size": {"sm": "px-2 py-1 text-sm", "lg": "px-6 py-3"},
+                 "intent": {"primary": "bg-blue-500 text-white", "danger": "bg-red-500"}},
+                defaults={"size": "sm"},
+            )
+            button(intent="primary")           # dict lookup after the first merge
+            button("mt-2", size="lg")          # extra classes merged on top
+
+        Every combination of options is merged once: up front if there are at most
+        `eager_limit` combinations, otherwise lazily on first use. See `Variants`.
+        """
+        return Variants(self, base, axes, defaults, eager_limit)
+
+    def enable_instrumentation(
+        self, callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> MergeStats:
+        """
+        Start counting lookup paths, cache hits and tokens, and timing merge phases.
+        `callback`, if given, receives a dict for every merge that is not served from
+        the result cache. Returns the `MergeStats` collecting the numbers.
+        """
+        self._stats = MergeStats(callback)
+        return self._stats
+
+    def disable_instrumentation(self) -> None:
+        """Stop collecting instrumentation; merges go back to the uninstrumented path."""
+        self._stats = None
+
+    def instrumentation_snapshot(self) -> Dict[str, Any]:
+        """Current instrumentation counters as a flat dict (empty if instrumentation is off)."""
+        return self._stats.snapshot() if self._stats is not None else {}
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report hits, misses and evictions of the merge result cache. The counters
+        are not synchronized, so they are approximate under concurrent merging.
+        """
+        cache = self._rules.result_cache
+        return CacheInfo(
+            hits=self._cache_hits,
+            misses=self._cache_misses,
+            evictions=self._cache_evictions,
+            maxsize=self._cache_size,
+            currsize=len(cache) if cache is not None else 0,
+        )
+
+    def cache_clear(self) -> None:
+        """Drop all cached merge results and reset the statistics."""
+        cache = self._rules.result_cache
+        if cache is not None:
+            cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
+    def merge_many(self, batch: Iterable[Union[str, Tuple[str, ...]]]) -> List[str]:
+        """
+        Merge a batch of inputs, each a tuple of `merge` arguments (or a single string).
+        Returns the results in input order. See `iter_merge_many`.
+        """
+        return list(self.iter_merge_many(batch))
+
+    def iter_merge_many(
+        self, batch: Iterable[Union[str, Tuple[str, ...]]], chunksize: int = DEFAULT_BATCH_CHUNKSIZE
+    ) -> Iterator[str]:
+        """
+        Generator variant of `merge_many`, yielding results in input order.
+
+        The batch is read `chunksize` inputs at a time, so memory stays bounded however
+        long it is. Within a chunk, every distinct class token is classified once into a
+        shared table, then each input is resolved against it, and repeated inputs are
+        resolved once. The merge result cache is bypassed.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        iterator = iter(batch)
+        rules = self._rules
+        token_cache = rules.token_cache
+        while True:
+            inputs = [
+                (args,) if isinstance(args, str) else tuple(args)
+                for args in itertools.islice(iterator, chunksize)
+            ]
+            if not inputs:
+                return
+
+            # Split each distinct input and classify each distinct token once
+            table: Dict[str, _ClassInfo] = {}
+            split_inputs: Dict[Tuple[str, ...], List[str]] = {}
+            for args in inputs:
+                if args in split_inputs:
+                    continue
+                all_classes = self._split(args)
+                split_inputs[args] = all_classes
+                for class_name in all_classes:
+                    if class_name not in table:
+                        info = token_cache.get(class_name)
+                        table[class_name] = info if info is not None else self._classify(class_name, rules)
+
+            results: Dict[Tuple[str, ...], str] = {}
+            for args in inputs:
+                result = results.get(args)
+                if result is None:
+                    result = results[args] = self._resolve(split_inputs.pop(args), table, rules)
+                yield result
+
+    def merge_parallel(
+        self,
+        inputs: Iterable[Union[str, Tuple[str, ...]]],
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        min_parallel: int = DEFAULT_MIN_PARALLEL,
+    ) -> List[str]:
+        """
+        Merge many inputs across a pool of `workers` processes (default: one per CPU).
+        Returns the results in input order. See `iter_merge_parallel`.
+        """
+        return list(self.iter_merge_parallel(inputs, workers, chunksize, min_parallel))
+
+    def iter_merge_parallel(
+        self,
+        inputs: Iterable[Union[str, Tuple[str, ...]]],
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        min_parallel: int = DEFAULT_MIN_PARALLEL,
+    ) -> Iterator[str]:
+        """
+        Streaming variant of `merge_parallel`, yielding results in input order.
+
+        Inputs are sent to the workers in chunks of `chunksize`, each merged with
+        `merge_many`, and only a couple of chunks per worker are in flight at a time, so
+        memory stays bounded. The current rules, including any added with add_rule, are
+        sent to each worker once when it starts. With fewer than `min_parallel` inputs (or
+        a single worker) everything runs in-process instead, as starting the pool would
+        cost more than it saves.
+        """
+        from .parallel import iter_merge_parallel
+
+        return iter_merge_parallel(self, inputs, workers, chunksize, min_parallel)
+
+    def load_snapshot(self, path: str) -> int:
+        """
+        Fill the token and result caches from a snapshot written by
+        `python -m tailwind_merge warm` (or `save_snapshot`), in one read.
+        Returns the number of class tokens loaded; the caches' size limits apply.
+        Raises ValueError if the snapshot was built with different rules. Caches start
+        over when add_rule changes the rules, so load the snapshot after adding them.
+        """
+        from .snapshot import load_snapshot
+
+        return load_snapshot(self, path)
+
+    def save_snapshot(self, path: str, class_strings: Iterable[str]) -> None:
+        """
+        Classify every token of `class_strings` and merge each of them with the current
+        rules, and write the results to a snapshot file for `load_snapshot`.
+        """
+        from .snapshot import write_snapshot
+
+        write_snapshot(self, path, ((class_str, True) for class_str in class_strings))
+
+    def _merge_shared(self, class_lists: Tuple[str, ...], rules: "_Ruleset") -> str:
+        """Merge through the shared cache, keyed on the ruleset's fingerprint."""
+        shared = self._shared_cache
+        fingerprint = rules.fingerprint()
+        key = shared.key(class_lists)
+        result = shared.get(fingerprint, key)
+        if result is None:
+            result = self._merge(class_lists, rules)
+            shared.put(fingerprint, key, result)
+        return result
+
+    def _merge(self, class_lists: Tuple[str, ...], rules: "_Ruleset") -> str:
+        """Uncached merge of the given class strings."""
+        if self._stats is not None:
+            return self._stats.timed_merge(self, class_lists, rules)
+        return self._resolve(self._split(class_lists), rules.token_cache, rules)
+
+    @staticmethod
+    def _split(class_lists: Tuple[str, ...]) -> List[str]:
+        """Flatten and split the class strings (str.split() never yields empty strings)."""
         all_classes: List[str] = []
         for class_str in class_lists:
             if class_str:
-                all_classes.extend(filter(None, class_str.split()))
+                all_classes.extend(class_str.split())
+        return all_classes
+
+    def _resolve(self, all_classes: List[str], table: Dict[str, _ClassInfo], rules: "_Ruleset") -> str:
+        """
+        Resolve conflicts between the classes, looking their parsed form up in `table`
+        (classifying any token missing from it against `rules`).
 
+        Walks the classes once from the end: the first class seen for a conflict key
+        (group + modifiers) is the last occurrence and wins, later-seen ones are
+        dropped. A winning class also claims the keys of the groups it overrides
+        (e.g. 'p-0' claims padding_x and padding_left), so earlier classes in those
+        groups are dropped too. Classes outside any group are de-duplicated the same way by their
+        exact string. Survivors are collected in reverse and flipped at the end, which
+        preserves their original relative order.
+        """
         if not all_classes:
             return ""
 
-        # Track last occurrence index for each group *key* (group_name + modifiers)
-        group_last_idx: Dict[str, int] = {}
-        # Store the resolved group key for each class index
-        class_to_group_key: Dict[int, str] = {}
-
-        # First pass: determine groups and modifiers
-        for idx, class_name in enumerate(all_classes):
-            modifiers, base_class_name = self._extract_modifiers(class_name)
-            group = self._get_group(base_class_name)
-
-            if group:
-                # Group key includes modifiers to handle conflicts correctly
-                # e.g., 'hover:padding_left' vs 'padding_left'
-                group_key = f"{modifiers}:{group}"
-                group_last_idx[group_key] = idx
-                class_to_group_key[idx] = group_key
-            # else: class doesn't belong to a conflict group (or is only modifiers)
-
-        # Second pass: collect final classes
-        result_indices: Set[int] = set()
-        included_group_keys: Set[str] = set()
-
-        # Process in reverse order
-        for idx in range(len(all_classes) - 1, -1, -1):
-            group_key = class_to_group_key.get(idx)
-
-            if group_key:
-                # It belongs to a conflict group
-                if group_key not in included_group_keys and idx == group_last_idx.get(group_key):
-                    # This is the last occurrence for this specific group+modifier combination
-                    result_indices.add(idx)
-                    included_group_keys.add(group_key)
-            elif idx not in class_to_group_key:
-                 # Class does not belong to any known conflict group (or has no base class name after modifiers)
-                 # Check if it has modifiers but no recognized base class - still potentially valid standalone modifier usage or custom class
-                 modifiers, base_class_name = self._extract_modifiers(all_classes[idx])
-                 if base_class_name or modifiers: # Include if it's a custom class or just modifiers
-                     # Need to avoid adding duplicates if a non-grouped class appears multiple times
-                     # Simple approach: check if the exact class string is already added via another index
-                     # This isn't perfect for preserving order strictly but avoids simple duplicates.
-                     is_duplicate = False
-                     for added_idx in result_indices:
-                         if all_classes[added_idx] == all_classes[idx]:
-                             is_duplicate = True
-                             break
-                     if not is_duplicate:
-                           result_indices.add(idx)
-
-
-        # Reconstruct the string preserving original order as much as possible
-        final_classes = [all_classes[i] for i in sorted(list(result_indices))]
+        seen_group_keys: Set[Any] = set()
+        seen_classes: Set[str] = set()
+        final_classes: List[str] = []
+
+        for class_name in reversed(all_classes):
+            info = table.get(class_name)
+            if info is None:
+                info = self._classify(class_name, rules)
+            group_key = info[3]
 
+            if group_key is not None:
+                # A later class of the same or an overriding group (with the same modifiers) already won
+                if group_key in seen_group_keys:
+                    continue
+                seen_group_keys.add(group_key)
+                if info[4]:
+                    seen_group_keys.update(info[4])
+            else:
+                # Custom class or bare modifiers - just avoid exact duplicates
+                if class_name in seen_classes:
+                    continue
+                seen_classes.add(class_name)
+            final_classes.append(class_name)
+
+        final_classes.reverse()
         return ' '.join(final_classes)
 
+    def _classify(self, class_name: str, rules: "_Ruleset") -> _ClassInfo:
+        """Parse a single class token and remember the result in the ruleset's token cache."""
+        parsed = parse_class(class_name)
+        modifiers = parsed.modifiers
+        base_class_name = class_name[len(modifiers):]
+        classifier = rules.classifier
+        if classifier is not None and self._stats is None:
+            group = classifier(parsed.base, parsed.postfix, parsed.arbitrary)
+        else:
+            group = self._get_group(base_class_name, rules, parsed)
+        if group:
+            if parsed.important:
+                # Important classes only conflict with other important classes
+                modifiers += '!'
+            info = rules.class_info(modifiers, base_class_name, group)
+        else:
+            info = (modifiers, base_class_name, None, None, ())
+
+        if self._token_cache_size:
+            token_cache = rules.token_cache
+            if len(token_cache) >= self._token_cache_size:
+                # Evict the oldest entry. OrderedDict does this in O(1); on a plain dict
+                # next(iter(...)) has to skip over every previously deleted slot.
+                try:
+                    token_cache.popitem(last=False)
+                except KeyError:
+                    pass  # Emptied by another thread
+            token_cache[class_name] = info
+        return info
+
     def _extract_modifiers(self, class_name: str) -> Tuple[str, str]:
-        """Splits class name into modifiers (e.g., 'hover:focus:') and the base class name."""
-        parts = class_name.split(':')
-        if len(parts) == 1:
-            return "", class_name  # No modifiers
-        base_class_name = parts[-1]
-        modifiers = ":".join(parts[:-1]) + ":"
-        return modifiers, base_class_name
+        """
+        Splits class name into modifiers (e.g., 'hover:focus:') and the base class name.
+        Colons inside brackets ('[&:hover]:p-4', 'bg-[url(https://x)]') don't split.
+        """
+        modifiers = parse_class(class_name).modifiers
+        return modifiers, class_name[len(modifiers):]
 
-    def _get_group(self, base_class_name: str) -> Optional[str]:
+    def _get_group(
+        self, base_class_name: str, rules: Optional["_Ruleset"] = None, parsed: Optional[ParsedClass] = None
+    ) -> Optional[str]:
         """
-        Find the group for a *base* class name (without modifiers).
+        Find the group for a *base* class name (without modifiers), using `rules`
+        (the current ruleset by default). `parsed` is the already parsed token, if any.
         Prioritizes exact matches, then arbitrary values, then the longest matching prefix.
+        The important marker is ignored, and an opacity or other '/' postfix only counts
+        for exact matches ('text-sm/6' is 'text-sm').
         """
-        if not base_class_name: # Handle cases like "hover:" which have no base class
+        if rules is None:
+            rules = self._rules
+        if parsed is None:
+            parsed = parse_class(base_class_name)
+        name = parsed.base
+        if rules.data is not None:
+            rules.load_section(name)
+        added_exact = rules.added_exact
+        exact_mapping = rules.base_exact
+        stats = self._stats
+        if not name: # Handle cases like "hover:" or arbitrary properties, which have no utility
+            if stats is not None:
+                stats.record_lookup('unknown', base_class_name)
             return None
 
-        # 1. Check exact matches
-        if base_class_name in self._exact_mapping:
-            return self._exact_mapping[base_class_name]
-
-        # 2. Check for arbitrary value pattern (e.g., p-[20px])
-        # Use a simpler regex here as modifiers are already stripped
-        arbitrary_match = re.match(r'([a-zA-Z0-9-]+(?:-[a-zA-Z0-9]+)*)-\[([^\]]+)\]$', base_class_name)
-        arbitrary_base_prefix = None
-        if arbitrary_match:
-            arbitrary_base_prefix = arbitrary_match.group(1) + '-' # e.g., 'p-', 'border-t-'
+        if parsed.arbitrary is None:
+            # 1. Check exact matches, with and without the postfix
+            group = None
+            if parsed.postfix is not None:
+                postfixed = f'{name}/{parsed.postfix}'
+                group = added_exact.get(postfixed) or exact_mapping.get(postfixed)
+            if group is None:
+                group = added_exact.get(name) or exact_mapping.get(name)
+            if group is not None:
+                if stats is not None:
+                    stats.record_lookup('exact', base_class_name)
+                return group
+            check_name = name
+        else:
+            # 2. Arbitrary values (e.g., p-[20px]) go by the prefix before the brackets ('p-'),
+            # or by the type of the value for prefixes shared by several groups ('text-[14px]')
+            check_name = name + '-'
+            routes = rules.typed_prefixes.get(check_name)
+            if routes is not None:
+                group = route(routes, parsed.arbitrary)
+                if group is not None:
+                    if stats is not None:
+                        stats.record_lookup('arbitrary', base_class_name)
+                    return group
 
         # 3. Check prefix matches - Find the *longest* matching prefix
-        best_match_len = 0
-        found_group = None
-
-        # Check against the actual class name OR the base prefix from arbitrary value
-        check_name = arbitrary_base_prefix if arbitrary_base_prefix else base_class_name
-
-        for prefix, group in self._prefix_mapping.items():
-            # Use startswith for flexibility (e.g., 'p-' matches 'p-4' and 'p-[20px]' base 'p-')
-            if check_name.startswith(prefix):
-                if len(prefix) > best_match_len:
-                    best_match_len = len(prefix)
-                    found_group = group
-
-        # If we matched an arbitrary value's base prefix, return that group
-        # Otherwise, return the group found matching the regular class name (if any)
-        if arbitrary_base_prefix and found_group:
-             return found_group
-        elif not arbitrary_base_prefix and found_group:
-             return found_group
+        found_group = self._match_prefix(check_name, rules)
+        if found_group:
+            if stats is not None:
+                stats.record_lookup('prefix' if parsed.arbitrary is None else 'arbitrary', base_class_name)
+            return found_group
 
         # 4. No group found
+        if stats is not None:
+            stats.record_lookup('unknown', base_class_name)
         return None
 
+    def _match_prefix(self, class_name: str, rules: Optional["_Ruleset"] = None) -> Optional[str]:
+        """
+        Return the group of the longest prefix in the prefix mappings of `rules` (the
+        current ruleset by default) that `class_name` starts with.
+        Every prefix ends with '-', so only the slices ending at a '-' can match. Probing those
+        from the right finds the longest match in time proportional to the class name length.
+        """
+        if rules is None:
+            rules = self._rules
+        added_prefixes = rules.added_prefixes
+        base_prefixes = rules.base_prefixes
+        end = class_name.rfind('-')
+        while end != -1:
+            prefix = class_name[:end + 1]
+            group = added_prefixes.get(prefix) or base_prefixes.get(prefix)
+            if group is not None:
+                return group
+            end = class_name.rfind('-', 0, end)
+        return None
+
+    def use_classifier(self, module: Any) -> None:
+        """
+        Classify classes with a module generated by `python -m tailwind_merge compile`
+        from these exact rules (see codegen.py) instead of the interpreted lookup.
+        Raises ValueError if the module was generated from other rules. A later
+        add_rule goes back to the interpreted lookup.
+        """
+        with self._write_lock:
+            rules = self._rules
+            if module.FINGERPRINT != rules.rules_fingerprint():
+                raise ValueError(
+                    f"{module.__name__} was generated from different rules; compile it again"
+                )
+            # Both lookups give the same groups, so in-flight merges may use either
+            rules.classifier = module.get_group
 
-    def add_rule(self, category: str, classes_or_prefixes: List[str]) -> None:
+    def add_rule(
+        self,
+        category: str,
+        classes_or_prefixes: List[str],
+        conflicts: Iterable[str] = (),
+        value_types: Iterable[ValueType] = (),
+    ) -> None:
         """
         Add a new conflict rule. It will have high precedence for lookups
         if its prefixes are longer or specific, due to the longest-match logic.
+        `conflicts` names existing groups that a later class of `category` overrides,
+        like 'padding_all' overrides 'padding_x'.
+        `value_types` restricts the rule's prefixes to arbitrary values of these types
+        ('length', 'color', ... or module-level functions taking the value and returning
+        a bool; lambdas and nested functions are rejected, see validators.py):
+        add_rule('stroke_width', ['stroke-'], value_types=['length', 'number']) sends
+        'stroke-[3px]' to stroke_width, while other 'stroke-' classes keep their group.
         """
-        # Add to the internal groups list (less critical now with sorted lookup)
-        self.groups.append((category, classes_or_prefixes)) # Append is fine
+        # Build a new ruleset (with fresh caches, so no stale result survives) and publish
+        # it with one assignment; concurrent merges finish on the ruleset they started with
+        with self._write_lock:
+            self._rules = self._rules.with_rule(category, classes_or_prefixes, conflicts, value_types)
 
-        # Update mappings immediately
-        for item in classes_or_prefixes:
-            if item.endswith('-'):
-                # Check if prefix already exists and warn or decide overwrite policy
-                # if item in self._prefix_mapping and self._prefix_mapping[item] != category:
-                #     print(f"Warning: Overwriting prefix '{item}' group '{self._prefix_mapping[item]}' with '{category}'")
-                self._prefix_mapping[item] = category
-            else:
-                # Check if exact match already exists
-                # if item in self._exact_mapping and self._exact_mapping[item] != category:
-                #     print(f"Warning: Overwriting exact match '{item}' group '{self._exact_mapping[item]}' with '{category}'")
-                self._exact_mapping[item] = category
\ No newline at end of file
+
+# Shared instance with the default rules, for callers that need no custom rules.
+# Rules added to it with add_rule apply to every user of `merge`.
+default_merger = TailwindMerge()
+merge = default_merger.merge
+cn = default_merger.cn
@@ -0,0 +1,118 @@
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .core import TailwindMerge, _Ruleset
+
+# How `_get_group` resolved a base class name
+LOOKUP_PATHS = ('exact', 'arbitrary', 'prefix', 'unknown')
+
+# Distinct unknown class names remembered for `unknown_classes`
+MAX_UNKNOWN_CLASSES = 256
+
+
+class MergeStats:
+    """
+    Opt-in counters and timings for a `TailwindMerge` instance.
+
+    Enabled with `TailwindMerge.enable_instrumentation()`. While no instance has it
+    enabled, the merge hot path only pays for an `is None` check.
+
+    Merges served from the result cache are only counted (`result_cache_hits`); every
+    computed merge is timed in three phases: splitting the input (`split`), looking up
+    each distinct token in the token cache or classifying it (`classify`) and resolving
+    conflicts (`resolve`). If a callback is given, it is called after each computed merge
+    with a dict describing that call.
+    """
+
+    def __init__(self, callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.callback = callback
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero all counters and timings."""
+        self.merges = 0
+        self.result_cache_hits = 0
+        self.tokens = 0
+        self.max_tokens = 0
+        self.token_cache_hits = 0
+        self.token_cache_misses = 0
+        self.lookups: Dict[str, int] = dict.fromkeys(LOOKUP_PATHS, 0)
+        self.unknown_classes: Dict[str, int] = {}
+        self.split_seconds = 0.0
+        self.classify_seconds = 0.0
+        self.resolve_seconds = 0.0
+
+    def record_lookup(self, path: str, base_class_name: str) -> None:
+        """Count one `_get_group` lookup that resolved through `path`."""
+        self.lookups[path] += 1
+        if path == 'unknown' and base_class_name:
+            unknown = self.unknown_classes
+            if base_class_name in unknown:
+                unknown[base_class_name] += 1
+            elif len(unknown) < MAX_UNKNOWN_CLASSES:
+                unknown[base_class_name] = 1
+
+    def timed_merge(self, twm: "TailwindMerge", class_lists: Tuple[str, ...], rules: "_Ruleset") -> str:
+        """Run an uncached merge for `twm` against `rules`, recording its phases."""
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        all_classes = twm._split(class_lists)
+        split_done = perf_counter()
+
+        token_cache = rules.token_cache
+        table = {}
+        misses = 0
+        for class_name in all_classes:
+            if class_name in table:
+                continue
+            info = token_cache.get(class_name)
+            if info is None:
+                misses += 1
+                info = twm._classify(class_name, rules)
+            table[class_name] = info
+        classify_done = perf_counter()
+
+        result = twm._resolve(all_classes, table, rules)
+        resolve_done = perf_counter()
+
+        token_count = len(all_classes)
+        self.merges += 1
+        self.tokens += token_count
+        if token_count > self.max_tokens:
+            self.max_tokens = token_count
+        self.token_cache_misses += misses
+        self.token_cache_hits += len(table) - misses
+        self.split_seconds += split_done - start
+        self.classify_seconds += classify_done - split_done
+        self.resolve_seconds += resolve_done - classify_done
+
+        if self.callback is not None:
+            self.callback({
+                'tokens': token_count,
+                'distinct_tokens': len(table),
+                'token_cache_misses': misses,
+                'split_seconds': split_done - start,
+                'classify_seconds': classify_done - split_done,
+                'resolve_seconds': resolve_done - classify_done,
+            })
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """A flat dict of the current counters, ready to export to a metrics system."""
+        snapshot: Dict[str, Any] = {
+            'merges': self.merges,
+            'result_cache_hits': self.result_cache_hits,
+            'tokens': self.tokens,
+            'tokens_per_merge': self.tokens / self.merges if self.merges else 0.0,
+            'max_tokens_per_merge': self.max_tokens,
+            'token_cache_hits': self.token_cache_hits,
+            'token_cache_misses': self.token_cache_misses,
+            'split_seconds': self.split_seconds,
+            'classify_seconds': self.classify_seconds,
+            'resolve_seconds': self.resolve_seconds,
+        }
+        for path in LOOKUP_PATHS:
+            snapshot[f'lookup_{path}'] = self.lookups[path]
+        snapshot['unknown_classes'] = dict(self.unknown_classes)
+        return snapshot
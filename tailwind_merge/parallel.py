@@ -0,0 +1,81 @@
+import itertools
+import os
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .core import TailwindMerge
+
+MergeInput = Union[str, Tuple[str, ...]]
+
+# Below this many inputs, merging in-process beats starting a process pool
+DEFAULT_MIN_PARALLEL = 5000
+DEFAULT_CHUNKSIZE = 500
+
+# The worker process's merger, built once by _init_worker from the shipped ruleset
+_worker_merger: Optional["TailwindMerge"] = None
+
+
+def _init_worker(pickled_rules: bytes, token_cache_size: int) -> None:
+    global _worker_merger
+    from .core import TailwindMerge
+
+    _worker_merger = TailwindMerge(cache_size=None, token_cache_size=token_cache_size)
+    _worker_merger._rules = pickle.loads(pickled_rules)
+
+
+def _merge_chunk(chunk: List[MergeInput]) -> List[str]:
+    assert _worker_merger is not None, "worker not initialized"
+    return _worker_merger.merge_many(chunk)
+
+
+def iter_merge_parallel(
+    twm: "TailwindMerge",
+    inputs: Iterable[MergeInput],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    min_parallel: int = DEFAULT_MIN_PARALLEL,
+) -> Iterator[str]:
+    """See `TailwindMerge.iter_merge_parallel`."""
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(inputs)
+
+    # Small inputs (or a single worker) are merged in-process
+    head = list(itertools.islice(iterator, max(min_parallel, 1)))
+    if workers == 1 or len(head) < min_parallel:
+        yield from twm.iter_merge_many(itertools.chain(head, iterator))
+        return
+
+    chunks = _chunked(itertools.chain(head, iterator), chunksize)
+    del head
+
+    # The ruleset is pickled here, once, and unpickled by each worker's initializer.
+    # Pickling it explicitly gives every worker empty caches and fresh locks even when
+    # the pool forks, where initargs would otherwise be inherited as is (along with any
+    # lock held at fork). At most two chunks per worker are in flight, so memory stays
+    # bounded however long the input is, and results are yielded in input order.
+    pickled_rules = pickle.dumps(twm._rules)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(pickled_rules, twm._token_cache_size),
+    ) as executor:
+        pending: Deque["Future[List[str]]"] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_merge_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _chunked(iterator: Iterator[MergeInput], size: int) -> Iterator[List[MergeInput]]:
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
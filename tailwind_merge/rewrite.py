@@ -0,0 +1,131 @@
+import re
+from typing import IO, Iterable, Iterator, Optional, Pattern, Union
+
+from .core import TailwindMerge, default_merger
+
+# Where an attribute name may start. The lookbehind skips names that only end in
+# "class", such as data-class or Vue's :class binding. Shared with snapshot.py.
+_ATTRIBUTE_NAME_START = r'(?<![\w:.-])'
+
+# A complete class attribute, or the start of a region passed through as is: a comment,
+# or a <script> or <style> element, whose text isn't markup. A tag name must be followed
+# by what ends one, so custom elements like <style-provider> aren't skipped; one that
+# runs to the end of the buffer is held back (see _PARTIAL_CLASS_ATTRIBUTE). The leading
+# lookahead lets the scan skip straight over text that can start neither.
+_CLASS_ATTRIBUTE_OR_SKIPPED = re.compile(
+    r'(?=[<c])(?:(?P<skipped><!--|<script(?=[\s/>])|<style(?=[\s/>]))'
+    r'|' + _ATTRIBUTE_NAME_START + r'(?P<prefix>class\s*=\s*)(?P<quote>["\'])(?P<value>.*?)(?P=quote))',
+    re.IGNORECASE | re.DOTALL,
+)
+# The end of each skipped region, by its lowercased start
+_SKIPPED_END = {
+    '<!--': re.compile(r'-->'),
+    '<script': re.compile(r'</script\s*>', re.IGNORECASE),
+    '<style': re.compile(r'</style\s*>', re.IGNORECASE),
+}
+# Held back at the end of the buffer inside a skipped region, as it may be the start of
+# its end (with some whitespace before the '>')
+_SKIPPED_END_HOLD = 16
+
+# A class attribute or a skipped region's start cut off by the end of the buffer: any
+# prefix of `class = "...`, `<!--`, `<script` or `<style` that runs to the very end.
+# What it matches must be held back until more input arrives.
+_PARTIAL_CLASS_ATTRIBUTE = re.compile(
+    _ATTRIBUTE_NAME_START + r'c(?:l(?:a(?:s(?:s(?:\s*(?:=\s*(?:["\'].*)?)?)?)?)?)?)?\Z'
+    r'|<(?:!(?:-(?:-)?)?|s(?:c(?:r(?:i(?:p(?:t)?)?)?)?|t(?:y(?:l(?:e)?)?)?)?)?\Z',
+    re.IGNORECASE | re.DOTALL,
+)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_ATTRIBUTE_LENGTH = 64 * 1024
+
+
+def rewrite_html(
+    source: Union[Iterable[str], IO[str]],
+    merger: Optional[TailwindMerge] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_attribute_length: int = DEFAULT_MAX_ATTRIBUTE_LENGTH,
+) -> Iterator[str]:
+    """
+    Stream HTML, merging the classes of every `class="..."` attribute.
+
+    `source` is an iterable of text chunks or a file-like object (read `chunk_size`
+    characters at a time). Attributes split across chunk boundaries are reassembled.
+    Only the unprocessed tail of the input is buffered, so memory stays bounded by the
+    chunk size plus `max_attribute_length`; an attribute still unterminated after that
+    many characters is passed through unchanged. Comments and the contents of <script>
+    and <style> elements (including the attributes of those tags) are passed through
+    unchanged too. Yields the rewritten text in chunks.
+    """
+    if merger is None:
+        merger = default_merger
+
+    if hasattr(source, 'read'):
+        stream = source
+
+        def read_chunks() -> Iterator[str]:
+            while True:
+                chunk = stream.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+        chunks: Iterable[str] = read_chunks()
+    else:
+        chunks = source
+
+    # `buffer[:start]` is one character of already emitted context, kept so the
+    # lookbehinds see what precedes the pending text
+    buffer = ""
+    start = 0
+    # The end of the skipped region the pending text is in, if any
+    skipped_end: Optional[Pattern[str]] = None
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+
+        output = []
+        pos = start
+        while True:
+            if skipped_end is not None:
+                end = skipped_end.search(buffer, pos)
+                if end is None:
+                    break
+                output.append(buffer[pos:end.end()])
+                pos = end.end()
+                skipped_end = None
+            match = _CLASS_ATTRIBUTE_OR_SKIPPED.search(buffer, pos)
+            if match is None:
+                break
+            output.append(buffer[pos:match.start()])
+            skipped = match.group('skipped')
+            if skipped is not None:
+                output.append(skipped)
+                skipped_end = _SKIPPED_END[skipped.lower()]
+            else:
+                prefix, quote, value = match.group('prefix', 'quote', 'value')
+                output.append(f"{prefix}{quote}{merger.merge(value)}{quote}")
+            pos = match.end()
+
+        if skipped_end is not None:
+            hold = max(pos, len(buffer) - _SKIPPED_END_HOLD)
+        else:
+            # Hold back a possibly incomplete attribute at the end, unless it is too long
+            partial = _PARTIAL_CLASS_ATTRIBUTE.search(buffer, pos)
+            hold = partial.start() if partial is not None else len(buffer)
+            if len(buffer) - hold > max_attribute_length:
+                hold = len(buffer)
+        output.append(buffer[pos:hold])
+
+        keep_from = max(hold - 1, 0)
+        start = hold - keep_from
+        buffer = buffer[keep_from:]
+
+        text = ''.join(output)
+        if text:
+            yield text
+
+    # End of input: whatever is left cannot be a complete attribute
+    if len(buffer) > start:
+        yield buffer[start:]
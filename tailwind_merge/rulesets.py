@@ -0,0 +1,176 @@
+"""
+Full Tailwind rulesets, shipped as pre-indexed data files and loaded one section at a time.
+
+A data file starts with a magic line and a one-line JSON header holding the Tailwind
+version, the group names (a group's id is its position), the declared cross-group
+conflicts, the routes of typed prefixes (see validators.py) and an index of sections. A section holds every class and prefix sharing one
+leading segment ('text' for 'text-lg', 'text-' and 'text-red-500'; '-mt' for '-mt-'),
+so looking up a class only needs the section named by its own leading segment. The
+index maps each section to the byte range of its lines, `<group id> <item> <item>...`.
+
+The files are generated from scripts/build_rulesets.py; don't edit them by hand.
+"""
+import functools
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+SUPPORTED_VERSIONS = ('3', '4')
+
+_MAGIC = b'twmerge-rules 1\n'
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def section_key(class_name: str) -> str:
+    """The section a class or prefix belongs to: its first '-'-separated segment."""
+    # Skip a leading '-' so negative values ('-mt-4') get their own section
+    end = class_name.find('-', 1)
+    return class_name if end == -1 else class_name[:end]
+
+
+def data_path(version: str) -> str:
+    return os.path.join(_DATA_DIR, f'tailwind-v{version}.rules')
+
+
+class RuleData:
+    """
+    The header of one data file, plus the sections parsed from it so far.
+
+    Shared by every ruleset using the same version (see load_rule_data); sections are
+    read from disk on first use and kept, so each one is parsed at most once per process.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            if f.readline() != _MAGIC:
+                raise ValueError(f"{path} is not a tailwind-merge rules file")
+            header = json.loads(f.readline().decode('utf-8'))
+            self._body_offset = f.tell()
+        self.version: str = header['version']
+        self.group_names: Tuple[str, ...] = tuple(header['groups'])
+        self.conflicts: Dict[str, Tuple[str, ...]] = {
+            group_name: tuple(overridden) for group_name, overridden in header['conflicts'].items()
+        }
+        self.typed_prefixes: Dict[str, Tuple[Tuple[str, str], ...]] = {
+            prefix: tuple((value_type, group_name) for value_type, group_name in routes)
+            for prefix, routes in header.get('typed_prefixes', {}).items()
+        }
+        self.sections: Dict[str, Tuple[int, int]] = {
+            key: (offset, length) for key, (offset, length) in header['sections'].items()
+        }
+        self._parsed: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        self._lock = threading.Lock()
+        self._digest: Optional[bytes] = None
+
+    def digest(self) -> bytes:
+        """SHA-256 of the whole data file, identifying the rules it holds."""
+        if self._digest is None:
+            with open(self.path, 'rb') as f:
+                self._digest = hashlib.sha256(f.read()).digest()
+        return self._digest
+
+    def __reduce__(self):
+        # Resolve to the receiving process's own shared instance
+        return (load_rule_data, (self.version,))
+
+    def section(self, key: str) -> Tuple[Tuple[str, str], ...]:
+        """Return the (class or prefix, group name) pairs of a section; empty if there is none."""
+        items = self._parsed.get(key)
+        if items is None:
+            if key not in self.sections:
+                return ()
+            with self._lock:
+                items = self._parsed.get(key)
+                if items is None:
+                    items = self._read_section(key)
+                    self._parsed[key] = items
+        return items
+
+    def _read_section(self, key: str) -> Tuple[Tuple[str, str], ...]:
+        offset, length = self.sections[key]
+        with open(self.path, 'rb') as f:
+            f.seek(self._body_offset + offset)
+            text = f.read(length).decode('utf-8')
+        group_names = self.group_names
+        items: List[Tuple[str, str]] = []
+        for line in text.splitlines():
+            group_id, *classes_or_prefixes = line.split(' ')
+            group_name = group_names[int(group_id)]
+            items.extend((class_or_prefix, group_name) for class_or_prefix in classes_or_prefixes)
+        return tuple(items)
+
+    def load_groups(self) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """Load every section and return the groups in the same form as DEFAULT_GROUPS."""
+        groups: Dict[str, List[str]] = {group_name: [] for group_name in self.group_names}
+        for key in self.sections:
+            for class_or_prefix, group_name in self.section(key):
+                groups[group_name].append(class_or_prefix)
+        return tuple((group_name, tuple(classes)) for group_name, classes in groups.items())
+
+
+@functools.lru_cache(maxsize=None)
+def load_rule_data(version: str) -> RuleData:
+    """Open the data file for a Tailwind version ('3' or '4'), reading only its header."""
+    if version not in SUPPORTED_VERSIONS:
+        raise ValueError(
+            f"Unsupported Tailwind version {version!r}; expected one of {', '.join(SUPPORTED_VERSIONS)}"
+        )
+    return RuleData(data_path(version))
+
+
+def dump_rule_data(
+    version: str,
+    groups: Sequence[Tuple[str, Iterable[str]]],
+    conflicts: Dict[str, Sequence[str]],
+    typed_prefixes: Optional[Dict[str, Sequence[Tuple[str, str]]]] = None,
+) -> bytes:
+    """
+    Serialize group definitions (in DEFAULT_GROUPS form), conflicts and typed prefix
+    routes (in DEFAULT_TYPED_PREFIXES form) into a data file.
+    """
+    typed_prefixes = typed_prefixes or {}
+    group_ids: Dict[str, int] = {}
+    owners: Dict[str, str] = {}
+    sections: Dict[str, Dict[int, List[str]]] = {}
+    for group_name, classes_or_prefixes in groups:
+        group_id = group_ids.setdefault(group_name, len(group_ids))
+        for class_or_prefix in classes_or_prefixes:
+            if class_or_prefix in owners:
+                raise ValueError(
+                    f"'{class_or_prefix}' is in both '{owners[class_or_prefix]}' and '{group_name}'"
+                )
+            owners[class_or_prefix] = group_name
+            section = sections.setdefault(section_key(class_or_prefix), {})
+            section.setdefault(group_id, []).append(class_or_prefix)
+    for group_name, overridden in conflicts.items():
+        unknown = [other for other in (group_name, *overridden) if other not in group_ids]
+        if unknown:
+            raise ValueError(f"Unknown conflict group(s) for '{group_name}': {', '.join(unknown)}")
+    for prefix, routes in typed_prefixes.items():
+        unknown = [group_name for _, group_name in routes if group_name not in group_ids]
+        if unknown:
+            raise ValueError(f"Unknown group(s) routed from '{prefix}': {', '.join(unknown)}")
+
+    body: List[bytes] = []
+    index: Dict[str, Tuple[int, int]] = {}
+    offset = 0
+    for key in sorted(sections):
+        lines = ''.join(
+            f"{group_id} {' '.join(classes_or_prefixes)}\n"
+            for group_id, classes_or_prefixes in sorted(sections[key].items())
+        ).encode('utf-8')
+        index[key] = (offset, len(lines))
+        body.append(lines)
+        offset += len(lines)
+
+    header = {
+        'version': version,
+        'groups': list(group_ids),
+        'conflicts': {group_name: list(overridden) for group_name, overridden in conflicts.items()},
+        'typed_prefixes': {prefix: [list(route) for route in routes] for prefix, routes in typed_prefixes.items()},
+        'sections': index,
+    }
+    return _MAGIC + json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n' + b''.join(body)
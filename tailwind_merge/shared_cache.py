@@ -0,0 +1,203 @@
+"""
+A merge result cache in a memory-mapped file, shared by every process on a host.
+
+    cache = SharedCache('/tmp/tailwind-merge.cache')
+    twm = TailwindMerge(shared_cache=cache)
+
+Pre-forked workers (gunicorn, uwsgi) that open the same file, before or after the
+fork, read and populate one set of results instead of warming their own.
+
+The file is a fixed-size hash table of `capacity` slots of `slot_size` bytes, so it
+never grows: a new entry whose slots are all taken replaces one of them. Each slot
+holds one record:
+
+    crc32 | ruleset fingerprint (8 bytes) | key length | value length | key | value
+
+Readers never lock: they check the fingerprint and key, and a CRC over the record
+catches a write in progress. Writers serialize on an exclusive lock of the file (and
+a thread lock within the process). Entries are keyed on the ruleset fingerprint, so
+instances with different rules can share one file and never see each other's results.
+"""
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_CAPACITY = 8192
+DEFAULT_SLOT_SIZE = 512
+
+_MAGIC = b'TWMSHC1\0'
+# magic, capacity, slot size
+_HEADER = struct.Struct('<8sII')
+_HEADER_SIZE = 64
+# crc32, fingerprint, key length, value length
+_RECORD = struct.Struct('<I8sHH')
+# Consecutive slots an entry may occupy, starting at its hash
+_PROBES = 4
+
+
+class SharedCache:
+    """
+    Bounded merge result cache shared across processes through a memory-mapped file.
+
+    `path` is created if missing. An existing file must have been created with the same
+    `capacity` and `slot_size`. Results whose key and value don't fit in a slot are not
+    cached. `hits` and `misses` count this process's lookups.
+    """
+
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY, slot_size: int = DEFAULT_SLOT_SIZE):
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        if not _RECORD.size < slot_size <= 0xFFFF:
+            raise ValueError(f"slot_size must be between {_RECORD.size + 1} and {0xFFFF} bytes")
+        self.path = path
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.hits = 0
+        self.misses = 0
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        try:
+            self._initialize()
+            self._map = mmap.mmap(self._fd, _HEADER_SIZE + capacity * slot_size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _initialize(self) -> None:
+        """Lay out an empty file, or check that an existing one has the same layout."""
+        size = _HEADER_SIZE + self.capacity * self.slot_size
+        with self._locked():
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            header = os.read(self._fd, _HEADER.size)
+            if not header:
+                os.ftruncate(self._fd, size)
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, _HEADER.pack(_MAGIC, self.capacity, self.slot_size))
+                return
+        if len(header) < _HEADER.size or header[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{self.path} is not a tailwind-merge shared cache file")
+        _, capacity, slot_size = _HEADER.unpack(header)
+        if (capacity, slot_size) != (self.capacity, self.slot_size):
+            raise ValueError(
+                f"{self.path} was created with capacity={capacity}, slot_size={slot_size}"
+            )
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    def __enter__(self) -> "SharedCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def key(class_lists: Tuple[str, ...]) -> bytes:
+        """The cache key of `merge` arguments: merging only depends on the joined tokens."""
+        return ' '.join(class_str for class_str in class_lists if class_str).encode('utf-8')
+
+    def _slots(self, fingerprint: bytes, key: bytes):
+        first = zlib.crc32(key, zlib.crc32(fingerprint)) % self.capacity
+        for probe in range(_PROBES):
+            yield _HEADER_SIZE + ((first + probe) % self.capacity) * self.slot_size
+
+    def get(self, fingerprint: bytes, key: bytes) -> Optional[str]:
+        """Return the cached result for `key` under `fingerprint`, or None."""
+        mapping = self._map
+        slot_size = self.slot_size
+        for offset in self._slots(fingerprint, key):
+            # A writer in another process may overwrite the slot at any time, so everything
+            # is checked on, and the value decoded from, one copy of the slot
+            record = mapping[offset:offset + slot_size]
+            crc, slot_fingerprint, key_length, value_length = _RECORD.unpack_from(record)
+            if slot_fingerprint != fingerprint or key_length != len(key):
+                continue
+            record_end = _RECORD.size + key_length + value_length
+            if record_end > slot_size or zlib.crc32(record[4:record_end]) != crc:
+                continue
+            if record[_RECORD.size:_RECORD.size + key_length] != key:
+                continue
+            self.hits += 1
+            return record[_RECORD.size + key_length:record_end].decode('utf-8')
+        self.misses += 1
+        return None
+
+    def put(self, fingerprint: bytes, key: bytes, value: str) -> bool:
+        """Store a result; returns False if it doesn't fit in a slot."""
+        encoded = value.encode('utf-8')
+        if not key or _RECORD.size + len(key) + len(encoded) > self.slot_size:
+            return False
+        body = _RECORD.pack(0, fingerprint, len(key), len(encoded))[4:] + key + encoded
+        record = struct.pack('<I', zlib.crc32(body)) + body
+        slots = list(self._slots(fingerprint, key))
+        mapping = self._map
+        with self._locked():
+            target = None
+            for offset in slots:
+                crc, slot_fingerprint, key_length, value_length = _RECORD.unpack_from(mapping, offset)
+                if not key_length or (
+                    slot_fingerprint == fingerprint and mapping[offset + _RECORD.size:offset + _RECORD.size + key_length] == key
+                ):
+                    target = offset
+                    break
+            if target is None:
+                # All probed slots hold other entries: replace one picked by the key's hash
+                target = slots[zlib.crc32(key) % _PROBES]
+            # Invalidate the CRC first so a concurrent reader never accepts a half-written record
+            mapping[target:target + 4] = b'\xff\xff\xff\xff'
+            mapping[target + 4:target + len(record)] = record[4:]
+            mapping[target:target + 4] = record[:4]
+        return True
+
+    def clear(self) -> None:
+        """Empty every slot (for all processes and rulesets)."""
+        with self._locked():
+            self._map[_HEADER_SIZE:] = bytes(self.capacity * self.slot_size)
+
+    def _locked(self) -> "_FileLock":
+        if self._pid != os.getpid():
+            # Forked while another thread may have held the lock; start over in the child
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+        return _FileLock(self._fd, self._lock)
+
+
+class _FileLock:
+    """Exclusive lock of the file's first byte across processes, plus a thread lock within one."""
+
+    def __init__(self, fd: int, thread_lock: threading.Lock):
+        self.fd = fd
+        self.thread_lock = thread_lock
+
+    def __enter__(self) -> None:
+        self.thread_lock.acquire()
+        try:
+            if fcntl is not None:
+                fcntl.lockf(self.fd, fcntl.LOCK_EX, 1, 0, os.SEEK_SET)
+            else:
+                os.lseek(self.fd, 0, os.SEEK_SET)
+                msvcrt.locking(self.fd, msvcrt.LK_LOCK, 1)
+        except BaseException:
+            self.thread_lock.release()
+            raise
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            if fcntl is not None:
+                fcntl.lockf(self.fd, fcntl.LOCK_UN, 1, 0, os.SEEK_SET)
+            else:
+                os.lseek(self.fd, 0, os.SEEK_SET)
+                msvcrt.locking(self.fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            self.thread_lock.release()
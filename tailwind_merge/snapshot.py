@@ -0,0 +1,187 @@
+"""
+Warm-up snapshots: classifications and merge results computed ahead of time.
+
+    python -m tailwind_merge warm templates/ -o tailwind-merge.snapshot
+
+    twm = TailwindMerge()
+    twm.load_snapshot('tailwind-merge.snapshot')
+
+`warm` scans template sources (HTML, Jinja, Django, JSX) for class attributes,
+classifies every distinct token and merges every static attribute value, and writes
+them to a snapshot. Loading it fills the token and result caches in one read, so the
+first requests after a deploy skip the cold lookups.
+
+A snapshot is a magic line, the 8-byte fingerprint of the ruleset it was built with
+(see `_Ruleset.fingerprint`) and a zlib-compressed JSON body:
+
+    {"modifiers": [...], "groups": [...],
+     "tokens": [[token, modifiers index, group index or -1], ...],
+     "results": [[class string, merged], ...]}
+
+Tokens and results are ordered most frequent first, so a cache too small to hold
+them all keeps the most useful ones. A snapshot built with other rules is rejected.
+"""
+import json
+import os
+import re
+import zlib
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from .rewrite import _ATTRIBUTE_NAME_START
+
+if TYPE_CHECKING:
+    from .core import TailwindMerge
+
+DEFAULT_EXTENSIONS = ('.html', '.htm', '.jinja', '.jinja2', '.j2', '.djhtml', '.jsx', '.tsx')
+
+_MAGIC = b'twmerge-snapshot 1\n'
+_FINGERPRINT_SIZE = 8
+
+# class="..." / className='...' / className={"..."} / className={`...`}
+_CLASS_ATTRIBUTE = re.compile(
+    _ATTRIBUTE_NAME_START
+    + r'''class(?:Name)?\s*=\s*(?:"([^"]*)"|'([^']*)'|\{\s*(?:"([^"]*)"|'([^']*)'|`([^`]*)`)\s*\})''',
+    re.IGNORECASE,
+)
+# Template tags whose neighbours are plain text: {% if %}...{% endif %} and comments
+_TEMPLATE_TAG = re.compile(r'\{%.*?%\}|\{#.*?#\}', re.DOTALL)
+# Substituted expressions: {{ ... }} and ${ ... }. A token they touch is only known at
+# render time, so it is skipped; string literals inside them are class strings of their own.
+_TEMPLATE_EXPRESSION = re.compile(r'\{\{.*?\}\}|\$\{.*?\}', re.DOTALL)
+_STRING_LITERAL = re.compile(r'"([^"]*)"|\'([^\']*)\'')
+_PLACEHOLDER = '\0'
+
+
+def extract_class_strings(text: str) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield the class strings of every class attribute in a template, each with whether
+    it is static: the attribute's literal value, with no template syntax in it.
+    """
+    for match in _CLASS_ATTRIBUTE.finditer(text):
+        value = next(group for group in match.groups() if group is not None)
+        if '{' not in value:
+            yield value, True
+            continue
+        value = _TEMPLATE_TAG.sub(' ', value)
+        for expression in _TEMPLATE_EXPRESSION.findall(value):
+            for literal in _STRING_LITERAL.finditer(expression):
+                yield literal.group(1) if literal.group(1) is not None else literal.group(2), False
+        value = _TEMPLATE_EXPRESSION.sub(_PLACEHOLDER, value)
+        yield ' '.join(token for token in value.split() if _PLACEHOLDER not in token), False
+
+
+def iter_template_files(paths: Iterable[str], extensions: Sequence[str] = DEFAULT_EXTENSIONS) -> Iterator[str]:
+    """Yield the given files, and the files with one of `extensions` under the given directories."""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for directory, subdirectories, filenames in os.walk(path):
+            subdirectories.sort()
+            for filename in sorted(filenames):
+                if filename.endswith(tuple(extensions)):
+                    yield os.path.join(directory, filename)
+
+
+def build_snapshot(merger: "TailwindMerge", class_strings: Iterable[Tuple[str, bool]]) -> bytes:
+    """
+    Classify every token of `class_strings` (pairs as yielded by extract_class_strings)
+    and merge the static ones with `merger`'s current rules; return the snapshot bytes.
+    """
+    rules = merger._rules
+    token_counts: Counter = Counter()
+    result_counts: Counter = Counter()
+    for class_str, static in class_strings:
+        token_counts.update(class_str.split())
+        if static and class_str:
+            result_counts[class_str] += 1
+
+    modifiers: Dict[str, int] = {}
+    groups: Dict[str, int] = {}
+    tokens: List[Tuple[str, int, int]] = []
+    for token, _ in token_counts.most_common():
+        info = rules.token_cache.get(token)
+        if info is None:
+            info = merger._classify(token, rules)
+        group = info[2]
+        tokens.append((
+            token,
+            modifiers.setdefault(info[0], len(modifiers)),
+            -1 if group is None else groups.setdefault(group, len(groups)),
+        ))
+    results = [(class_str, merger.merge(class_str)) for class_str, _ in result_counts.most_common()]
+
+    body = {'modifiers': list(modifiers), 'groups': list(groups), 'tokens': tokens, 'results': results}
+    return (
+        _MAGIC + rules.fingerprint()
+        + zlib.compress(json.dumps(body, separators=(',', ':')).encode('utf-8'), 9)
+    )
+
+
+def write_snapshot(
+    merger: "TailwindMerge", path: str, class_strings: Iterable[Tuple[str, bool]]
+) -> None:
+    """Build a snapshot (see build_snapshot) and write it to `path`."""
+    snapshot = build_snapshot(merger, class_strings)
+    with open(path, 'wb') as f:
+        f.write(snapshot)
+
+
+def load_snapshot(merger: "TailwindMerge", path: str) -> int:
+    """Fill `merger`'s caches from a snapshot file; see TailwindMerge.load_snapshot."""
+    with open(path, 'rb') as f:
+        snapshot = f.read()
+    if not snapshot.startswith(_MAGIC):
+        raise ValueError(f"{path} is not a tailwind-merge snapshot")
+    rules = merger._rules
+    start = len(_MAGIC)
+    if snapshot[start:start + _FINGERPRINT_SIZE] != rules.fingerprint():
+        raise ValueError(f"{path} was built with different rules; run `warm` again")
+    body = json.loads(zlib.decompress(snapshot[start + _FINGERPRINT_SIZE:]).decode('utf-8'))
+
+    loaded = 0
+    token_cache = rules.token_cache
+    room = merger._token_cache_size - len(token_cache)
+    modifier_names: List[str] = body['modifiers']
+    group_names: List[str] = body['groups']
+    for token, modifiers_index, group_index in body['tokens']:
+        if loaded >= room:
+            break
+        if token in token_cache:
+            continue
+        modifiers = modifier_names[modifiers_index]
+        if group_index < 0:
+            info = (modifiers, token[len(modifiers):], None, None, ())
+        else:
+            # Grouped important classes carry a trailing '!' that isn't part of the token
+            base_class_name = token[len(modifiers) - modifiers.endswith('!'):]
+            info = rules.class_info(modifiers, base_class_name, group_names[group_index])
+        token_cache[token] = info
+        loaded += 1
+
+    cache = rules.result_cache
+    if cache is not None:
+        room = merger._cache_size - len(cache)
+        for class_str, result in body['results'][:max(room, 0)]:
+            cache.setdefault((class_str,), result)
+    return loaded
+
+
+def warm(
+    merger: "TailwindMerge",
+    paths: Iterable[str],
+    output: str,
+    extensions: Sequence[str] = DEFAULT_EXTENSIONS,
+    encoding: str = 'utf-8',
+) -> int:
+    """Scan the template files under `paths` and write a snapshot; returns the number of files."""
+    files = list(iter_template_files(paths, extensions))
+
+    def class_strings() -> Iterator[Tuple[str, bool]]:
+        for filename in files:
+            with open(filename, encoding=encoding, errors='replace') as f:
+                yield from extract_class_strings(f.read())
+
+    write_snapshot(merger, output, class_strings())
+    return len(files)
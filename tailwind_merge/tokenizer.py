@@ -0,0 +1,113 @@
+"""
+Bracket-aware parsing of a single class token.
+
+    'md:hover:!-mt-[3px]'  -> modifiers 'md:hover:', important, negative, utility 'mt', arbitrary '3px'
+    'bg-red-500/50'        -> utility 'bg-red-500', postfix '50'
+    '[&:hover]:p-4'        -> modifiers '[&:hover]:', utility 'p-4'
+    '[mask-type:luminance]' -> utility '', arbitrary 'mask-type:luminance' (an arbitrary property)
+
+':' and '/' only count outside brackets and parentheses, so arbitrary values and
+arbitrary variants may contain them ('bg-[url(https://x.dev/a.png)]').
+"""
+import re
+from typing import NamedTuple, Optional, Tuple
+
+# The only characters that can change how a token splits; everything in between is skipped in C
+_SPECIAL_CHARACTERS = re.compile(r'[:/\[\]()]')
+
+
+class ParsedClass(NamedTuple):
+    # Variants including their trailing ':' ('hover:focus:'), or ''
+    modifiers: str
+    # '!' prefix (v3: '!p-4') or suffix (v4: 'p-4!')
+    important: bool
+    # Leading '-' of a negative value ('-mt-4')
+    negative: bool
+    # The utility without sign, arbitrary value or postfix ('mt-4'; 'mt' for 'mt-[3px]')
+    utility: str
+    # Contents of a trailing '[...]' or '(...)' value, or None
+    arbitrary: Optional[str]
+    # Text after a top-level '/' (opacity, line height, fraction), or None
+    postfix: Optional[str]
+
+    @property
+    def base(self) -> str:
+        """The signed utility name looked up in the rules ('-mt-4', 'bg-red-500')."""
+        return '-' + self.utility if self.negative else self.utility
+
+
+def parse_class(class_name: str) -> ParsedClass:
+    """
+    Split a class token into its parts. Tokens without brackets (most of them) are split
+    with a couple of C-level searches; others in one walk over their special characters.
+    """
+    # Positions within the current (last) segment, reset by every top-level ':'.
+    # The value is the first top-level bracketed or parenthesized part.
+    value_start = -1
+    value_end = -1
+    if '[' not in class_name and '(' not in class_name:
+        # Without brackets every ':' and '/' is top-level; find the last ones in C
+        modifiers_end = class_name.rfind(':') + 1
+        slash = class_name.rfind('/', modifiers_end)
+    else:
+        modifiers_end, value_start, value_end, slash = _scan(class_name)
+
+    start = modifiers_end
+    end = len(class_name)
+    important = False
+    if start < end and class_name[start] == '!':
+        important = True
+        start += 1
+    elif start < end and class_name[end - 1] == '!':
+        important = True
+        end -= 1
+    negative = start < end - 1 and class_name[start] == '-'
+    if negative:
+        start += 1
+
+    postfix = None
+    if slash >= start:
+        postfix = class_name[slash + 1:end]
+        end = slash
+        if value_start > slash:
+            # The brackets belong to an arbitrary postfix ('bg-red-500/[.5]')
+            value_start = -1
+
+    arbitrary = None
+    if value_start >= start and value_end == end - 1:
+        # A value only counts when it closes the utility: 'p-[3px]' but not 'x-[a]b'
+        arbitrary = class_name[value_start + 1:value_end]
+        end = value_start - 1 if value_start > start and class_name[value_start - 1] == '-' else value_start
+
+    return ParsedClass(class_name[:modifiers_end], important, negative, class_name[start:end], arbitrary, postfix)
+
+
+def _scan(class_name: str) -> Tuple[int, int, int, int]:
+    """
+    Walk the special characters of a token with brackets, tracking their nesting.
+    Returns where the modifiers end, the first top-level value's brackets, and the last top-level '/'.
+    """
+    modifiers_end = 0
+    depth = 0
+    value_start = -1
+    value_end = -1
+    slash = -1
+    for match in _SPECIAL_CHARACTERS.finditer(class_name):
+        char = match.group()
+        if char == '[' or char == '(':
+            if depth == 0 and value_start == -1:
+                value_start = match.start()
+            depth += 1
+        elif char == ']' or char == ')':
+            if depth:
+                depth -= 1
+                if depth == 0 and value_end == -1:
+                    value_end = match.start()
+        elif depth:
+            continue
+        elif char == ':':
+            modifiers_end = match.end()
+            value_start = value_end = slash = -1
+        else:
+            slash = match.start()
+    return modifiers_end, value_start, value_end, slash
@@ -0,0 +1,116 @@
+"""
+Types of arbitrary values, for prefixes whose group depends on the value.
+
+    'text-[14px]'          -> length: font size        'text-[#f00]'      -> color: text color
+    'bg-[url(/hero.png)]'  -> url, image: bg image     'bg-[#000]'        -> color: bg color
+    'text-[length:var(--size)]' -> length, from Tailwind's explicit type label
+
+A ruleset maps such prefixes to routes: (value type, group) pairs tried in order. An
+arbitrary value under the prefix goes to the first route its type matches, or to the
+prefix's own group if none does (see TailwindMerge._get_group). A route's type is
+one of VALUE_TYPES, or a callable taking the value and returning whether it matches.
+A callable must be a named module-level function or class: rulesets are identified by
+their routes' names (see describe), and a lambda or a nested function has no name
+that tells it apart from another one.
+"""
+import functools
+import re
+from typing import Any, Callable, FrozenSet, Optional, Tuple, Union
+
+# The value types a route can name
+VALUE_TYPES = ('color', 'length', 'percentage', 'url', 'number', 'image')
+
+ValueType = Union[str, Callable[[str], bool]]
+Route = Tuple[ValueType, str]
+
+_NUMBER = r'[+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?'
+_IS_NUMBER = re.compile(_NUMBER + r'\Z', re.IGNORECASE)
+_IS_PERCENTAGE = re.compile(_NUMBER + r'%\Z', re.IGNORECASE)
+_IS_LENGTH = re.compile(
+    _NUMBER
+    + r'(?:px|r?em|r?ex|r?ch|r?lh|r?cap|r?ic|v[whib]|vmin|vmax|[sld]v[whib]|[sld]vmin|[sld]vmax'
+    r'|cq[whib]|cqmin|cqmax|cm|mm|q|in|pt|pc)\Z'
+    r'|(?:calc|min|max|clamp)\(',
+    re.IGNORECASE,
+)
+_IS_COLOR = re.compile(
+    r'#(?:[0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})\Z'
+    r'|(?:rgba?|hsla?|hwb|(?:ok)?lab|(?:ok)?lch|color|color-mix|light-dark)\('
+    r'|(?:transparent|currentcolor)\Z',
+    re.IGNORECASE,
+)
+_IS_IMAGE = re.compile(
+    r'(?:url|image|image-set|cross-fade|element|(?:repeating-)?(?:linear|radial|conic)-gradient)\(',
+    re.IGNORECASE,
+)
+# Tailwind's explicit type label: 'length:var(--size)'
+_LABEL = re.compile(r'([a-z-]+):')
+
+
+@functools.lru_cache(maxsize=4096)
+def value_types(value: str) -> FrozenSet[str]:
+    """
+    The VALUE_TYPES an arbitrary value (the contents of its brackets) belongs to.
+    A percentage is also a length, a url also an image, and 0 both a number and a length.
+    Memoized, so repeated values cost one dict lookup.
+    """
+    label = _LABEL.match(value)
+    if label is not None:
+        # An explicit label decides on its own, even if it names no type we know
+        label_type = label.group(1)
+        if label_type == 'url':
+            return frozenset(('url', 'image'))
+        return frozenset((label_type,)) if label_type in VALUE_TYPES else frozenset()
+    if _IS_NUMBER.match(value):
+        return frozenset(('number', 'length')) if float(value) == 0 else frozenset(('number',))
+    if _IS_PERCENTAGE.match(value):
+        return frozenset(('percentage', 'length'))
+    if _IS_LENGTH.match(value):
+        return frozenset(('length',))
+    if _IS_COLOR.match(value):
+        return frozenset(('color',))
+    if _IS_IMAGE.match(value):
+        return frozenset(('url', 'image')) if value[:4].lower() == 'url(' else frozenset(('image',))
+    return frozenset()
+
+
+def route(routes: Tuple[Route, ...], value: str) -> Optional[str]:
+    """The group of the first route whose type `value` matches, or None."""
+    types = None
+    for value_type, group in routes:
+        if value_type.__class__ is str:
+            if types is None:
+                types = value_types(value)
+            if value_type in types:
+                return group
+        elif value_type(value):
+            return group
+    return None
+
+
+def check_value_types(value_types: Tuple[ValueType, ...]) -> None:
+    """Raise ValueError unless every one of `value_types` can be a route's type."""
+    unknown = [
+        value_type for value_type in value_types
+        if isinstance(value_type, str) and value_type not in VALUE_TYPES
+    ]
+    if unknown:
+        raise ValueError(
+            f"Unknown value type(s) {', '.join(unknown)}; expected {', '.join(VALUE_TYPES)} or a callable"
+        )
+    for value_type in value_types:
+        if isinstance(value_type, str):
+            continue
+        qualname = getattr(value_type, '__qualname__', None)
+        if not callable(value_type) or qualname is None or '<' in qualname:
+            raise ValueError(
+                f"Custom value types must be module-level functions, got {value_type!r}: "
+                "lambdas and nested functions can't be told apart by name"
+            )
+
+
+def describe(value_type: Any) -> str:
+    """A stable name for a route's type, for fingerprints and error messages."""
+    if isinstance(value_type, str):
+        return value_type
+    return f"{value_type.__module__}.{value_type.__qualname__}"
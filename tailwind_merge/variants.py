@@ -0,0 +1,107 @@
+import itertools
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .core import ClassValue, TailwindMerge
+
+DEFAULT_EAGER_LIMIT = 256
+
+
+class Variants:
+    """
+    A component's classes by variant, created with `TailwindMerge.variants()`.
+
+    Calling it with one option per axis (`button(size="sm", intent="primary")`) returns
+    the merged classes of the base and the selected options. Axes left out use their
+    default, or add nothing if they have none. Every combination is merged once: all of
+    them up front when there are at most `eager_limit`, otherwise each on first use.
+    After that a call is a dict lookup. Extra classes passed positionally are merged
+    on top of the combination's result, with the same inputs as `cn`.
+
+    The table is rebuilt when add_rule changes the merger's rules.
+    """
+    __slots__ = ('_merger', '_base', '_axes', '_axis_index', '_default_key', '_eager', '_state')
+
+    def __init__(
+        self,
+        merger: "TailwindMerge",
+        base: str,
+        axes: Mapping[str, Mapping[Hashable, str]],
+        defaults: Optional[Mapping[str, Hashable]] = None,
+        eager_limit: int = DEFAULT_EAGER_LIMIT,
+    ):
+        self._merger = merger
+        self._base = base
+        self._axes: Tuple[Tuple[str, Dict[Hashable, str]], ...] = tuple(
+            (axis, dict(options)) for axis, options in axes.items()
+        )
+        self._axis_index = {axis: index for index, (axis, _) in enumerate(self._axes)}
+        defaults = defaults or {}
+        for axis, option in defaults.items():
+            self._check_option(axis, option)
+        # One option per axis, in axis order; None where nothing is selected
+        self._default_key: Tuple[Any, ...] = tuple(defaults.get(axis) for axis, _ in self._axes)
+
+        combinations = 1
+        for axis, options in self._axes:
+            combinations *= len(options) + (defaults.get(axis) is None)
+        self._eager = combinations <= eager_limit
+        # The rules the table was merged with, the table (one option per axis -> merged
+        # classes) and a memo of call keywords -> merged classes
+        self._state: Tuple[Any, Dict[Tuple[Any, ...], str], Dict[Tuple[Any, ...], str]] = self._build()
+
+    def _check_option(self, axis: str, option: Hashable) -> None:
+        index = self._axis_index.get(axis)
+        if index is None:
+            raise TypeError(f"Unknown variant axis '{axis}'")
+        if option is not None and option not in self._axes[index][1]:
+            raise ValueError(f"Unknown option {option!r} for variant axis '{axis}'")
+
+    def _class_lists(self, key: Tuple[Any, ...]) -> Tuple[str, ...]:
+        return (self._base,) + tuple(
+            options[option] for (_, options), option in zip(self._axes, key) if option is not None
+        )
+
+    def _build(self) -> Tuple[Any, Dict[Tuple[Any, ...], str], Dict[Tuple[Any, ...], str]]:
+        rules = self._merger._rules
+        table: Dict[Tuple[Any, ...], str] = {}
+        if self._eager:
+            choices: List[Tuple[Any, ...]] = [
+                tuple(options) + ((None,) if default is None else ())
+                for (_, options), default in zip(self._axes, self._default_key)
+            ]
+            keys = list(itertools.product(*choices))
+            # merge_many classifies each distinct class once for the whole table
+            results = self._merger.merge_many([self._class_lists(key) for key in keys])
+            table = dict(zip(keys, results))
+        return rules, table, {}
+
+    def __call__(self, *class_lists: "ClassValue", **selected: Hashable) -> str:
+        rules, table, calls = self._state
+        if rules is not self._merger._rules:
+            rules, table, calls = self._state = self._build()
+
+        # Call sites pass the same keywords in the same order, so the keywords as given
+        # find the result directly; the combination is only worked out the first time
+        call_key = tuple(selected.items())
+        result = calls.get(call_key)
+        if result is None:
+            key = self._default_key
+            if selected:
+                options = list(key)
+                for axis, option in selected.items():
+                    self._check_option(axis, option)
+                    if option is not None:
+                        options[self._axis_index[axis]] = option
+                key = tuple(options)
+            result = table.get(key)
+            if result is None:
+                result = table[key] = self._merger.merge(*self._class_lists(key))
+            calls[call_key] = result
+        if class_lists:
+            return self._merger.cn(result, *class_lists)
+        return result
+
+    def __repr__(self) -> str:
+        axes = ', '.join(f"{axis}={list(options)}" for axis, options in self._axes)
+        return f"Variants({self._base!r}, {axes})"
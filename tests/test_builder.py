@@ -0,0 +1,48 @@
+import random
+
+from tailwind_merge import MergedClasses, TailwindMerge
+
+from .test_merge import _CORPUS
+
+
+def test_builder_matches_merge():
+    rng = random.Random(4321)
+    twmerge = TailwindMerge(cache_size=None)
+    twmerge.add_rule('size', ['size-'], conflicts=['width', 'height'])
+    corpus = _CORPUS + ['size-4', 'size-8', '!p-3', 'p-1!', 'bg-red-500/50', 'overflow-x-auto', 'overflow-hidden']
+    for _ in range(500):
+        class_lists = [
+            ' '.join(rng.choice(corpus) for _ in range(rng.randint(0, 12)))
+            for _ in range(rng.randint(1, 5))
+        ]
+        builder = twmerge.builder(class_lists[0])
+        for class_str in class_lists[1:]:
+            builder.add(class_str)
+        assert str(builder) == twmerge.merge(*class_lists)
+
+def test_builder_add_and_render():
+    twmerge = TailwindMerge()
+    builder = twmerge.builder("px-2 py-1 bg-red-500", None, "")
+    assert isinstance(builder, MergedClasses)
+    assert str(builder) == "px-2 py-1 bg-red-500"
+    assert builder.add("hover:bg-blue-500", "p-3") is builder
+    assert str(builder) == "bg-red-500 hover:bg-blue-500 p-3"
+    assert list(builder) == ["bg-red-500", "hover:bg-blue-500", "p-3"]
+    assert len(builder) == 3
+    assert str(twmerge.builder()) == ""
+
+def test_builder_copies_are_independent():
+    twmerge = TailwindMerge()
+    base = twmerge.builder("flex p-4 text-sm")
+    primary = base.copy().add("bg-blue-500 p-2")
+    danger = base.copy().add("bg-red-500 text-lg")
+    assert str(base) == "flex p-4 text-sm"
+    assert str(primary) == "flex text-sm bg-blue-500 p-2"
+    assert str(danger) == "flex p-4 bg-red-500 text-lg"
+
+def test_builder_keeps_its_rules():
+    twmerge = TailwindMerge()
+    builder = twmerge.builder("icon-sm")
+    twmerge.add_rule('icon_size', ['icon-'])
+    assert str(builder.add("icon-lg")) == "icon-sm icon-lg"
+    assert str(twmerge.builder("icon-sm").add("icon-lg")) == "icon-lg"
@@ -0,0 +1,35 @@
+from collections import OrderedDict
+
+import pytest
+
+from tailwind_merge import TailwindMerge, cn
+
+
+def test_cn_conditional_inputs():
+    assert cn("px-4 py-2", {"bg-blue-500": True, "opacity-50": False}, None, False, "bg-red-500") == (
+        "px-4 py-2 bg-red-500"
+    )
+    assert cn(["p-2", ("hover:p-4", [None, "p-3", {"m-1": 1}])], ()) == "hover:p-4 p-3 m-1"
+    assert cn((c for c in ["w-2", "w-4"]), OrderedDict([("h-1", True)])) == "w-4 h-1"
+    assert cn() == cn(None, {}, [], "") == ""
+
+def test_cn_matches_merge_of_kept_classes():
+    twmerge = TailwindMerge()
+    twmerge.add_rule('icon_size', ['icon-'])
+    active, disabled = True, False
+    assert twmerge.cn(
+        "icon-sm p-2", {"icon-lg p-4": active, "opacity-50": disabled}, ["px-1" if active else None]
+    ) == twmerge.merge("icon-sm p-2", "icon-lg p-4", "px-1")
+
+def test_cn_caches_on_kept_classes():
+    twmerge = TailwindMerge()
+    assert twmerge.cn("p-2", {"p-4": True, "m-1": False}) == "p-4"
+    assert twmerge.cn("p-2", {"m-1": False, "p-4": 1}) == "p-4"
+    assert twmerge.cn(["p-2", None], "p-4") == "p-4"
+    assert twmerge.merge("p-2", "p-4") == "p-4"
+    assert twmerge.cache_info().hits == 3
+    assert twmerge.cache_info().currsize == 1
+
+def test_cn_rejects_other_values():
+    with pytest.raises(TypeError, match='got int'):
+        cn("p-2", 4)
@@ -0,0 +1,98 @@
+import importlib.util
+
+import pytest
+
+from tailwind_merge import TailwindMerge, codegen
+from tailwind_merge.__main__ import main
+from tailwind_merge.tokenizer import parse_class
+
+from benchmarks import corpora
+
+custom_merger = TailwindMerge()
+custom_merger.add_rule('icon_size', ['icon-sm', 'icon-lg', 'icon-x-y-z-', 'ratio/wide'])
+custom_merger.add_rule('size', ['size-'], conflicts=['width', 'height'])
+
+
+def _import(path, name):
+    spec = importlib.util.spec_from_file_location(name, str(path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _tokens(merger):
+    items = [item for _, classes in merger.groups for item in classes]
+    calls = corpora.short_components(300) + corpora.modifier_heavy(300) + corpora.arbitrary_heavy(300)
+    return items + [item + '4' for item in items] + [
+        'icon-x-y-z-1', 'ratio/wide', 'ratio/narrow', 'size-[3px]', '-mt-4', '!p-4', '', 'hover:',
+        '[color:red]', 'text-sm/6', 'bg-red-500/50', 'bg-[url(https://x.y/a-b.png)]', 'a--b',
+    ] + [token for call in calls for token in ' '.join(call).split()]
+
+
+def test_builtin_classifier_is_up_to_date():
+    assert main(['compile', '--check']) == 0
+
+@pytest.mark.parametrize('merger', [
+    TailwindMerge(), custom_merger, TailwindMerge(version=4),
+], ids=['default', 'custom', 'v4'])
+def test_generated_classifier_matches_interpreted_lookup(tmp_path, merger):
+    codegen.write(merger, str(tmp_path / 'classifier.py'))
+    classifier = _import(tmp_path / 'classifier.py', f'twm_test_classifier_{id(merger)}').get_group
+    for token in _tokens(merger):
+        parsed = parse_class(token)
+        expected = merger._get_group(token[len(parsed.modifiers):], merger._rules, parsed)
+        assert classifier(parsed.base, parsed.postfix, parsed.arbitrary) == expected, token
+
+def test_use_classifier(tmp_path):
+    output = tmp_path / 'custom_classifier.py'
+    assert main(['compile', '-o', str(output), '--merger', f'{__name__}:custom_merger']) == 0
+    assert main(['compile', '-o', str(output), '--merger', f'{__name__}:custom_merger', '--check']) == 0
+    assert main(['compile', '-o', str(output), '--check']) == 1
+    module = _import(output, 'twm_custom_classifier')
+
+    with pytest.raises(ValueError, match='different rules'):
+        TailwindMerge().use_classifier(module)
+
+    twmerge = TailwindMerge()
+    twmerge.add_rule('icon_size', ['icon-sm', 'icon-lg', 'icon-x-y-z-', 'ratio/wide'])
+    twmerge.add_rule('size', ['size-'], conflicts=['width', 'height'])
+    assert twmerge._rules.classifier is None
+    twmerge.use_classifier(module)
+    assert twmerge._rules.classifier is module.get_group
+    assert twmerge.merge('w-2 icon-sm h-1', 'size-4 icon-lg') == 'size-4 icon-lg'
+
+    # Changing the rules goes back to the interpreted lookup
+    twmerge.add_rule('shade', ['shade-'])
+    assert twmerge._rules.classifier is None
+    assert twmerge.merge('shade-1 shade-2') == 'shade-2'
+
+def test_classifiers_survive_version_bumps(monkeypatch):
+    import tailwind_merge
+    from tailwind_merge import _classifier
+
+    before = TailwindMerge()._rules.fingerprint()
+    monkeypatch.setattr(tailwind_merge, '__version__', '99.0.0')
+    assert main(['compile', '--check']) == 0
+    twmerge = TailwindMerge()
+    twmerge.use_classifier(_classifier)
+    # Shared caches and snapshots still start over with a new version
+    assert twmerge._rules.fingerprint() != before
+
+def test_version_matches_pyproject():
+    import pathlib
+    import re
+
+    import tailwind_merge
+
+    pyproject = (pathlib.Path(__file__).parent.parent / 'pyproject.toml').read_text()
+    assert re.search(r'^version = "(.+)"', pyproject, re.MULTILINE).group(1) == tailwind_merge.__version__
+
+def test_builtin_classifier_is_opt_in():
+    from tailwind_merge import _classifier
+
+    twmerge = TailwindMerge()
+    assert twmerge._rules.classifier is None
+    assert TailwindMerge(version=3)._rules.classifier is None
+    twmerge.use_classifier(_classifier)
+    assert twmerge._rules.classifier is _classifier.get_group
+    assert twmerge.merge("text-sm text-[14px] p-2 px-4") == "text-[14px] p-2 px-4"
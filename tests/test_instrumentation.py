@@ -0,0 +1,54 @@
+from tailwind_merge import TailwindMerge
+
+
+def test_instrumentation_disabled_by_default():
+    twmerge = TailwindMerge()
+    assert twmerge.merge("p-4", "p-2") == "p-2"
+    assert twmerge.instrumentation_snapshot() == {}
+
+def test_lookup_paths_are_counted():
+    twmerge = TailwindMerge()
+    twmerge.enable_instrumentation()
+    result = twmerge.merge("flex p-4 p-[3px] hover:bg-red-500 card-widget hover:")
+    assert result == "flex p-[3px] hover:bg-red-500 card-widget hover:"
+    snapshot = twmerge.instrumentation_snapshot()
+    assert snapshot['lookup_exact'] == 1
+    assert snapshot['lookup_arbitrary'] == 1
+    assert snapshot['lookup_prefix'] == 2
+    assert snapshot['lookup_unknown'] == 2
+    assert snapshot['unknown_classes'] == {'card-widget': 1}
+
+def test_token_and_result_cache_counters():
+    twmerge = TailwindMerge()
+    twmerge.enable_instrumentation()
+    twmerge.merge("p-4 w-6", "w-8")
+    twmerge.merge("p-4 w-6", "w-8")
+    twmerge.merge("p-4 w-6 w-6")
+    snapshot = twmerge.instrumentation_snapshot()
+    assert snapshot['merges'] == 2
+    assert snapshot['result_cache_hits'] == 1
+    assert snapshot['tokens'] == 6
+    assert snapshot['max_tokens_per_merge'] == 3
+    assert snapshot['token_cache_misses'] == 3
+    assert snapshot['token_cache_hits'] == 2
+    assert snapshot['split_seconds'] >= 0
+    assert snapshot['resolve_seconds'] >= 0
+
+def test_callback_receives_each_computed_merge():
+    calls = []
+    twmerge = TailwindMerge()
+    twmerge.enable_instrumentation(calls.append)
+    twmerge.merge("p-4 p-2")
+    twmerge.merge("p-4 p-2")
+    assert len(calls) == 1
+    assert calls[0]['tokens'] == 2
+    assert calls[0]['token_cache_misses'] == 2
+
+def test_disable_instrumentation():
+    twmerge = TailwindMerge()
+    stats = twmerge.enable_instrumentation()
+    twmerge.merge("p-4")
+    twmerge.disable_instrumentation()
+    twmerge.merge("p-2")
+    assert stats.merges == 1
+    assert twmerge.instrumentation_snapshot() == {}
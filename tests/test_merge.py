@@ -1,3 +1,4 @@
+import tailwind_merge.core
 from tailwind_merge import TailwindMerge
 
 
@@ -117,4 +118,340 @@ def test_multiple_modifier_placeholder_merge():
         "hover:dark:placeholder-gray-400",
         "hover:dark:placeholder-red-500"
     )
-    assert result == "hover:dark:placeholder-red-500"
\ No newline at end of file
+    assert result == "hover:dark:placeholder-red-500"
+
+def test_result_cache_hits_and_misses():
+    twmerge = TailwindMerge(cache_size=2)
+    assert twmerge.merge("p-4", "p-2") == "p-2"
+    assert twmerge.merge("p-4", "p-2") == "p-2"
+    info = twmerge.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 1, 0)
+    assert info.currsize == 1
+
+def test_result_cache_evicts_least_recently_used():
+    twmerge = TailwindMerge(cache_size=2)
+    twmerge.merge("p-1")
+    twmerge.merge("p-2")
+    twmerge.merge("p-1")  # refresh p-1, so p-2 is now the oldest
+    twmerge.merge("p-3")
+    info = twmerge.cache_info()
+    assert info.evictions == 1
+    assert info.currsize == 2
+    twmerge.merge("p-1")
+    assert twmerge.cache_info().hits == 2
+
+def test_result_cache_disabled():
+    twmerge = TailwindMerge(cache_size=None)
+    assert twmerge.merge("w-2", "w-4") == "w-4"
+    assert twmerge.merge("w-2", "w-4") == "w-4"
+    assert twmerge.cache_info() == (0, 0, 0, 0, 0)
+
+def test_result_cache_invalidated_by_add_rule():
+    twmerge = TailwindMerge()
+    assert twmerge.merge("icon-sm", "icon-lg") == "icon-sm icon-lg"
+    twmerge.add_rule('icon_size', ['icon-sm', 'icon-lg'])
+    assert twmerge.merge("icon-sm", "icon-lg") == "icon-lg"
+
+def test_prefix_lookup_matches_linear_scan():
+    """The indexed prefix lookup must agree with a scan over every prefix"""
+    twmerge = TailwindMerge()
+    twmerge.add_rule('custom_deep', ['border-t-custom-'])
+    twmerge.add_rule('custom_dash', ['-'])
+
+    def linear_scan(name):
+        best, found = 0, None
+        for prefix, group in twmerge._prefix_mapping.items():
+            if name.startswith(prefix) and len(prefix) > best:
+                best, found = len(prefix), group
+        return found
+
+    names = [
+        'p-4', 'px-2', 'inset-x-0', 'inset-4', 'border-t-custom-2', 'border-t-2',
+        'border-red-500', '-mt-2', '-top-1', 'rounded-tl-lg', 'rounded-lg', 'text-red-500',
+        'gap-x-4', 'scale-x-50', 'no-match', 'plain', '', '-', 'min-w-0', 'max-h-screen',
+    ]
+    for name in names:
+        assert twmerge._match_prefix(name) == linear_scan(name), name
+
+def test_token_cache_shared_across_calls():
+    twmerge = TailwindMerge(cache_size=None)
+    assert twmerge.merge("p-4 hover:bg-blue-500 flex") == "p-4 hover:bg-blue-500 flex"
+    assert twmerge._token_cache["hover:bg-blue-500"][:3] == ("hover:", "bg-blue-500", "bg_color")
+    assert twmerge.merge("flex p-2", "p-4") == "flex p-4"
+    assert set(twmerge._token_cache) == {"p-4", "hover:bg-blue-500", "flex", "p-2"}
+
+def test_token_cache_is_bounded():
+    twmerge = TailwindMerge(cache_size=None, token_cache_size=2)
+    assert twmerge.merge("p-1 m-1 w-1", "p-2") == "m-1 w-1 p-2"
+    assert len(twmerge._token_cache) == 2
+
+def test_token_cache_flushed_by_add_rule():
+    twmerge = TailwindMerge(cache_size=None)
+    assert twmerge.merge("icon-sm icon-lg") == "icon-sm icon-lg"
+    twmerge.add_rule('icon_size', ['icon-'])
+    assert twmerge.merge("icon-sm icon-lg") == "icon-lg"
+
+
+def _reference_merge(twmerge, *class_lists):
+    """
+    A direct quadratic statement of the merge semantics, kept to pin the output of the
+    linear resolver: a class is dropped if a later class with the same modifiers is in
+    the same group or in a group that overrides it; ungrouped classes are dropped if the
+    identical class appears later.
+    """
+    all_classes = []
+    for class_str in class_lists:
+        if class_str:
+            all_classes.extend(filter(None, class_str.split()))
+    rules = twmerge._rules
+    parsed = []
+    for class_name in all_classes:
+        modifiers, base_class_name = twmerge._extract_modifiers(class_name)
+        group = twmerge._get_group(base_class_name)
+        parsed.append((modifiers, rules.group_ids[group] if group else None))
+
+    result = []
+    for idx, class_name in enumerate(all_classes):
+        modifiers, group_id = parsed[idx]
+        if group_id is None:
+            dropped = class_name in all_classes[idx + 1:]
+        else:
+            dropped = any(
+                later_modifiers == modifiers
+                and (later_group_id == group_id or group_id in rules.overrides[later_group_id])
+                for later_modifiers, later_group_id in parsed[idx + 1:]
+                if later_group_id is not None
+            )
+        if not dropped:
+            result.append(class_name)
+    return ' '.join(result)
+
+
+_CORPUS = [
+    'p-4', 'p-2', 'px-3', 'pt-1', 'm-2', '-mt-2', 'w-6', 'w-8', 'h-full', 'flex', 'block',
+    'inline-flex', 'grid', 'grid-cols-3', 'text-lg', 'text-sm', 'text-red-500', 'text-center',
+    'bg-red-500', 'bg-[#000]', 'bg-cover', 'border', 'border-2', 'border-t-4', 'border-red-300',
+    'rounded', 'rounded-lg', 'rounded-tl-md', 'hover:p-4', 'hover:p-2', 'focus:p-1',
+    'dark:hover:bg-black', 'md:w-1/2', 'md:w-full', 'hover:', 'custom-class', 'another-one',
+    'p-[2px]', 'w-[calc(100%-2rem)]', 'opacity-50', 'shadow-lg', 'transition-all', 'z-10',
+]
+
+
+def test_linear_merge_matches_reference():
+    import random
+
+    rng = random.Random(1234)
+    twmerge = TailwindMerge(cache_size=None)
+    twmerge.add_rule('icon_size', ['icon-sm', 'icon-lg'])
+    corpus = _CORPUS + ['icon-sm', 'icon-lg']
+    for _ in range(500):
+        class_lists = [
+            ' '.join(rng.choice(corpus) for _ in range(rng.randint(0, 12)))
+            for _ in range(rng.randint(1, 4))
+        ]
+        assert twmerge.merge(*class_lists) == _reference_merge(twmerge, *class_lists)
+
+def test_merge_does_linear_work(monkeypatch):
+    lookups = []
+    classified = []
+    operations = []
+
+    class CountingTable(dict):
+        def get(self, key, default=None):
+            lookups.append(key)
+            return super().get(key, default)
+
+    class CountingSet(set):
+        def __contains__(self, item):
+            operations.append(item)
+            return super().__contains__(item)
+
+        def add(self, item):
+            operations.append(item)
+            super().add(item)
+
+        def update(self, items):
+            items = list(items)
+            operations.extend(items)
+            super().update(items)
+
+    class CountingClass(str):
+        # Any scan comparing class names (e.g. a list used for seen classes) shows up here
+        def __eq__(self, other):
+            operations.append(self)
+            return str.__eq__(self, other)
+
+        def __hash__(self):
+            operations.append(self)
+            return str.__hash__(self)
+
+    monkeypatch.setattr(tailwind_merge.core, 'set', CountingSet, raising=False)
+    resolver_operations = {}
+    for n in (1000, 10000):
+        twmerge = TailwindMerge(cache_size=None)
+        rules = twmerge._rules
+        get_group = twmerge._get_group
+
+        def counting_get_group(base_class_name, *args, get_group=get_group):
+            classified.append(base_class_name)
+            return get_group(base_class_name, *args)
+
+        twmerge._get_group = counting_get_group
+        # Mostly unique ungrouped classes - the worst case for the old duplicate scan
+        classes = ' '.join(f"{_CORPUS[i % len(_CORPUS)]} custom-{i}" for i in range(n // 2)).split()
+        lookups.clear()
+        classified.clear()
+        expected = twmerge.merge(*classes)
+        table = CountingTable(rules.token_cache)
+        counting_classes = [CountingClass(class_name) for class_name in classes]
+        operations.clear()
+        # Every class is looked up once, and classified only the first time
+        assert twmerge._resolve(counting_classes, table, rules) == expected
+        assert len(lookups) == n
+        assert len(classified) == len(set(classes))
+        # A handful of hashes and set operations per class, however many classes there are
+        assert len(operations) <= 10 * n
+        resolver_operations[n] = len(operations)
+    assert resolver_operations[10000] <= 12 * resolver_operations[1000]
+
+def test_add_rule_does_not_leak_into_other_instances():
+    first = TailwindMerge()
+    second = TailwindMerge()
+    first.add_rule('icon_size', ['icon-'])
+    assert first.merge("icon-sm icon-lg") == "icon-lg"
+    assert second.merge("icon-sm icon-lg") == "icon-sm icon-lg"
+    assert TailwindMerge().merge("icon-sm icon-lg") == "icon-sm icon-lg"
+    assert 'icon-' not in second._prefix_mapping
+
+def test_module_level_merge():
+    from tailwind_merge import merge, default_merger
+
+    assert merge("p-2 hover:p-4", "p-3") == "hover:p-4 p-3"
+    assert default_merger.merge("block", "inline") == "inline"
+
+def test_merge_many_matches_merge():
+    twmerge = TailwindMerge(cache_size=None)
+    batch = [
+        ("p-4 w-6", "w-8"),
+        "block inline",
+        ("hover:p-2", "focus:p-1 hover:p-4"),
+        ("p-4 w-6", "w-8"),
+        (),
+        ("", None),
+    ]
+    expected = [twmerge.merge(*args) if isinstance(args, tuple) else twmerge.merge(args) for args in batch]
+    assert twmerge.merge_many(batch) == expected
+    assert expected[:3] == ["p-4 w-8", "inline", "focus:p-1 hover:p-4"]
+
+def test_iter_merge_many_classifies_each_token_once():
+    twmerge = TailwindMerge(cache_size=None, token_cache_size=None)
+    calls = []
+    classify = twmerge._classify
+
+    def counting_classify(class_name, rules):
+        calls.append(class_name)
+        return classify(class_name, rules)
+
+    twmerge._classify = counting_classify
+    results = twmerge.iter_merge_many([("p-4 flex", f"p-{i}") for i in range(3)] * 2)
+    assert list(results) == ["flex p-0", "flex p-1", "flex p-2"] * 2
+    assert sorted(calls) == ["flex", "p-0", "p-1", "p-2", "p-4"]
+
+def test_iter_merge_many_reads_the_batch_in_chunks():
+    twmerge = TailwindMerge()
+    consumed = []
+
+    def batch():
+        for i in range(10):
+            consumed.append(i)
+            yield ("p-4", f"p-{i}")
+
+    results = twmerge.iter_merge_many(batch(), chunksize=4)
+    assert next(results) == "p-0"
+    assert consumed == [0, 1, 2, 3]
+    assert [next(results) for _ in range(4)] == ["p-1", "p-2", "p-3", "p-4"]
+    assert consumed == list(range(8))
+    assert list(results) == ["p-5", "p-6", "p-7", "p-8", "p-9"]
+
+def test_conflict_keys_are_packed_ints():
+    twmerge = TailwindMerge(cache_size=None)
+    twmerge.merge("hover:bg-red-500 hover:text-sm text-xs bg-blue-500 hover:bg-blue-500")
+    cache = twmerge._token_cache
+    assert all(isinstance(info[3], int) for info in cache.values())
+    assert cache["hover:bg-red-500"][3] == cache["hover:bg-blue-500"][3]
+    assert cache["hover:bg-red-500"][3] != cache["bg-blue-500"][3]
+    # The group with id 0 without modifiers still conflicts
+    assert cache["text-xs"][3] == 0
+    assert twmerge.merge("text-xs text-lg") == "text-lg"
+    # Every cached entry shares one string object per modifier combination
+    assert cache["hover:bg-red-500"][0] is cache["hover:text-sm"][0]
+
+def test_add_rule_group_ids():
+    twmerge = TailwindMerge()
+    group_count = len(twmerge._rules.group_ids)
+    twmerge.add_rule('icon_size', ['icon-sm'])
+    twmerge.add_rule('icon_size', ['icon-lg'])
+    assert twmerge._rules.group_ids['icon_size'] == group_count
+    assert len(twmerge._rules.group_ids) == group_count + 1
+    assert twmerge.merge("icon-sm icon-lg") == "icon-lg"
+
+def test_add_rule_layers_entries_over_shared_mappings():
+    from tailwind_merge.core import _MAX_ADDED_ENTRIES
+
+    twmerge = TailwindMerge()
+    base_prefixes = twmerge._rules.base_prefixes
+    twmerge.add_rule('icon_size', ['icon-'])
+    twmerge.add_rule('spacing', ['p-'])
+    assert twmerge._rules.base_prefixes is base_prefixes
+    assert twmerge._rules.added_prefixes == {'icon-': 'icon_size', 'p-': 'spacing'}
+    assert twmerge.merge("icon-sm p-2 px-4 icon-lg") == "p-2 px-4 icon-lg"
+
+    # Enough added entries are folded into new base mappings, keeping their precedence
+    for i in range(_MAX_ADDED_ENTRIES):
+        twmerge.add_rule(f'ds_{i}', [f'ds{i}-'])
+    assert twmerge._rules.base_prefixes is not base_prefixes
+    assert len(twmerge._rules.added_prefixes) < _MAX_ADDED_ENTRIES
+    assert twmerge._prefix_mapping['p-'] == 'spacing'
+    assert 'p-' not in TailwindMerge()._rules.added_prefixes
+    assert twmerge.merge("ds3-a p-2 ds3-b") == "p-2 ds3-b"
+
+def test_modifier_ids_overflow_to_tuple_keys(monkeypatch):
+    from tailwind_merge import core
+
+    monkeypatch.setattr(core, '_MAX_MODIFIER_IDS', 2)
+    twmerge = TailwindMerge(cache_size=None)
+    assert twmerge.merge("hover:p-1 focus:p-1 dark:p-1 dark:p-2") == "hover:p-1 focus:p-1 dark:p-2"
+    # Classes are classified last to first, so 'dark:' got the only free id
+    assert isinstance(twmerge._token_cache["dark:p-2"][3], int)
+    assert twmerge._token_cache["hover:p-1"][3] == ("hover:", twmerge._rules.group_ids['padding_all'])
+
+def test_cross_group_conflicts():
+    twmerge = TailwindMerge()
+    assert twmerge.merge("px-2 pl-4", "p-0") == "p-0"
+    assert twmerge.merge("p-0", "px-2 pl-4") == "p-0 px-2 pl-4"
+    assert twmerge.merge("pl-4 px-2") == "px-2"
+    assert twmerge.merge("top-0 left-2 inset-x-4", "inset-1") == "inset-1"
+    assert twmerge.merge("border-t-2 border-4") == "border-4"
+    assert twmerge.merge("rounded-tl-lg rounded-t-md rounded") == "rounded"
+    assert twmerge.merge("mt-2 -mt-4") == "-mt-4"
+    assert twmerge.merge("-mx-2 ml-4 m-0") == "m-0"
+    # Conflicts only apply between classes with the same modifiers
+    assert twmerge.merge("hover:px-2 p-0") == "hover:px-2 p-0"
+
+def test_add_rule_with_conflicts():
+    twmerge = TailwindMerge()
+    twmerge.add_rule('icon_size', ['icon-'])
+    twmerge.add_rule('icon_width', ['icon-w-'])
+    twmerge.add_rule('size', ['size-'], conflicts=['width', 'height', 'icon_size'])
+    assert twmerge.merge("w-4 h-4 icon-lg icon-w-2", "size-6") == "icon-w-2 size-6"
+    # Conflicts declared later are applied transitively
+    twmerge.add_rule('icon_size', ['icon-'], conflicts=['icon_width'])
+    assert twmerge.merge("icon-w-2 icon-lg", "size-6") == "size-6"
+
+def test_add_rule_unknown_conflict_group():
+    import pytest
+
+    twmerge = TailwindMerge()
+    with pytest.raises(ValueError):
+        twmerge.add_rule('size', ['size-'], conflicts=['no_such_group'])
+    assert 'size' not in twmerge._rules.group_ids
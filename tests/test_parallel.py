@@ -0,0 +1,72 @@
+from tailwind_merge import TailwindMerge
+from tailwind_merge import parallel
+
+
+def _inputs(count):
+    return [
+        (f"p-{i % 5} px-{i % 3} hover:bg-red-{i % 9}00 icon-{i % 4}", f"p-{i % 7} size-{i % 2}")
+        if i % 3 else f"w-{i % 4} h-{i % 3} w-{i % 6}"
+        for i in range(count)
+    ]
+
+
+def test_merge_parallel_matches_merge():
+    twmerge = TailwindMerge()
+    twmerge.add_rule('icon_size', ['icon-'])
+    twmerge.add_rule('size', ['size-'], conflicts=['width', 'height', 'icon_size'])
+    inputs = _inputs(3000)
+    expected = [twmerge.merge(*args) if isinstance(args, tuple) else twmerge.merge(args) for args in inputs]
+    assert twmerge.merge_parallel(inputs, workers=2, chunksize=100, min_parallel=10) == expected
+
+def test_iter_merge_parallel_streams_in_order():
+    twmerge = TailwindMerge()
+    inputs = _inputs(1000)
+    expected = [twmerge.merge(*args) if isinstance(args, tuple) else twmerge.merge(args) for args in inputs]
+    results = twmerge.iter_merge_parallel(iter(inputs), workers=2, chunksize=7, min_parallel=10)
+    assert next(results) == expected[0]
+    assert [expected[0]] + list(results) == expected
+
+def test_small_inputs_run_in_process(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool should not be started")
+
+    monkeypatch.setattr(parallel, 'ProcessPoolExecutor', no_pool)
+    twmerge = TailwindMerge()
+    assert twmerge.merge_parallel([("p-4", "p-2"), "block inline"], workers=4) == ["p-2", "inline"]
+    assert twmerge.merge_parallel(_inputs(50), workers=1, min_parallel=10) == twmerge.merge_many(_inputs(50))
+
+def test_single_worker_merges_everything_as_a_batch(monkeypatch):
+    def no_merge(*args):
+        raise AssertionError("inputs should not be merged one by one")
+
+    monkeypatch.setattr(parallel, 'ProcessPoolExecutor', None)
+    twmerge = TailwindMerge()
+    expected = twmerge.merge_many(_inputs(50))
+    monkeypatch.setattr(twmerge, 'merge', no_merge)
+    assert twmerge.merge_parallel(iter(_inputs(50)), workers=1, min_parallel=10) == expected
+
+def test_merge_parallel_with_classifier_loaded_from_a_path(tmp_path):
+    import importlib.util
+    import pickle
+
+    from tailwind_merge import _classifier, codegen
+
+    twmerge = TailwindMerge()
+    twmerge.add_rule('icon_size', ['icon-'])
+    path = tmp_path / 'twm_path_classifier.py'
+    codegen.write(twmerge, str(path))
+    spec = importlib.util.spec_from_file_location('twm_path_classifier', str(path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    twmerge.use_classifier(module)
+
+    # Workers that can't import the module fall back to the interpreted lookup
+    assert pickle.loads(pickle.dumps(twmerge._rules)).classifier is None
+    inputs = _inputs(300)
+    expected = [twmerge.merge(*args) if isinstance(args, tuple) else twmerge.merge(args) for args in inputs]
+    assert twmerge.merge_parallel(inputs, workers=2, chunksize=50, min_parallel=10) == expected
+
+    # An importable module is used again after unpickling
+    default = TailwindMerge()
+    default.use_classifier(_classifier)
+    assert pickle.loads(pickle.dumps(default._rules)).classifier is _classifier.get_group
@@ -0,0 +1,95 @@
+import io
+
+from tailwind_merge import TailwindMerge
+from tailwind_merge.__main__ import main
+from tailwind_merge.rewrite import rewrite_html
+
+HTML = (
+    '<div class="p-4 p-2 flex" data-class="p-1 p-2">'
+    "<span CLASS = 'w-2 w-4'>text</span>"
+    '<a :class="p-1 p-2" class="">link</a></div>'
+)
+EXPECTED = (
+    '<div class="p-2 flex" data-class="p-1 p-2">'
+    "<span CLASS = 'w-4'>text</span>"
+    '<a :class="p-1 p-2" class="">link</a></div>'
+)
+
+
+def test_rewrite_single_chunk():
+    assert ''.join(rewrite_html([HTML])) == EXPECTED
+
+def test_rewrite_attributes_split_across_chunks():
+    for size in range(1, 25):
+        chunks = [HTML[i:i + size] for i in range(0, len(HTML), size)]
+        assert ''.join(rewrite_html(chunks)) == EXPECTED, size
+
+def test_rewrite_file_like_object():
+    assert ''.join(rewrite_html(io.StringIO(HTML), chunk_size=7)) == EXPECTED
+
+def test_rewrite_uses_given_merger():
+    twmerge = TailwindMerge()
+    twmerge.add_rule('icon_size', ['icon-'])
+    html = '<i class="icon-sm icon-lg"></i>'
+    assert ''.join(rewrite_html([html], merger=twmerge)) == '<i class="icon-lg"></i>'
+    assert ''.join(rewrite_html([html])) == html
+
+def test_rewrite_buffer_is_bounded():
+    # An unterminated attribute longer than the limit is passed through untouched
+    html = '<div class="p-4 ' + 'x ' * 100 + 'p-2'
+    chunks = [html[i:i + 10] for i in range(0, len(html), 10)]
+    pieces = list(rewrite_html(chunks, max_attribute_length=50))
+    assert ''.join(pieces) == html
+    assert max(len(piece) for piece in pieces) <= 70
+
+def test_rewrite_skips_comments_scripts_and_styles():
+    html = (
+        '<!-- <b class="p-1 p-2"> --><p class="p-1 p-2"></p>'
+        '<SCRIPT class="w-1 w-2">el.innerHTML = \'<i class="p-1 p-2">\';</script >'
+        '<style>.x { content: \'class="p-1 p-2"\' }</style><i class="w-1 w-2"></i>'
+    )
+    expected = (
+        '<!-- <b class="p-1 p-2"> --><p class="p-2"></p>'
+        '<SCRIPT class="w-1 w-2">el.innerHTML = \'<i class="p-1 p-2">\';</script >'
+        '<style>.x { content: \'class="p-1 p-2"\' }</style><i class="w-2"></i>'
+    )
+    for size in range(1, 30):
+        chunks = [html[i:i + size] for i in range(0, len(html), size)]
+        assert ''.join(rewrite_html(chunks)) == expected, size
+
+def test_rewrite_tag_names_split_at_chunk_boundaries():
+    for tag in ('script', 'style'):
+        chunks = [f'<{tag}', 'x class="m-1 m-2"><div class="p-1 p-2">']
+        expected = f'<{tag}x class="m-2"><div class="p-2">'
+        assert ''.join(rewrite_html(chunks)) == expected
+        chunks = [f'<{tag}', f'>class="p-1 p-2"</{tag}><div class="p-1 p-2">']
+        expected = f'<{tag}>class="p-1 p-2"</{tag}><div class="p-2">'
+        assert ''.join(rewrite_html(chunks)) == expected
+
+def test_rewrite_custom_elements_named_like_skipped_tags():
+    html = '<style-provider class="p-1 p-2"><script-x class="m-1 m-2"></script-x></style-provider><i class="w-1 w-2">'
+    expected = '<style-provider class="p-2"><script-x class="m-2"></script-x></style-provider><i class="w-2">'
+    assert ''.join(rewrite_html([html])) == expected
+
+def test_rewrite_does_not_depend_on_chunking():
+    import random
+
+    rng = random.Random(7)
+    pieces = ['<script', '<style', '<style-x', '<!--', '-->', '</script>', '</style>', '>', ' ',
+              'class="p-1 p-2"', 'class=\'m-1 m-2\'', 'x', '<div ', '"']
+    for _ in range(3000):
+        html = ''.join(rng.choice(pieces) for _ in range(rng.randint(1, 20)))
+        expected = ''.join(rewrite_html([html]))
+        cuts = sorted(rng.sample(range(1, len(html)), min(len(html) - 1, rng.randint(0, 6))))
+        chunks = [html[i:j] for i, j in zip([0] + cuts, cuts + [len(html)])]
+        assert ''.join(rewrite_html(chunks)) == expected, (html, chunks)
+
+def test_rewrite_cli(tmp_path, capsys):
+    source = tmp_path / 'in.html'
+    source.write_text(HTML, encoding='utf-8')
+    assert main(['rewrite', str(source)]) == 0
+    assert capsys.readouterr().out == EXPECTED
+
+    target = tmp_path / 'out.html'
+    assert main(['rewrite', str(source), '-o', str(target)]) == 0
+    assert target.read_text(encoding='utf-8') == EXPECTED
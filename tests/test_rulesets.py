@@ -0,0 +1,97 @@
+import copy
+import pickle
+
+import pytest
+
+from scripts import build_rulesets
+from tailwind_merge import TailwindMerge
+from tailwind_merge.rulesets import SUPPORTED_VERSIONS, data_path, load_rule_data, section_key
+
+
+@pytest.mark.parametrize('version', SUPPORTED_VERSIONS)
+def test_data_files_are_up_to_date(version):
+    with open(data_path(version), 'rb') as f:
+        assert f.read() == build_rulesets.build(version)
+
+def test_section_key():
+    assert section_key('text-red-500') == 'text'
+    assert section_key('text-') == 'text'
+    assert section_key('-mt-4') == '-mt'
+    assert section_key('flex') == 'flex'
+
+def test_v3_utilities_missing_from_default_groups():
+    twmerge = TailwindMerge(version=3)
+    assert twmerge.merge("ring-2 ring-red-500", "ring-4") == "ring-red-500 ring-4"
+    assert twmerge.merge("space-x-2 -space-x-4 space-x-reverse") == "-space-x-4 space-x-reverse"
+    assert twmerge.merge("divide-y divide-x-2 divide-y-4") == "divide-x-2 divide-y-4"
+    assert twmerge.merge("aspect-video columns-2 aspect-square columns-3") == "aspect-square columns-3"
+    assert twmerge.merge("blur-sm brightness-50 blur-lg") == "brightness-50 blur-lg"
+    assert twmerge.merge("snap-x scroll-mt-2 snap-y scroll-m-4") == "snap-y scroll-m-4"
+    assert twmerge.merge("outline outline-offset-2", "outline-dashed") == "outline-offset-2 outline-dashed"
+    assert twmerge.merge("-mt-2 mt-4 rounded-t rounded-lg") == "mt-4 rounded-lg"
+    assert twmerge.merge("w-2 h-3 hover:w-4", "size-4") == "hover:w-4 size-4"
+    assert twmerge.merge("bg-opacity-50 bg-red-500 bg-opacity-20") == "bg-red-500 bg-opacity-20"
+
+def test_v4_ruleset():
+    twmerge = TailwindMerge(version='4')
+    assert twmerge.merge("shadow-xs inset-shadow-sm shadow-lg") == "inset-shadow-sm shadow-lg"
+    assert twmerge.merge("outline outline-hidden outline-2") == "outline-hidden outline-2"
+    assert twmerge.merge("translate-x-2 translate-y-1 translate-4") == "translate-4"
+    assert twmerge.merge("scheme-dark field-sizing-content scheme-light") == "field-sizing-content scheme-light"
+
+def test_unsupported_version():
+    with pytest.raises(ValueError):
+        TailwindMerge(version=2)
+
+def test_sections_load_lazily():
+    twmerge = TailwindMerge(version=3)
+    assert twmerge._rules.loaded_sections == set()
+    assert not twmerge._prefix_mapping and not twmerge._exact_mapping
+
+    twmerge.merge("px-2 hover:ring-2 unknown-class")
+    assert twmerge._rules.loaded_sections == {'px', 'ring'}
+    assert set(twmerge._prefix_mapping) == {'px-', 'ring-', 'ring-offset-', 'ring-opacity-'}
+    # Instances share the parsed sections, but not their mappings
+    assert TailwindMerge(version=3)._rules.loaded_sections == set()
+
+def test_add_rule_takes_precedence_over_sections_loaded_later():
+    twmerge = TailwindMerge(version=3)
+    twmerge.add_rule('ring_glow', ['ring-glow'], conflicts=['ring_width'])
+    assert twmerge._rules.loaded_sections == set()
+    assert twmerge.merge("ring-2 ring-glow") == "ring-glow"
+    assert twmerge._exact_mapping['ring-glow'] == 'ring_glow'
+    assert twmerge.merge("ring-glow ring-2") == "ring-glow ring-2"
+
+def test_added_rules_keep_precedence_after_folding():
+    from tailwind_merge.core import _MAX_ADDED_ENTRIES
+
+    twmerge = TailwindMerge(version=3)
+    twmerge.add_rule('ring_glow', ['ring-glow'], conflicts=['ring_width'])
+    before = twmerge._rules
+    twmerge.add_rule('icon_size', ['icon-'])
+    # Rulesets sharing base mappings share the sections loaded into them
+    twmerge.merge("px-2")
+    assert before.loaded_sections == {'px'}
+    for i in range(_MAX_ADDED_ENTRIES):
+        twmerge.add_rule(f'ds_{i}', [f'ds{i}-'])
+    assert twmerge._rules.base_exact is not before.base_exact
+    assert twmerge.merge("ring-2 ring-glow px-2 px-4") == "ring-glow px-4"
+    assert twmerge._rules.loaded_sections == {'px', 'ring'}
+    assert before.loaded_sections == {'px'}
+
+def test_groups_lists_the_full_ruleset():
+    twmerge = TailwindMerge(version=3)
+    twmerge.add_rule('icon_size', ['icon-'])
+    groups = dict(twmerge.groups)
+    assert groups['ring_width'] == ('ring', 'ring-0', 'ring-1', 'ring-2', 'ring-4', 'ring-8')
+    assert groups['icon_size'] == ('icon-',)
+    assert len(groups) == len(load_rule_data('3').group_names) + 1
+
+def test_ruleset_copies_keep_data_and_loaded_sections():
+    twmerge = TailwindMerge(version=3)
+    twmerge.merge("ring-2")
+    for rules in (copy.copy(twmerge._rules), pickle.loads(pickle.dumps(twmerge._rules))):
+        assert rules.data is load_rule_data('3')
+        assert rules.loaded_sections == {'ring'}
+        assert rules.prefix_mapping == twmerge._prefix_mapping
+        assert rules.base_prefixes is not twmerge._rules.base_prefixes
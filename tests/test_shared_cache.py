@@ -0,0 +1,141 @@
+import multiprocessing
+import os
+
+import pytest
+
+from tailwind_merge import SharedCache, TailwindMerge
+
+
+def _merge_in_child(path, class_lists):
+    with SharedCache(path, capacity=64) as cache:
+        TailwindMerge(cache_size=None, shared_cache=cache).merge(*class_lists)
+
+
+def _inputs(seed):
+    return [f"p-{i % 7} m-{(i * seed) % 5} custom-{i % 50} p-{(i + seed) % 3}" for i in range(300)]
+
+
+def _merge_many_in_child(path, seed):
+    with SharedCache(path, capacity=32, slot_size=128) as cache:
+        twmerge = TailwindMerge(cache_size=None, shared_cache=cache)
+        for class_str in _inputs(seed):
+            twmerge.merge(class_str)
+
+
+def test_shared_cache_serves_other_instances(tmp_path, monkeypatch):
+    path = str(tmp_path / 'merge.cache')
+    with SharedCache(path, capacity=64) as cache:
+        assert TailwindMerge(shared_cache=cache).merge("p-4 w-6", "p-2") == "w-6 p-2"
+        assert cache.misses == 1
+
+        other = TailwindMerge(cache_size=None, shared_cache=cache)
+        monkeypatch.setattr(other, '_merge', lambda *args: pytest.fail("merge should come from the shared cache"))
+        # The key only depends on the classes, not how they were split across arguments
+        assert other.merge("p-4", "w-6 p-2") == "w-6 p-2"
+        assert cache.hits == 1
+
+def test_shared_cache_across_processes(tmp_path):
+    path = str(tmp_path / 'merge.cache')
+    process = multiprocessing.Process(target=_merge_in_child, args=(path, ("block px-2", "inline")))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+    with SharedCache(path, capacity=64) as cache:
+        rules = TailwindMerge()._rules
+        assert cache.get(rules.fingerprint(), cache.key(("block px-2", "inline"))) == "px-2 inline"
+
+def test_shared_cache_concurrent_writers(tmp_path):
+    path = str(tmp_path / 'merge.cache')
+    SharedCache(path, capacity=32, slot_size=128).close()
+    processes = [multiprocessing.Process(target=_merge_many_in_child, args=(path, seed)) for seed in (1, 2, 3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    twmerge = TailwindMerge(cache_size=None)
+    fingerprint = twmerge._rules.fingerprint()
+    with SharedCache(path, capacity=32, slot_size=128) as cache:
+        for seed in (1, 2, 3):
+            for class_str in _inputs(seed):
+                cached = cache.get(fingerprint, cache.key((class_str,)))
+                assert cached is None or cached == twmerge.merge(class_str)
+        assert cache.hits > 0
+
+def test_shared_cache_separates_rulesets(tmp_path):
+    with SharedCache(str(tmp_path / 'merge.cache'), capacity=64) as cache:
+        custom = TailwindMerge(shared_cache=cache)
+        custom.add_rule('icon_size', ['icon-'])
+        assert custom.merge("icon-sm icon-lg") == "icon-lg"
+        assert TailwindMerge(shared_cache=cache).merge("icon-sm icon-lg") == "icon-sm icon-lg"
+        assert TailwindMerge(version=3, shared_cache=cache).merge("icon-sm icon-lg") == "icon-sm icon-lg"
+        assert cache.hits == 0
+
+        other = TailwindMerge(shared_cache=cache)
+        other.add_rule('icon_size', ['icon-'])
+        assert other._rules.fingerprint() == custom._rules.fingerprint()
+        assert other.merge("icon-sm icon-lg") == "icon-lg"
+        assert cache.hits == 1
+
+def test_shared_cache_is_bounded(tmp_path):
+    path = str(tmp_path / 'merge.cache')
+    with SharedCache(path, capacity=8, slot_size=128) as cache:
+        size = os.path.getsize(path)
+        twmerge = TailwindMerge(cache_size=None, shared_cache=cache)
+        for i in range(100):
+            assert twmerge.merge(f"p-{i} custom-{i}") == f"p-{i} custom-{i}"
+        assert os.path.getsize(path) == size
+        fingerprint = twmerge._rules.fingerprint()
+        assert cache.get(fingerprint, cache.key(("p-99 custom-99",))) == "p-99 custom-99"
+        # Too large for a slot: merged, but not cached
+        long_classes = ' '.join(f"custom-{i}" for i in range(20))
+        assert twmerge.merge(long_classes) == long_classes
+        assert cache.get(fingerprint, cache.key((long_classes,))) is None
+
+def test_shared_cache_rejects_damaged_records(tmp_path):
+    with SharedCache(str(tmp_path / 'merge.cache'), capacity=1, slot_size=128) as cache:
+        fingerprint = b'\1' * 8
+        assert cache.put(fingerprint, b'p-4 p-2', 'p-2')
+        assert cache.get(fingerprint, b'p-4 p-2') == 'p-2'
+        assert cache.get(b'\2' * 8, b'p-4 p-2') is None
+        end = 64 + 16 + len(b'p-4 p-2')
+        cache._map[end:end + 1] = b'X'
+        assert cache.get(fingerprint, b'p-4 p-2') is None
+        cache.clear()
+        assert cache.get(fingerprint, b'p-4 p-2') is None
+
+def test_shared_cache_reads_one_consistent_copy(tmp_path):
+    class OverwrittenAfterRead:
+        """A map that another process overwrites right after each read."""
+        def __init__(self, mapping):
+            self.mapping = mapping
+
+        def __getitem__(self, index):
+            data = self.mapping[index]
+            end = 64 + 16 + len(b'p-4 p-2')
+            self.mapping[end:end + 3] = b'\xff\xff\xff'
+            return data
+
+    with SharedCache(str(tmp_path / 'merge.cache'), capacity=1, slot_size=128) as cache:
+        fingerprint = b'\1' * 8
+        assert cache.put(fingerprint, b'p-4 p-2', 'p-2')
+        live = cache._map
+        cache._map = OverwrittenAfterRead(live)
+        try:
+            assert cache.get(fingerprint, b'p-4 p-2') == 'p-2'
+            # The next read sees the damaged record and rejects it
+            assert cache.get(fingerprint, b'p-4 p-2') is None
+        finally:
+            cache._map = live
+
+def test_shared_cache_layout_mismatch(tmp_path):
+    path = str(tmp_path / 'merge.cache')
+    SharedCache(path, capacity=16).close()
+    with pytest.raises(ValueError):
+        SharedCache(path, capacity=32)
+    other = tmp_path / 'other.txt'
+    other.write_text("not a cache file, but long enough to hold a header")
+    with pytest.raises(ValueError):
+        SharedCache(str(other))
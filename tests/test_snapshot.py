@@ -0,0 +1,75 @@
+import pytest
+
+from tailwind_merge import TailwindMerge
+from tailwind_merge.__main__ import main
+from tailwind_merge.snapshot import extract_class_strings
+
+TEMPLATE = '''
+<div class="p-4 p-2 hover:bg-red-500 !m-1 card" data-class="w-1">
+  <span class="{% if active %}bg-blue-500{% endif %} text-{{ color }}-500 {{ 'font-bold' if strong }}">
+  <Button className="px-2 px-4" />
+  <Icon className={`w-4 ${large ? "w-6" : ''} h-4`} />
+</div>
+'''
+
+
+def test_extract_class_strings():
+    assert list(extract_class_strings(TEMPLATE)) == [
+        ('p-4 p-2 hover:bg-red-500 !m-1 card', True),
+        ('font-bold', False),
+        ('bg-blue-500', False),
+        ('px-2 px-4', True),
+        ('w-6', False),
+        ('', False),
+        ('w-4 h-4', False),
+    ]
+
+def test_snapshot_round_trip(tmp_path):
+    template = tmp_path / 'templates' / 'page.html'
+    template.parent.mkdir()
+    template.write_text(TEMPLATE, encoding='utf-8')
+    snapshot = tmp_path / 'twm.snapshot'
+    assert main(['warm', str(template.parent), '-o', str(snapshot)]) == 0
+
+    warm = TailwindMerge()
+    assert warm.load_snapshot(str(snapshot)) == 12
+    assert warm.cache_info().currsize == 2
+    assert warm.merge('px-2 px-4') == 'px-4'
+    assert warm.cache_info().hits == 1
+
+    # Loaded classifications are the ones a cold instance computes (modifier ids may differ)
+    cold = TailwindMerge()
+    for token in ('!m-1', 'hover:bg-red-500', 'card', 'w-6'):
+        assert warm._token_cache[token][:3] == cold._classify(token, cold._rules)[:3]
+    inputs = ('p-4 !m-1 hover:bg-red-500', 'hover:bg-red-600 !m-2 p-1 card card')
+    assert warm.merge(*inputs) == cold.merge(*inputs)
+
+def test_snapshot_respects_cache_sizes(tmp_path):
+    snapshot = tmp_path / 'twm.snapshot'
+    TailwindMerge().save_snapshot(str(snapshot), ['p-1 p-2 p-3', 'p-1', 'p-1 m-1'])
+    twmerge = TailwindMerge(cache_size=1, token_cache_size=2)
+    assert twmerge.load_snapshot(str(snapshot)) == 2
+    # Most frequent first
+    assert list(twmerge._token_cache) == ['p-1', 'p-2']
+    assert list(twmerge._cache) == [('p-1 p-2 p-3',)]
+
+def test_snapshot_rejected_when_rules_change(tmp_path):
+    snapshot = tmp_path / 'twm.snapshot'
+    TailwindMerge().save_snapshot(str(snapshot), ['p-1 icon-sm'])
+
+    custom = TailwindMerge()
+    custom.add_rule('icon_size', ['icon-'])
+    with pytest.raises(ValueError, match='different rules'):
+        custom.load_snapshot(str(snapshot))
+    with pytest.raises(ValueError, match='different rules'):
+        TailwindMerge(version=4).load_snapshot(str(snapshot))
+
+    custom.save_snapshot(str(snapshot), ['p-1 icon-sm'])
+    assert custom.load_snapshot(str(snapshot)) == 0  # already classified while saving
+    other = TailwindMerge()
+    other.add_rule('icon_size', ['icon-'])
+    assert other.load_snapshot(str(snapshot)) == 2
+
+    snapshot.write_bytes(b'not a snapshot')
+    with pytest.raises(ValueError, match='not a tailwind-merge snapshot'):
+        other.load_snapshot(str(snapshot))
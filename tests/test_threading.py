@@ -0,0 +1,60 @@
+import sys
+import threading
+
+from tailwind_merge import TailwindMerge
+
+
+def test_concurrent_merge_and_add_rule():
+    """Merges racing add_rule must never fail or see a partially applied rule."""
+    twmerge = TailwindMerge(cache_size=64, token_cache_size=64)
+    rule_count = 200
+    errors = []
+    done = threading.Event()
+
+    def writer():
+        try:
+            for i in range(rule_count):
+                twmerge.add_rule(f"custom_{i}", [f"cx{i}-", f"cx{i}"])
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+        finally:
+            done.set()
+
+    def reader(seed):
+        try:
+            n = seed
+            while not done.is_set():
+                i = n % rule_count
+                result = twmerge.merge(f"p-4 cx{i}-a hover:p-1", f"cx{i} cx{i}-b p-2")
+                # Before the rule exists all custom classes survive; after, only the last one
+                assert result in (
+                    f"cx{i}-a hover:p-1 cx{i} cx{i}-b p-2",
+                    f"hover:p-1 cx{i}-b p-2",
+                ), result
+                n += 7
+        except Exception as exc:
+            errors.append(exc)
+
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=reader, args=(seed,)) for seed in range(8)]
+        threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(old_interval)
+
+    assert not errors, errors[0]
+    assert len(twmerge.groups) > rule_count
+    assert twmerge.merge("cx7-a", "cx7-b") == "cx7-b"
+
+def test_add_rule_publishes_new_ruleset():
+    twmerge = TailwindMerge()
+    before = twmerge._rules
+    twmerge.add_rule('icon_size', ['icon-'])
+    assert twmerge._rules is not before
+    assert 'icon-' not in before.prefix_mapping
+    assert twmerge._prefix_mapping['icon-'] == 'icon_size'
@@ -0,0 +1,46 @@
+from tailwind_merge import TailwindMerge
+from tailwind_merge.tokenizer import ParsedClass, parse_class
+
+
+def test_parse_class_parts():
+    assert parse_class('md:hover:!-mt-[3px]') == ParsedClass('md:hover:', True, True, 'mt', '3px', None)
+    assert parse_class('p-4!') == ParsedClass('', True, False, 'p-4', None, None)
+    assert parse_class('bg-red-500/50') == ParsedClass('', False, False, 'bg-red-500', None, '50')
+    assert parse_class('bg-[#fff]/[.5]') == ParsedClass('', False, False, 'bg', '#fff', '[.5]')
+    assert parse_class('bg-(--brand)') == ParsedClass('', False, False, 'bg', '--brand', None)
+    assert parse_class('-mt-4').base == '-mt-4'
+    assert parse_class('hover:') == ParsedClass('hover:', False, False, '', None, None)
+
+def test_parse_class_ignores_separators_inside_brackets():
+    assert parse_class('bg-[url(https://x.dev/a.png)]') == (
+        ParsedClass('', False, False, 'bg', 'url(https://x.dev/a.png)', None)
+    )
+    assert parse_class('[mask-type:luminance]') == ParsedClass('', False, False, '', 'mask-type:luminance', None)
+    assert parse_class('[&:hover]:p-4') == ParsedClass('[&:hover]:', False, False, 'p-4', None, None)
+    assert parse_class('group-[.open:hover]:text-sm/6') == (
+        ParsedClass('group-[.open:hover]:', False, False, 'text-sm', None, '6')
+    )
+    assert parse_class('aspect-[4/3]') == ParsedClass('', False, False, 'aspect', '4/3', None)
+    # Brackets that don't end the utility aren't an arbitrary value
+    assert parse_class('x-[a]b') == ParsedClass('', False, False, 'x-[a]b', None, None)
+
+def test_merge_arbitrary_values_with_colons():
+    twmerge = TailwindMerge()
+    assert twmerge.merge("bg-none bg-[url(https://x.dev/a.png)]") == "bg-[url(https://x.dev/a.png)]"
+    assert twmerge.merge("[&:hover]:p-2 [&:hover]:p-4 p-1") == "[&:hover]:p-4 p-1"
+    assert twmerge.merge("[mask-type:luminance] [mask-type:alpha]") == "[mask-type:luminance] [mask-type:alpha]"
+    assert twmerge._extract_modifiers("[&:hover]:p-4") == ("[&:hover]:", "p-4")
+
+def test_merge_important_classes_conflict_among_themselves():
+    twmerge = TailwindMerge()
+    assert twmerge.merge("!p-4 !p-2") == "!p-2"
+    assert twmerge.merge("p-4! hover:!p-1 !p-2") == "hover:!p-1 !p-2"
+    assert twmerge.merge("!p-4 p-2") == "!p-4 p-2"
+
+def test_merge_postfix():
+    twmerge = TailwindMerge()
+    assert twmerge.merge("bg-red-500/50 bg-blue-500/[.3]") == "bg-blue-500/[.3]"
+    assert twmerge.merge("text-lg/7 text-sm/6") == "text-sm/6"
+    assert twmerge.merge("w-1/2 w-full") == "w-full"
+    twmerge.add_rule('half', ['w-1/2'])
+    assert twmerge.merge("w-1/2 w-full") == "w-1/2 w-full"
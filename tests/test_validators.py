@@ -0,0 +1,81 @@
+import pytest
+
+from tailwind_merge import TailwindMerge, codegen
+from tailwind_merge.validators import value_types
+
+
+def is_weight(value):
+    return value.startswith('wght')
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('14px', {'length'}), ('1.25rem', {'length'}), ('-2.5dvh', {'length'}), ('calc(100%-2rem)', {'length'}),
+    ('50%', {'percentage', 'length'}), ('0', {'number', 'length'}), ('3', {'number'}), ('.5', {'number'}),
+    ('#f00', {'color'}), ('#0f172acc', {'color'}), ('rgb(1,2,3)', {'color'}), ('oklch(70%_0.1_200)', {'color'}),
+    ("url('/img/a.png')", {'url', 'image'}), ('linear-gradient(red,blue)', {'image'}),
+    ('length:var(--size)', {'length'}), ('color:var(--brand)', {'color'}), ('url:var(--hero)', {'url', 'image'}),
+    ('position:center', set()), ('var(--x)', set()), ('red', set()), ('#ggg', set()),
+])
+def test_value_types(value, expected):
+    assert value_types(value) == expected
+
+def test_value_types_are_memoized():
+    value_types.cache_clear()
+    twmerge = TailwindMerge(token_cache_size=None, cache_size=None)
+    for _ in range(3):
+        twmerge.merge("text-[13px] text-[#123456]")
+    assert value_types.cache_info().misses == 2
+    assert value_types.cache_info().hits == 4
+
+def test_typed_prefixes_route_by_value():
+    twmerge = TailwindMerge()
+    assert twmerge.merge("text-[14px] text-[#ff0000]") == "text-[14px] text-[#ff0000]"
+    assert twmerge.merge("text-lg text-red-500 text-[14px]") == "text-red-500 text-[14px]"
+    assert twmerge.merge("text-[#000] text-[color:var(--c)]") == "text-[color:var(--c)]"
+    assert twmerge.merge("bg-[#000] bg-[url(/a.png)]") == "bg-[#000] bg-[url(/a.png)]"
+    assert twmerge.merge("bg-none bg-[url(/a.png)] bg-red-500 bg-[#000]") == "bg-[url(/a.png)] bg-[#000]"
+    assert twmerge.merge("bg-cover bg-[length:200px_100px] bg-center bg-[30%]") == "bg-[length:200px_100px] bg-[30%]"
+    assert twmerge.merge("border-2 border-[3px] border-red-500 border-t-[1px] border-[#000]") == (
+        "border-[3px] border-t-[1px] border-[#000]"
+    )
+
+def test_full_rulesets_route_by_value():
+    for version in (3, 4):
+        twmerge = TailwindMerge(version=version)
+        assert twmerge.merge("stroke-2 stroke-red-500 stroke-[3]") == "stroke-red-500 stroke-[3]"
+        assert twmerge.merge("ring-2 ring-[3px] ring-[#abc] ring-blue-500") == "ring-[3px] ring-blue-500"
+        assert twmerge.merge("border-x-2 border-x-[3px] border-s-[2px] border-s-red-500") == (
+            "border-x-[3px] border-s-[2px] border-s-red-500"
+        )
+        assert twmerge.merge("bg-gradient-to-r bg-[url(/a.png)] bg-[#000]") == "bg-[url(/a.png)] bg-[#000]"
+
+def test_add_rule_with_value_types():
+    twmerge = TailwindMerge()
+    twmerge.add_rule('icon_color', ['icon-'])
+    twmerge.add_rule('icon_size', ['icon-sm', 'icon-lg', 'icon-'], value_types=['length'])
+    assert twmerge.merge("icon-sm icon-[2rem] icon-red icon-[#f00]") == "icon-[2rem] icon-[#f00]"
+
+    # Custom validators; the newest rule for a prefix is tried first
+    twmerge.add_rule('icon_weight', ['icon-'], value_types=[is_weight])
+    assert twmerge.merge("icon-[wght_400] icon-[2rem] icon-[wght_700]") == "icon-[2rem] icon-[wght_700]"
+    with pytest.raises(ValueError, match="custom validator"):
+        codegen.generate(twmerge)
+
+    # A new prefix takes its other classes too
+    twmerge.add_rule('glow_size', ['glow-'], value_types=['length'])
+    assert twmerge.merge("glow-4 glow-[3px]") == "glow-[3px]"
+
+    with pytest.raises(ValueError, match="Unknown value type"):
+        twmerge.add_rule('bad', ['bad-'], value_types=['colour'])
+
+def test_add_rule_rejects_anonymous_validators():
+    def make_validator(prefix):
+        def validator(value):
+            return value.startswith(prefix)
+        return validator
+
+    twmerge = TailwindMerge()
+    for validator in (lambda value: True, make_validator('wght'), 42):
+        with pytest.raises(ValueError, match="module-level functions"):
+            twmerge.add_rule('icon_weight', ['icon-'], value_types=[validator])
+    assert 'icon_weight' not in twmerge._rules.group_ids
@@ -0,0 +1,49 @@
+import itertools
+
+import pytest
+
+from tailwind_merge import TailwindMerge
+
+BASE = "inline-flex items-center rounded px-4 py-2 bg-gray-100"
+AXES = {
+    "size": {"sm": "px-2 py-1 text-sm", "lg": "px-6 py-3 text-lg"},
+    "intent": {"primary": "bg-blue-500 text-white", "danger": "bg-red-500 text-white"},
+    "disabled": {True: "opacity-50 bg-gray-100", False: ""},
+}
+
+
+@pytest.mark.parametrize('eager_limit', [256, 0], ids=['eager', 'lazy'])
+def test_variants_match_merge(eager_limit):
+    twmerge = TailwindMerge()
+    button = twmerge.variants(BASE, AXES, defaults={"size": "sm"}, eager_limit=eager_limit)
+    assert len(button._state[1]) == (18 if eager_limit else 0)
+    for size, intent, disabled in itertools.product(["sm", "lg"], ["primary", "danger", None], [True, False, None]):
+        class_lists = [BASE, AXES["size"][size]]
+        if intent is not None:
+            class_lists.append(AXES["intent"][intent])
+        if disabled is not None:
+            class_lists.append(AXES["disabled"][disabled])
+        assert button(size=size, intent=intent, disabled=disabled) == twmerge.merge(*class_lists)
+    assert button() == button(size="sm") == twmerge.merge(BASE, AXES["size"]["sm"])
+
+def test_variants_merge_extra_classes_on_top():
+    button = TailwindMerge().variants(BASE, AXES)
+    assert button("px-1 mt-2", intent="danger") == "inline-flex items-center rounded py-2 bg-red-500 text-white px-1 mt-2"
+    assert button(["text-black", {"hidden": False}], intent="danger").endswith("bg-red-500 text-black")
+
+def test_variants_rebuild_after_add_rule():
+    twmerge = TailwindMerge()
+    card = twmerge.variants("shade-1 p-2", {"tone": {"dark": "shade-9"}})
+    assert card(tone="dark") == "shade-1 p-2 shade-9"
+    twmerge.add_rule('shade', ['shade-'])
+    assert card(tone="dark") == "p-2 shade-9"
+
+def test_variants_reject_unknown_axes_and_options():
+    twmerge = TailwindMerge()
+    button = twmerge.variants(BASE, AXES)
+    with pytest.raises(TypeError, match="axis 'colour'"):
+        button(colour="primary")
+    with pytest.raises(ValueError, match="'huge'"):
+        button(size="huge")
+    with pytest.raises(ValueError, match="'huge'"):
+        twmerge.variants(BASE, AXES, defaults={"size": "huge"})